@@ -0,0 +1,325 @@
+"""
+Middleware for the Closet Management Application.
+Admission control admits requests only while their client has tokens left,
+both overall and for the route being called, and answers right away with 429
+or 503 and a Retry-After header instead of queueing when the API is saturated
+or shutting down. It also counts the requests in flight for draining.
+Metrics record the count, latency and response size of requests per route.
+Server timing reports where the time of each request went.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import math
+import time
+from typing import Optional
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.config.database import DatabaseBusyError
+from backend.config.rate_limit_settings import rate_limit_settings
+from backend.services.lifecycle_service import InFlightRequests, in_flight
+from backend.services.loop_monitor_service import loop_monitor
+from backend.services.metrics_service import (
+    http_request_duration,
+    http_requests,
+    http_requests_in_progress,
+    http_response_size,
+)
+from backend.services.rate_limit_service import TokenBucketLimiter
+from backend.services.timing_service import (
+    RequestTimings,
+    current_timings,
+    mark_endpoint_done,
+)
+from backend.services.token_service import verify_access_token
+
+logger = logging.getLogger(__name__)
+
+# Paths that are never rate limited
+EXEMPT_PATHS = {"/", "/health", "/metrics"}
+
+# Route label of requests that match no route, so unknown URLs cannot create
+# unbounded label sets
+UNMATCHED_ROUTE = "unmatched"
+
+# Seconds clients are asked to wait when the database is saturated
+DATABASE_BUSY_RETRY_AFTER = 1
+
+# Seconds clients are asked to wait when this process is shutting down
+SHUTDOWN_RETRY_AFTER = 1
+
+
+def _client_key(scope: Scope) -> str:
+    """Identify the caller by the user of a valid access token, else by IP."""
+    authorization = Headers(scope=scope).get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            return f"user:{verify_access_token(token).user_id}"
+        except ValueError:
+            pass
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def _route_key(scope: Scope) -> Optional[str]:
+    """Get the method and path template of the route a request will reach."""
+    app = scope.get("app")
+    for route in getattr(app, "routes", []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return f"{scope['method']} {route.path}"
+    return None
+
+
+class AdmissionControlMiddleware:
+    """Rejects requests over their client's rate limits or when the database is full."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        client_limiter: Optional[TokenBucketLimiter] = None,
+        route_limiter: Optional[TokenBucketLimiter] = None,
+        enabled: Optional[bool] = None,
+        requests: Optional[InFlightRequests] = None,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            client_limiter: Buckets per client, defaults to settings
+            route_limiter: Buckets per client and route, defaults to settings
+            enabled: Whether rate limits apply, defaults to settings
+            requests: Tracker of in-flight requests, defaults to the process one
+        """
+        self.app = app
+        self.requests = requests if requests is not None else in_flight
+        if client_limiter is None:
+            client_limiter = TokenBucketLimiter(
+                rate_limit_settings.client_rate,
+                rate_limit_settings.client_burst,
+                rate_limit_settings.max_tracked_buckets,
+            )
+        if route_limiter is None:
+            route_limiter = TokenBucketLimiter(
+                rate_limit_settings.route_rate,
+                rate_limit_settings.route_burst,
+                rate_limit_settings.max_tracked_buckets,
+            )
+        self.client_limiter = client_limiter
+        self.route_limiter = route_limiter
+        self.enabled = (
+            enabled if enabled is not None else rate_limit_settings.rate_limit_enabled
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not self.requests.start():
+            # Connection: close moves keep-alive clients to another instance
+            response = JSONResponse(
+                {"detail": "Server is shutting down, try again later"},
+                status_code=503,
+                headers={
+                    "Retry-After": str(SHUTDOWN_RETRY_AFTER),
+                    "Connection": "close",
+                },
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self._admit(scope, receive, send)
+        finally:
+            self.requests.finish()
+
+    async def _admit(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.enabled and scope["path"] not in EXEMPT_PATHS:
+            client = _client_key(scope)
+            route = _route_key(scope)
+            wait = 0.0
+            if route is not None:
+                wait = self.route_limiter.acquire((client, route))
+            if not wait:
+                wait = self.client_limiter.acquire(client)
+            if wait:
+                response = JSONResponse(
+                    {"detail": "Too many requests, try again later"},
+                    status_code=429,
+                    headers={"Retry-After": str(math.ceil(wait))},
+                )
+                await response(scope, receive, send)
+                return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except DatabaseBusyError as e:
+            if response_started:
+                raise
+            response = JSONResponse(
+                {"detail": str(e)},
+                status_code=503,
+                headers={"Retry-After": str(DATABASE_BUSY_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+
+
+class MetricsMiddleware:
+    """
+    Records request counts, latencies, sizes and requests in progress per route,
+    and the route of each request task for the event loop monitor.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route_key = _route_key(scope)
+        route = route_key.partition(" ")[2] if route_key else UNMATCHED_ROUTE
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        # Lets the event loop monitor name the route of a blocking request
+        task = asyncio.current_task()
+        loop_monitor.active_routes[task] = f"{method} {route}"
+
+        start = time.perf_counter()
+        http_requests_in_progress.inc(method, route)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            loop_monitor.active_routes.pop(task, None)
+            http_requests_in_progress.dec(method, route)
+            http_request_duration.observe(
+                method, route, value=time.perf_counter() - start
+            )
+            http_response_size.observe(method, route, value=response_size)
+            http_requests.inc(method, route, str(status_code))
+
+
+class TimedRoute(APIRoute):
+    """APIRoute that marks when its endpoint returns, so serialization is timed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        call = self.dependant.call
+
+        if inspect.iscoroutinefunction(call):
+
+            @functools.wraps(call)
+            async def timed_call(*call_args, **call_kwargs):
+                try:
+                    return await call(*call_args, **call_kwargs)
+                finally:
+                    mark_endpoint_done()
+
+        else:
+
+            @functools.wraps(call)
+            def timed_call(*call_args, **call_kwargs):
+                try:
+                    return call(*call_args, **call_kwargs)
+                finally:
+                    mark_endpoint_done()
+
+        self.dependant.call = timed_call
+
+
+class ServerTimingMiddleware:
+    """Adds a Server-Timing header and a timing log line to every request."""
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                status_code = message["status"]
+                if timings.endpoint_done is not None:
+                    timings.serialize_seconds = now - timings.endpoint_done
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing", timings.server_timing(now - timings.started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_timings.reset(token)
+            self._log(scope, status_code, timings)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, timings: RequestTimings) -> None:
+        """Log the timings of a finished request as key=value pairs and extras."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        route_key = _route_key(scope)
+        fields = {
+            "method": scope["method"],
+            "route": route_key.partition(" ")[2] if route_key else UNMATCHED_ROUTE,
+            "status": status_code,
+            "total_ms": round((time.perf_counter() - timings.started) * 1000, 2),
+            "db_ms": round(timings.sql_seconds * 1000, 2),
+            "db_queries": timings.sql_count,
+            "file_ms": round(timings.file_seconds * 1000, 2),
+            "file_bytes": timings.file_bytes,
+            "serialize_ms": round(timings.serialize_seconds * 1000, 2),
+        }
+        logger.info(
+            " ".join(f"{key}=%s" for key in fields),
+            *fields.values(),
+            extra={"timings": fields},
+        )
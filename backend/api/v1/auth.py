@@ -7,12 +7,28 @@ This file implements the POST /api/v1/auth/register and POST /api/v1/auth/login
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from backend.api.middleware import TimedRoute
 from backend.config.database import get_db
 from backend.schemas.auth import Token
 from backend.schemas.user import UserCreate, UserLogin, UserResponse
 from backend.services.auth_service import AuthService
+from backend.services.password_service import PasswordHasherBusyError
+from backend.services.token_service import create_access_token
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+
+# Password hashing is CPU heavy and runs on its own bounded pool, so these
+# routes are plain functions that wait for it from the request thread pool
+# instead of blocking the event loop.
+
+
+def _hasher_busy(error: PasswordHasherBusyError) -> HTTPException:
+    """Turn a full password hashing queue into a 503 response."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": "1"},
+    )
 
 
 def get_auth_service(db: Session = Depends(get_db)):
@@ -21,7 +37,7 @@ def get_auth_service(db: Session = Depends(get_db)):
 
 
 @router.post("/register", response_model=UserResponse)
-async def register_user(
+def register_user(
     user_data: UserCreate,
     service: AuthService = Depends(get_auth_service),
 ):
@@ -36,11 +52,14 @@ async def register_user(
         UserResponse: The created user with all fields
 
     Raises:
-        HTTPException: 400 if user already exists or invalid data
+        HTTPException: 400 if user already exists or invalid data,
+            503 if too many passwords are being hashed
     """
     try:
         user = service.register_user(user_data)
         return user
+    except PasswordHasherBusyError as e:
+        raise _hasher_busy(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -49,7 +68,7 @@ async def register_user(
 
 
 @router.post("/login", response_model=Token)
-async def login_user(
+def login_user(
     credentials: UserLogin,
     service: AuthService = Depends(get_auth_service),
 ):
@@ -64,9 +83,13 @@ async def login_user(
         Token: JWT token for authentication
 
     Raises:
-        HTTPException: 401 if authentication fails
+        HTTPException: 401 if authentication fails,
+            503 if too many passwords are being hashed
     """
-    user = service.authenticate_user(credentials)
+    try:
+        user = service.authenticate_user(credentials)
+    except PasswordHasherBusyError as e:
+        raise _hasher_busy(e)
 
     if not user:
         raise HTTPException(
@@ -75,9 +98,7 @@ async def login_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # In a complete implementation, we would generate a JWT token here
-    # For now, we're demonstrating the API structure
     return Token(
-        access_token="fake-jwt-token-for-demo",  # This would be generated in real implementation
+        access_token=create_access_token(user.id, user.email),
         token_type="bearer",
     )
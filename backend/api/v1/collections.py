@@ -0,0 +1,198 @@
+"""
+Collections API endpoints for the Closet Management Application.
+Handles CRUD operations for smart collections and opening their items.
+This file implements the GET /api/v1/collections, GET /api/v1/collections/{id},
+GET /api/v1/collections/{id}/items, POST /api/v1/collections,
+PUT /api/v1/collections/{id}, and DELETE /api/v1/collections/{id} endpoints.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from backend.api.middleware import TimedRoute
+from backend.api.v1.dependencies import get_user_db
+from backend.api.v1.security import get_current_user
+from backend.schemas.auth import TokenData
+from backend.schemas.clothing_item import ClothingItem
+from backend.schemas.collection import Collection, CollectionCreate
+from backend.services.collection_service import CollectionService
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def get_collection_service(db: Session = Depends(get_user_db)):
+    """Dependency to get CollectionService instance."""
+    return CollectionService(db)
+
+
+@router.get("/", response_model=List[Collection])
+async def get_collections(
+    current_user: TokenData = Depends(get_current_user),
+    service: CollectionService = Depends(get_collection_service),
+):
+    """
+    Get all collections for a user.
+
+    Args:
+        current_user: The authenticated user
+        service: CollectionService instance
+
+    Returns:
+        List of collections owned by the user
+    """
+    return service.get_all_collections(current_user.user_id)
+
+
+@router.get("/{collection_id}", response_model=Collection)
+async def get_collection(
+    collection_id: int,
+    current_user: TokenData = Depends(get_current_user),
+    service: CollectionService = Depends(get_collection_service),
+):
+    """
+    Get a specific collection by ID.
+
+    Args:
+        collection_id: ID of the collection to retrieve
+        current_user: The authenticated user
+        service: CollectionService instance
+
+    Returns:
+        The collection if found and owned by user
+
+    Raises:
+        HTTPException: 404 if collection not found or not owned by user
+    """
+    collection = service.get_collection(collection_id, current_user.user_id)
+    if not collection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found or not owned by user",
+        )
+    return collection
+
+
+@router.get("/{collection_id}/items", response_model=List[ClothingItem])
+async def get_collection_items(
+    collection_id: int,
+    current_user: TokenData = Depends(get_current_user),
+    service: CollectionService = Depends(get_collection_service),
+):
+    """
+    Get the clothing items in a collection.
+
+    Args:
+        collection_id: ID of the collection to open
+        current_user: The authenticated user
+        service: CollectionService instance
+
+    Returns:
+        List of clothing items that match the collection rules
+
+    Raises:
+        HTTPException: 404 if collection not found or not owned by user
+    """
+    items = service.get_collection_items(collection_id, current_user.user_id)
+    if items is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found or not owned by user",
+        )
+    return items
+
+
+@router.post("/", response_model=Collection)
+async def create_collection(
+    collection_data: CollectionCreate,
+    current_user: TokenData = Depends(get_current_user),
+    service: CollectionService = Depends(get_collection_service),
+):
+    """
+    Create a new collection.
+
+    Args:
+        collection_data: Data for creating the collection
+        current_user: The authenticated user
+        service: CollectionService instance
+
+    Returns:
+        The created collection
+
+    Raises:
+        HTTPException: 400 if a rule value does not fit its field
+    """
+    try:
+        return service.create_collection(collection_data, current_user.user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.put("/{collection_id}", response_model=Collection)
+async def update_collection(
+    collection_id: int,
+    collection_data: CollectionCreate,
+    current_user: TokenData = Depends(get_current_user),
+    service: CollectionService = Depends(get_collection_service),
+):
+    """
+    Update a collection.
+
+    Args:
+        collection_id: ID of the collection to update
+        collection_data: Data to update the collection with
+        current_user: The authenticated user
+        service: CollectionService instance
+
+    Returns:
+        The updated collection if found and owned by user
+
+    Raises:
+        HTTPException: 400 if a rule value does not fit its field
+        HTTPException: 404 if collection not found or not owned by user
+    """
+    try:
+        collection = service.update_collection(
+            collection_id, collection_data, current_user.user_id
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if not collection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found or not owned by user",
+        )
+    return collection
+
+
+@router.delete("/{collection_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_collection(
+    collection_id: int,
+    current_user: TokenData = Depends(get_current_user),
+    service: CollectionService = Depends(get_collection_service),
+):
+    """
+    Delete a collection.
+
+    Args:
+        collection_id: ID of the collection to delete
+        current_user: The authenticated user
+        service: CollectionService instance
+
+    Raises:
+        HTTPException: 404 if collection not found or not owned by user
+    """
+    success = service.delete_collection(collection_id, current_user.user_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found or not owned by user",
+        )
@@ -0,0 +1,33 @@
+"""
+Database dependencies for routes that act on behalf of a user.
+The session of such a request is bound to the shard holding the user's rows,
+so services work on one user's data without knowing about shards.
+"""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from backend.api.v1.security import get_current_user
+from backend.config.database import get_db
+from backend.config.sharding import shard_map
+from backend.schemas.auth import TokenData
+
+
+def get_user_db(
+    current_user: TokenData = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Session:
+    """
+    Dependency to get a database session on the current user's shard.
+
+    Args:
+        current_user: The authenticated user
+        db: Database session from get_db
+
+    Returns:
+        Session: The session, bound to the user's shard when sharding is on
+
+    Raises:
+        UserMovingError: If the user's rows are moving to another shard
+    """
+    return shard_map.route(db, current_user.user_id)
@@ -2,43 +2,65 @@
 Items API endpoints for the Closet Management Application.
 Handles CRUD operations for clothing items.
 This file implements the GET /api/v1/items, GET /api/v1/items/{id},
-POST /api/v1/items, PUT /api/v1/items/{id}, and DELETE /api/v1/items/{id} endpoints.
+POST /api/v1/items, PUT /api/v1/items/{id}, and DELETE /api/v1/items/{id} endpoints,
+plus GET /api/v1/items/matches/color for finding items by color and
+GET /api/v1/items/duplicates for finding near-duplicate images.
 """
 
 import base64
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 
-from backend.config.database import get_db
-from backend.schemas.clothing_item import ClothingItem, ClothingItemCreate
+from backend.api.middleware import TimedRoute
+from backend.api.v1.dependencies import get_user_db
+from backend.api.v1.security import get_current_user
+from backend.schemas.auth import TokenData
+from backend.schemas.clothing_item import (
+    ClothingItem,
+    ClothingItemCreate,
+    ColorMatch,
+    DuplicateGroup,
+)
+from backend.services.color_service import ColorService
+from backend.services.duplicate_service import DuplicateService
 from backend.services.item_service import ItemService
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
-def get_item_service(db: Session = Depends(get_db)):
+def get_item_service(db: Session = Depends(get_user_db)):
     """Dependency to get ItemService instance."""
     return ItemService(db)
 
 
+def get_color_service(db: Session = Depends(get_user_db)):
+    """Dependency to get ColorService instance."""
+    return ColorService(db)
+
+
+def get_duplicate_service(db: Session = Depends(get_user_db)):
+    """Dependency to get DuplicateService instance."""
+    return DuplicateService(db)
+
+
 @router.get("/", response_model=List[ClothingItem])
 async def get_items(
-    user_id: int,
+    current_user: TokenData = Depends(get_current_user),
     service: ItemService = Depends(get_item_service),
 ):
     """
     Get all clothing items for a user.
 
     Args:
-        user_id: ID of the user requesting items
+        current_user: The authenticated user
         service: ItemService instance
 
     Returns:
         List of clothing items owned by the user
     """
-    items = service.get_all_items(user_id)
+    items = service.get_all_items(current_user.user_id)
     if not items:
         raise HTTPException(
             status_code=status.HTTP_201_CREATED,
@@ -47,10 +69,71 @@ async def get_items(
     return items
 
 
+@router.get("/matches/color", response_model=List[ColorMatch])
+async def get_color_matches(
+    color: str,
+    scheme: Literal["similar", "complementary"] = "similar",
+    limit: int = Query(20, ge=1, le=200),
+    max_delta_e: Optional[float] = Query(None, ge=0),
+    current_user: TokenData = Depends(get_current_user),
+    service: ColorService = Depends(get_color_service),
+):
+    """
+    Find clothing items that go with a color.
+
+    Args:
+        color: Hex color to match, e.g. "#1f3a5c"
+        scheme: "similar" for close colors, "complementary" for opposite hues
+        limit: Maximum number of items to return
+        max_delta_e: Optional maximum CIEDE2000 distance
+        current_user: The authenticated user
+        service: ColorService instance
+
+    Returns:
+        Items ordered from best to worst color match
+
+    Raises:
+        HTTPException: 400 if the color is not a valid hex color
+    """
+    try:
+        return service.find_matching_items(
+            current_user.user_id,
+            color,
+            scheme=scheme,
+            limit=limit,
+            max_delta_e=max_delta_e,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/duplicates", response_model=List[DuplicateGroup])
+async def get_duplicates(
+    current_user: TokenData = Depends(get_current_user),
+    max_distance: Optional[int] = Query(None, ge=0, le=32),
+    service: DuplicateService = Depends(get_duplicate_service),
+):
+    """
+    Find groups of clothing items whose images are near-duplicates.
+
+    Args:
+        current_user: The authenticated user
+        max_distance: Optional largest image hash distance counted as a duplicate
+        service: DuplicateService instance
+
+    Returns:
+        Groups of item IDs that look like the same photo
+    """
+    return service.find_duplicates(current_user.user_id, max_distance)
+
+
 @router.get("/{item_id}", response_model=ClothingItem)
 async def get_item(
     item_id: int,
-    user_id: int,
+    current_user: TokenData = Depends(get_current_user),
     service: ItemService = Depends(get_item_service),
 ):
     """
@@ -58,7 +141,7 @@ async def get_item(
 
     Args:
         item_id: ID of the clothing item to retrieve
-        user_id: ID of the user requesting the item
+        current_user: The authenticated user
         service: ItemService instance
 
     Returns:
@@ -67,7 +150,7 @@ async def get_item(
     Raises:
         HTTPException: 404 if item not found or not owned by user
     """
-    item = service.get_item(item_id, user_id)
+    item = service.get_item(item_id, current_user.user_id)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,7 +162,7 @@ async def get_item(
 @router.post("/", response_model=ClothingItem)
 async def create_item(
     item_data: ClothingItemCreate,
-    user_id: int,
+    current_user: TokenData = Depends(get_current_user),
     service: ItemService = Depends(get_item_service),
 ):
     """
@@ -87,13 +170,13 @@ async def create_item(
 
     Args:
         item_data: Data for creating the clothing item
-        user_id: ID of the user creating the item
+        current_user: The authenticated user
         service: ItemService instance
 
     Returns:
         The created clothing item with all fields
     """
-    item = service.create_item(item_data, user_id)
+    item = service.create_item(item_data, current_user.user_id)
     return item
 
 
@@ -101,7 +184,7 @@ async def create_item(
 async def update_item(
     item_id: int,
     item_data: ClothingItemCreate,
-    user_id: int,
+    current_user: TokenData = Depends(get_current_user),
     service: ItemService = Depends(get_item_service),
 ):
     """
@@ -110,7 +193,7 @@ async def update_item(
     Args:
         item_id: ID of the clothing item to update
         item_data: Data to update the clothing item with
-        user_id: ID of the user requesting the update
+        current_user: The authenticated user
         service: ItemService instance
         image_file: Optional image file to upload
 
@@ -121,7 +204,7 @@ async def update_item(
         HTTPException: 404 if item not found or not owned by user
     """
 
-    item = service.update_item(item_id, item_data, user_id)
+    item = service.update_item(item_id, item_data, current_user.user_id)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -133,7 +216,7 @@ async def update_item(
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item(
     item_id: int,
-    user_id: int,
+    current_user: TokenData = Depends(get_current_user),
     service: ItemService = Depends(get_item_service),
 ):
     """
@@ -141,13 +224,13 @@ async def delete_item(
 
     Args:
         item_id: ID of the clothing item to delete
-        user_id: ID of the user requesting the deletion
+        current_user: The authenticated user
         service: ItemService instance
 
     Raises:
         HTTPException: 404 if item not found or not owned by user
     """
-    success = service.delete_item(item_id, user_id)
+    success = service.delete_item(item_id, current_user.user_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,51 @@
+"""
+Jobs API endpoints for the Closet Management Application.
+Reports the status of background jobs.
+This file implements the GET /api/v1/jobs/{id} endpoint.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from backend.api.middleware import TimedRoute
+from backend.api.v1.dependencies import get_user_db
+from backend.api.v1.security import get_current_user
+from backend.schemas.auth import TokenData
+from backend.schemas.job import Job
+from backend.services.job_service import JobService
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def get_job_service(db: Session = Depends(get_user_db)):
+    """Dependency to get JobService instance."""
+    return JobService(db)
+
+
+@router.get("/{job_id}", response_model=Job)
+async def get_job(
+    job_id: int,
+    current_user: TokenData = Depends(get_current_user),
+    service: JobService = Depends(get_job_service),
+):
+    """
+    Get the status of a background job.
+
+    Args:
+        job_id: ID of the job to retrieve
+        current_user: The authenticated user
+        service: JobService instance
+
+    Returns:
+        The job if found and owned by user
+
+    Raises:
+        HTTPException: 404 if job not found or not owned by user
+    """
+    job = service.get_job(job_id, current_user.user_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or not owned by user",
+        )
+    return job
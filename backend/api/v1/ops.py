@@ -0,0 +1,162 @@
+"""
+Ops API endpoints for the Closet Management Application.
+Reports diagnostics for operators; every endpoint requires the ops token.
+This file implements the GET /api/v1/ops/pool, POST /api/v1/ops/pool/reset,
+POST /api/v1/ops/profile and POST /api/v1/ops/uploads/gc endpoints.
+"""
+
+from typing import FrozenSet, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.orm import Session
+
+from backend.api.middleware import TimedRoute
+from backend.api.v1.security import require_ops_token
+from backend.config.database import get_db, get_engine
+from backend.config.ops_settings import ops_settings
+from backend.config.pool_metrics import pool_metrics
+from backend.config.settings import settings
+from backend.schemas.job import Job
+from backend.schemas.ops import PoolStats
+from backend.services.job_service import JobService
+from backend.services.profiler_service import ProfilerBusyError, profile_process
+from backend.services.upload_service import ORPHAN_MIN_AGE_SECONDS
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(require_ops_token)])
+
+
+@router.get("/pool", response_model=PoolStats)
+async def get_pool_stats():
+    """
+    Get the configuration, usage and history of the database connection pool.
+
+    Returns:
+        PoolStats: Pool settings, current usage and recorded checkout metrics
+    """
+    return PoolStats(
+        max_overflow=settings.postgresql_max_overflow,
+        pool_timeout=settings.postgresql_pool_timeout,
+        pool_recycle=settings.postgresql_pool_recycle,
+        pool_pre_ping=settings.postgresql_pool_pre_ping,
+        **pool_metrics.snapshot(get_engine().pool),
+    )
+
+
+@router.post("/pool/reset", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_pool_stats():
+    """
+    Start recording pool metrics afresh, e.g. after changing pool settings.
+    """
+    pool_metrics.reset()
+
+
+def _endpoint_code(app, route: str) -> FrozenSet:
+    """
+    Get the code of the endpoint that handles a route.
+
+    Args:
+        app: The application whose routes to search
+        route: Method and path template, e.g. "GET /api/v1/items/"
+
+    Returns:
+        The code object of the endpoint function
+
+    Raises:
+        ValueError: If no route matches
+    """
+    method, _, path = route.partition(" ")
+    for candidate in app.routes:
+        if (
+            isinstance(candidate, APIRoute)
+            and candidate.path == path
+            and method.upper() in candidate.methods
+        ):
+            return frozenset({candidate.endpoint.__code__})
+    raise ValueError(f"No route matches '{route}'")
+
+
+@router.post("/profile")
+async def profile(
+    request: Request,
+    seconds: float = Query(10.0, gt=0, description="Seconds to sample for"),
+    output: Literal["collapsed", "pstats"] = Query(
+        "collapsed", description="Collapsed stacks for flame graphs, or a pstats file"
+    ),
+    route: Optional[str] = Query(
+        None, description='Only sample one route, e.g. "GET /api/v1/items/"'
+    ),
+):
+    """
+    Sample the stacks of this API process while it serves real traffic.
+
+    Args:
+        request: The request, used to look up the route to profile
+        seconds: Seconds to sample for
+        output: Format of the result
+        route: Method and path template of the only route to sample
+
+    Returns:
+        Collapsed stacks as text, or a pstats file
+
+    Raises:
+        HTTPException: 400 if the duration is too long or the route unknown,
+            409 if another profile is running
+    """
+    if seconds > ops_settings.profile_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profiles are limited to {ops_settings.profile_max_seconds} seconds",
+        )
+
+    try:
+        only_through = _endpoint_code(request.app, route) if route else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    try:
+        # Sample from a worker thread so this request does not block the loop
+        profiler = await run_in_threadpool(
+            profile_process, seconds, ops_settings.profile_interval, only_through
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+
+    if output == "pstats":
+        return Response(
+            profiler.pstats(),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": 'attachment; filename="profile.pstats"'},
+        )
+    return PlainTextResponse(profiler.collapsed())
+
+
+@router.post("/uploads/gc", response_model=Job, status_code=status.HTTP_202_ACCEPTED)
+async def collect_orphaned_uploads(
+    min_age_seconds: int = Query(
+        ORPHAN_MIN_AGE_SECONDS,
+        ge=0,
+        description="Files younger than this are kept, as their upload may not have committed",
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a job that deletes upload files no clothing item refers to. Run it
+    periodically, e.g. from cron; a worker does the deleting.
+
+    Args:
+        min_age_seconds: Files younger than this are kept
+        db: Database session
+
+    Returns:
+        The queued job
+    """
+    return JobService(db).enqueue("uploads.gc", {"min_age_seconds": min_age_seconds})
@@ -0,0 +1,226 @@
+"""
+Outfits API endpoints for the Closet Management Application.
+Handles CRUD operations for outfits, wear tracking and outfit recommendations.
+This file implements the GET /api/v1/outfits, GET /api/v1/outfits/recommendations,
+GET /api/v1/outfits/{id}, POST /api/v1/outfits, POST /api/v1/outfits/{id}/wear,
+PUT /api/v1/outfits/{id}, and DELETE /api/v1/outfits/{id} endpoints.
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from backend.api.middleware import TimedRoute
+from backend.api.v1.dependencies import get_user_db
+from backend.api.v1.security import get_current_user
+from backend.schemas.auth import TokenData
+from backend.schemas.clothing_item import ItemSeason
+from backend.schemas.outfit import Outfit, OutfitCreate, OutfitRecommendation
+from backend.services.outfit_service import OutfitService
+from backend.services.recommendation_service import RecommendationService
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def get_outfit_service(db: Session = Depends(get_user_db)):
+    """Dependency to get OutfitService instance."""
+    return OutfitService(db)
+
+
+def get_recommendation_service(db: Session = Depends(get_user_db)):
+    """Dependency to get RecommendationService instance."""
+    return RecommendationService(db)
+
+
+@router.get("/", response_model=List[Outfit])
+async def get_outfits(
+    current_user: TokenData = Depends(get_current_user),
+    service: OutfitService = Depends(get_outfit_service),
+):
+    """
+    Get all outfits for a user.
+
+    Args:
+        current_user: The authenticated user
+        service: OutfitService instance
+
+    Returns:
+        List of outfits owned by the user
+    """
+    return service.get_all_outfits(current_user.user_id)
+
+
+@router.get("/recommendations", response_model=List[OutfitRecommendation])
+async def get_recommendations(
+    current_user: TokenData = Depends(get_current_user),
+    limit: int = Query(10, ge=1, le=100),
+    season: Optional[ItemSeason] = None,
+    outerwear: bool = False,
+    service: RecommendationService = Depends(get_recommendation_service),
+):
+    """
+    Recommend outfits from a user's closet.
+
+    Args:
+        current_user: The authenticated user
+        limit: Maximum number of outfits to return
+        season: Optional season every recommended item must be worn in
+        outerwear: Whether outfits include an outerwear item
+        service: RecommendationService instance
+
+    Returns:
+        Recommended outfits ordered from best to worst
+    """
+    return service.recommend_outfits(current_user.user_id, limit, season, outerwear)
+
+
+@router.get("/{outfit_id}", response_model=Outfit)
+async def get_outfit(
+    outfit_id: int,
+    current_user: TokenData = Depends(get_current_user),
+    service: OutfitService = Depends(get_outfit_service),
+):
+    """
+    Get a specific outfit by ID.
+
+    Args:
+        outfit_id: ID of the outfit to retrieve
+        current_user: The authenticated user
+        service: OutfitService instance
+
+    Returns:
+        The outfit if found and owned by user
+
+    Raises:
+        HTTPException: 404 if outfit not found or not owned by user
+    """
+    outfit = service.get_outfit(outfit_id, current_user.user_id)
+    if not outfit:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Outfit not found or not owned by user",
+        )
+    return outfit
+
+
+@router.post("/", response_model=Outfit)
+async def create_outfit(
+    outfit_data: OutfitCreate,
+    current_user: TokenData = Depends(get_current_user),
+    service: OutfitService = Depends(get_outfit_service),
+):
+    """
+    Create a new outfit.
+
+    Args:
+        outfit_data: Data for creating the outfit
+        current_user: The authenticated user
+        service: OutfitService instance
+
+    Returns:
+        The created outfit with its ordered items
+
+    Raises:
+        HTTPException: 400 if a clothing item is not owned by the user
+    """
+    try:
+        return service.create_outfit(outfit_data, current_user.user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.post("/{outfit_id}/wear", response_model=Outfit)
+async def wear_outfit(
+    outfit_id: int,
+    current_user: TokenData = Depends(get_current_user),
+    service: OutfitService = Depends(get_outfit_service),
+):
+    """
+    Record that an outfit was worn today.
+
+    Args:
+        outfit_id: ID of the outfit that was worn
+        current_user: The authenticated user
+        service: OutfitService instance
+
+    Returns:
+        The outfit with the updated wear history of its items
+
+    Raises:
+        HTTPException: 404 if outfit not found or not owned by user
+    """
+    outfit = service.wear_outfit(outfit_id, current_user.user_id)
+    if not outfit:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Outfit not found or not owned by user",
+        )
+    return outfit
+
+
+@router.put("/{outfit_id}", response_model=Outfit)
+async def update_outfit(
+    outfit_id: int,
+    outfit_data: OutfitCreate,
+    current_user: TokenData = Depends(get_current_user),
+    service: OutfitService = Depends(get_outfit_service),
+):
+    """
+    Update an outfit.
+
+    Args:
+        outfit_id: ID of the outfit to update
+        outfit_data: Data to update the outfit with
+        current_user: The authenticated user
+        service: OutfitService instance
+
+    Returns:
+        The updated outfit if found and owned by user
+
+    Raises:
+        HTTPException: 400 if a clothing item is not owned by the user
+        HTTPException: 404 if outfit not found or not owned by user
+    """
+    try:
+        outfit = service.update_outfit(outfit_id, outfit_data, current_user.user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if not outfit:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Outfit not found or not owned by user",
+        )
+    return outfit
+
+
+@router.delete("/{outfit_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_outfit(
+    outfit_id: int,
+    current_user: TokenData = Depends(get_current_user),
+    service: OutfitService = Depends(get_outfit_service),
+):
+    """
+    Delete an outfit.
+
+    Args:
+        outfit_id: ID of the outfit to delete
+        current_user: The authenticated user
+        service: OutfitService instance
+
+    Raises:
+        HTTPException: 404 if outfit not found or not owned by user
+    """
+    success = service.delete_outfit(outfit_id, current_user.user_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Outfit not found or not owned by user",
+        )
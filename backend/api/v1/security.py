@@ -0,0 +1,82 @@
+"""
+Authentication dependencies for the Closet Management Application.
+Routes that act on behalf of a user take the user from a verified bearer token
+through the get_current_user dependency. Operator-only routes require the
+configured ops token through the require_ops_token dependency.
+"""
+
+import hmac
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Security, status
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
+
+from backend.config.ops_settings import ops_settings
+from backend.schemas.auth import TokenData
+from backend.services.token_service import verify_access_token
+
+# Reads "Authorization: Bearer <token>"; missing credentials are reported below
+bearer_scheme = HTTPBearer(auto_error=False)
+
+# Reads "X-Ops-Token: <token>" for operator-only routes
+ops_token_scheme = APIKeyHeader(name="X-Ops-Token", auto_error=False)
+
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> TokenData:
+    """
+    Dependency to get the user the request's access token was issued for.
+    Verification is stateless and does not query the database.
+
+    Args:
+        credentials: Bearer credentials from the Authorization header
+
+    Returns:
+        TokenData: ID and email of the authenticated user
+
+    Raises:
+        HTTPException: 401 if the token is missing, invalid or expired
+    """
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        return verify_access_token(credentials.credentials)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def require_ops_token(
+    ops_token: Optional[str] = Security(ops_token_scheme),
+) -> None:
+    """
+    Dependency that admits only operators sending the configured ops token.
+
+    Args:
+        ops_token: Token from the X-Ops-Token header
+
+    Raises:
+        HTTPException: 403 if ops endpoints are disabled or the token is wrong
+    """
+    if not ops_settings.ops_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Ops endpoints are disabled",
+        )
+
+    if ops_token is None or not hmac.compare_digest(
+        ops_token.encode(), ops_settings.ops_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid ops token",
+        )
@@ -0,0 +1,394 @@
+"""
+Open-loop load test of a running API with mixed traffic.
+
+Start the server, then run from the project root:
+    uvicorn backend.main:app --workers 4
+    python -m backend.benchmarks.load_test --url http://localhost:8000 \
+        --rate 200 --duration 60 --warmup 10 --output load-test.json
+
+Requests arrive at --rate per second with exponential gaps, whether or not
+earlier ones finished, so a slow server builds a backlog as real traffic
+would. Latency is measured from the moment a request was due to be sent,
+which keeps a stalled client from hiding server delays. Requests due during
+--warmup are sent but not reported. Arrivals while --max-in-flight requests
+are outstanding are dropped and counted.
+
+The test registers --clients users with a few items each. Admission control
+answers with 429 once the rate limits are reached; raise or disable them
+(RATE_LIMIT_ENABLED=false) to measure raw capacity.
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import json
+import random
+import secrets
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+import httpx
+from PIL import Image
+
+# Share of requests per operation in each scenario
+SCENARIOS = {
+    # Mostly browsing, some edits with photos, few deletes and logins
+    "mixed": {
+        "list": 40,
+        "get": 40,
+        "create": 10,
+        "update": 5,
+        "delete": 3,
+        "login": 2,
+    },
+    "read-only": {"list": 50, "get": 50},
+    "write-heavy": {"list": 20, "get": 20, "create": 35, "update": 20, "delete": 5},
+    "login": {"login": 100},
+}
+
+PASSWORD = "load-test-password"
+ITEMS_PER_CLIENT = 5
+
+
+@dataclass
+class Client:
+    """A registered user the load test acts as."""
+
+    user_id: int
+    email: str
+    headers: Dict[str, str]
+    item_ids: List[int] = field(default_factory=list)
+
+
+def make_image(num_bytes: int, seed: int) -> Tuple[str, str]:
+    """Make a noise PNG of about a size, as (file name, base64 data)."""
+    side = max(int((num_bytes / 3) ** 0.5), 1)
+    pixels = random.Random(seed).randbytes(side * side * 3)
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", (side, side), pixels).save(buffer, format="PNG")
+    return f"load-{seed}.png", base64.b64encode(buffer.getvalue()).decode()
+
+
+class LoadTest:
+    """Sends the requests of a scenario and records how they went."""
+
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        clients: List[Client],
+        images: List[Tuple[str, str]],
+        seed: int = 0,
+    ):
+        """
+        Initialize the load test.
+
+        Args:
+            http: Client for the API under test
+            clients: Users to spread the requests over
+            images: (file name, base64 data) pairs sent with creates and updates
+            seed: Seed for choosing operations, users and arrival times
+        """
+        self.http = http
+        self.clients = clients
+        self.images = images
+        self.rng = random.Random(seed)
+        # Latencies in seconds and status codes per route, 0 for failures
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.dropped = 0
+        self.operations: Dict[
+            str, Tuple[str, Callable[[Client], Awaitable[httpx.Response]]]
+        ] = {
+            "list": ("GET /api/v1/items/", self._list),
+            "get": ("GET /api/v1/items/{item_id}", self._get),
+            "create": ("POST /api/v1/items/", self._create),
+            "update": ("PUT /api/v1/items/{item_id}", self._update),
+            "delete": ("DELETE /api/v1/items/{item_id}", self._delete),
+            "login": ("POST /api/v1/auth/login", self._login),
+        }
+
+    def _item_body(self, client: Client) -> dict:
+        image_name, image_data = self.rng.choice(self.images)
+        return {
+            "name": "Load Test Shirt",
+            "category": "Tops",
+            "color": "blue",
+            "user_id": client.user_id,
+            "image_name": image_name,
+            "image_data": image_data,
+        }
+
+    def _some_item(self, client: Client) -> int:
+        # An unknown item when the client has none, answered with 404
+        return self.rng.choice(client.item_ids) if client.item_ids else 0
+
+    async def _list(self, client: Client) -> httpx.Response:
+        return await self.http.get("/api/v1/items/", headers=client.headers)
+
+    async def _get(self, client: Client) -> httpx.Response:
+        item_id = self._some_item(client)
+        return await self.http.get(f"/api/v1/items/{item_id}", headers=client.headers)
+
+    async def _create(self, client: Client) -> httpx.Response:
+        response = await self.http.post(
+            "/api/v1/items/", json=self._item_body(client), headers=client.headers
+        )
+        if response.status_code == 200:
+            client.item_ids.append(response.json()["id"])
+        return response
+
+    async def _update(self, client: Client) -> httpx.Response:
+        item_id = self._some_item(client)
+        return await self.http.put(
+            f"/api/v1/items/{item_id}",
+            json=self._item_body(client),
+            headers=client.headers,
+        )
+
+    async def _delete(self, client: Client) -> httpx.Response:
+        if len(client.item_ids) > 1:
+            item_id = client.item_ids.pop(self.rng.randrange(len(client.item_ids)))
+        else:
+            item_id = 0
+        return await self.http.delete(
+            f"/api/v1/items/{item_id}", headers=client.headers
+        )
+
+    async def _login(self, client: Client) -> httpx.Response:
+        return await self.http.post(
+            "/api/v1/auth/login", json={"email": client.email, "password": PASSWORD}
+        )
+
+    async def _send(self, operation: str, due: float, recorded: bool) -> None:
+        route, send = self.operations[operation]
+        client = self.rng.choice(self.clients)
+        try:
+            status = (await send(client)).status_code
+        except httpx.HTTPError:
+            status = 0
+        if recorded:
+            loop = asyncio.get_running_loop()
+            self.latencies[route].append(loop.time() - due)
+            self.statuses[route][status] += 1
+
+    async def run(
+        self,
+        mix: Dict[str, int],
+        rate: float,
+        duration: float,
+        warmup: float,
+        max_in_flight: int,
+    ) -> None:
+        """
+        Send requests at a rate, open loop, and wait for the last to finish.
+
+        Args:
+            mix: Share of requests per operation
+            rate: Requests per second
+            duration: Seconds of reported traffic
+            warmup: Seconds of traffic before it, not reported
+            max_in_flight: Outstanding requests beyond which arrivals are dropped
+        """
+        operations = list(mix)
+        weights = list(mix.values())
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        recorded_from = start + warmup
+        end = recorded_from + duration
+        in_flight = set()
+
+        due = start
+        while due < end:
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            recorded = due >= recorded_from
+            if len(in_flight) >= max_in_flight:
+                self.dropped += recorded
+            else:
+                operation = self.rng.choices(operations, weights)[0]
+                task = asyncio.create_task(self._send(operation, due, recorded))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            due += self.rng.expovariate(rate)
+
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    def report(self, duration: float) -> dict:
+        """
+        Summarize the recorded requests.
+
+        Args:
+            duration: Seconds of reported traffic
+
+        Returns:
+            Per-route and overall counts, throughput, error rate and latency
+            percentiles in milliseconds
+        """
+        routes = {
+            route: _summarize(latencies, self.statuses[route], duration)
+            for route, latencies in sorted(self.latencies.items())
+        }
+        all_statuses = sum(self.statuses.values(), Counter())
+        all_latencies = [x for latencies in self.latencies.values() for x in latencies]
+        return {
+            "routes": routes,
+            "total": _summarize(all_latencies, all_statuses, duration),
+            "dropped": self.dropped,
+        }
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def _summarize(latencies: List[float], statuses: Counter, duration: float) -> dict:
+    ordered = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if not 0 < status < 400)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "error_rate": errors / len(ordered) if ordered else 0.0,
+        "throughput": len(ordered) / duration,
+        "p50_ms": _percentile(ordered, 0.50) * 1000,
+        "p95_ms": _percentile(ordered, 0.95) * 1000,
+        "p99_ms": _percentile(ordered, 0.99) * 1000,
+        "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+def format_table(report: dict) -> str:
+    """Format a report as a fixed-width table, one row per route."""
+    header = (
+        f"{'route':<34} {'reqs':>7} {'req/s':>8} {'errors':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    rows = list(report["routes"].items()) + [("total", report["total"])]
+    for route, stats in rows:
+        lines.append(
+            f"{route:<34} {stats['requests']:>7} {stats['throughput']:>8.1f} "
+            f"{stats['error_rate']:>7.1%} {stats['p50_ms']:>8.1f} "
+            f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>8.1f}"
+        )
+    lines.append(f"dropped arrivals: {report['dropped']}")
+    return "\n".join(lines)
+
+
+async def register_clients(http: httpx.AsyncClient, count: int) -> List[Client]:
+    """
+    Register users for the load test, log them in and give them items.
+
+    Args:
+        http: Client for the API under test
+        count: Number of users
+
+    Returns:
+        The registered users
+    """
+    run_id = secrets.token_hex(4)
+    clients = []
+    for index in range(count):
+        email = f"load-{run_id}-{index}@example.com"
+        response = await http.post(
+            "/api/v1/auth/register",
+            json={"email": email, "password": PASSWORD, "full_name": "Load Test"},
+        )
+        response.raise_for_status()
+        user_id = response.json()["id"]
+        response = await http.post(
+            "/api/v1/auth/login", json={"email": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        client = Client(
+            user_id,
+            email,
+            {"Authorization": f"Bearer {response.json()['access_token']}"},
+        )
+        for item_index in range(ITEMS_PER_CLIENT):
+            response = await http.post(
+                "/api/v1/items/",
+                json={"name": f"Seed Item {item_index}", "user_id": user_id},
+                headers=client.headers,
+            )
+            response.raise_for_status()
+            client.item_ids.append(response.json()["id"])
+        clients.append(client)
+    return clients
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse an operation mix such as "list=80,create=20"."""
+    mix = {}
+    for part in value.split(","):
+        operation, _, weight = part.partition("=")
+        mix[operation.strip()] = int(weight)
+    return mix
+
+
+async def main_async(args) -> dict:
+    """Set up the clients, run the load and build the report."""
+    mix = parse_mix(args.mix) if args.mix else SCENARIOS[args.scenario]
+    limits = httpx.Limits(max_connections=args.max_in_flight)
+    async with httpx.AsyncClient(
+        base_url=args.url, timeout=args.timeout, limits=limits
+    ) as http:
+        clients = await register_clients(http, args.clients)
+        images = [make_image(args.image_kb * 1024, seed) for seed in range(8)]
+        load_test = LoadTest(http, clients, images, args.seed)
+        await load_test.run(
+            mix, args.rate, args.duration, args.warmup, args.max_in_flight
+        )
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "url": args.url,
+        "mix": mix,
+        "rate": args.rate,
+        "duration": args.duration,
+        "warmup": args.warmup,
+        **load_test.report(args.duration),
+    }
+
+
+def main():
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--scenario", choices=list(SCENARIOS), default="mixed")
+    parser.add_argument(
+        "--mix", help='operation shares overriding the scenario, e.g. "list=80,get=20"'
+    )
+    parser.add_argument("--rate", type=float, default=50, help="requests per second")
+    parser.add_argument("--duration", type=float, default=30, help="seconds reported")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds unreported")
+    parser.add_argument("--max-in-flight", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=30, help="seconds per request")
+    parser.add_argument("--clients", type=int, default=20, help="users to act as")
+    parser.add_argument("--image-kb", type=int, default=64, help="uploaded image size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write the report to as JSON")
+    args = parser.parse_args()
+
+    unknown = set(parse_mix(args.mix) if args.mix else ()) - set(SCENARIOS["mixed"])
+    if unknown:
+        parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(main_async(args))
+    print(format_table(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
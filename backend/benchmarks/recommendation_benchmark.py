@@ -0,0 +1,125 @@
+"""
+Benchmark for outfit recommendations on a synthetic closet.
+
+Run from the project root:
+    python -m backend.benchmarks.recommendation_benchmark --items 2000
+
+NumPy is limited to one thread and the process to one CPU core where the
+platform allows it, so the timings reflect a single core.
+"""
+
+import os
+
+for _variable in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_variable, "1")
+
+import argparse  # noqa: E402
+import random  # noqa: E402
+import statistics  # noqa: E402
+import time  # noqa: E402
+from datetime import datetime, timedelta  # noqa: E402
+from typing import List  # noqa: E402
+
+import numpy as np  # noqa: E402
+
+from backend.services.color_service import PALETTE_SIZE, encode_palette  # noqa: E402
+from backend.services.recommendation_service import (  # noqa: E402
+    SEASON_BITS,
+    build_features,
+    rank_outfits,
+)
+
+# Category mix of a typical closet
+CATEGORY_WEIGHTS = {
+    "Tops": 35,
+    "Bottoms": 25,
+    "Shoes": 15,
+    "Outerwear": 10,
+    "Dresses": 8,
+    "Accessories": 7,
+}
+
+SEASONS = ["spring", "summer", "fall", "winter"]
+
+
+def make_closet_rows(item_count: int, seed: int = 0, now=None) -> List[tuple]:
+    """
+    Generate feature rows for a synthetic closet.
+
+    Args:
+        item_count: Number of items in the closet
+        seed: Seed for the random generator
+        now: Reference time for the wear history, defaults to now
+
+    Returns:
+        Rows in the layout expected by build_features
+    """
+    now = now or datetime.now()
+    rng = random.Random(seed)
+    categories = list(CATEGORY_WEIGHTS)
+    weights = list(CATEGORY_WEIGHTS.values())
+
+    rows = []
+    for item_id in range(1, item_count + 1):
+        palette = np.array(
+            [
+                [rng.uniform(0, 100), rng.uniform(-60, 60), rng.uniform(-60, 60), 0]
+                for _ in range(PALETTE_SIZE)
+            ]
+        )
+        palette[:, 3] = sorted(
+            (rng.random() for _ in range(PALETTE_SIZE)), reverse=True
+        )
+        palette[:, 3] /= palette[:, 3].sum()
+
+        worn = rng.random() < 0.7
+        rows.append(
+            (
+                item_id,
+                rng.choices(categories, weights)[0],
+                encode_palette(palette) if rng.random() < 0.9 else None,
+                rng.sample(SEASONS, rng.randint(0, 3)),
+                rng.randint(1, 50) if worn else 0,
+                now - timedelta(days=rng.uniform(0, 90)) if worn else None,
+            )
+        )
+    return rows
+
+
+def main():
+    """Time feature building and ranking on a synthetic closet."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=2000, help="closet size")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs")
+    parser.add_argument("--limit", type=int, default=10, help="outfits returned")
+    parser.add_argument("--season", choices=list(SEASON_BITS), default=None)
+    parser.add_argument("--outerwear", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+
+    now = datetime.now()
+    rows = make_closet_rows(args.items, args.seed, now)
+    season = SEASON_BITS[args.season] if args.season else None
+
+    timings = []
+    for _ in range(args.repeat + 1):
+        start = time.perf_counter()
+        features = build_features(rows, now)
+        ranked = rank_outfits(features, args.limit, season, args.outerwear)
+        timings.append(time.perf_counter() - start)
+    # The first run only warms up
+    timings = timings[1:]
+
+    print(f"items: {args.items}, outfits: {len(ranked)}, runs: {args.repeat}")
+    print(
+        f"min {min(timings) * 1000:.1f} ms, "
+        f"median {statistics.median(timings) * 1000:.1f} ms, "
+        f"max {max(timings) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
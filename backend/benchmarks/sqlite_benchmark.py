@@ -0,0 +1,244 @@
+"""
+Benchmark of item read throughput on SQLite: the tuned WAL mode of the
+application against SQLAlchemy's defaults.
+
+Run from the project root:
+    python -m backend.benchmarks.sqlite_benchmark --users 5000 --items 200000 \
+        --threads 1 4 8 --writers 0 1 --output sqlite-results.json
+
+Each mode gets its own database file with the same closets. Reader threads
+list a random user's items or get one item, each in a new session like a
+request, for --seconds; writer threads meanwhile create items. The default
+mode shares one engine for everything, with a rollback journal, FULL
+synchronous writes and the default cache. The tuned mode is what
+POSTGRES_URL=sqlite:///... runs: WAL, the SQLITE_* pragmas, a single writer
+connection and a pool of readers.
+"""
+
+import argparse
+import json
+import platform
+import random
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.benchmarks.service_benchmark import CATEGORIES, _git_commit
+from backend.config.database import DatabaseBusyError, create_sqlite_engine
+from backend.config.settings import settings
+from backend.migrate import migrate
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.user import User
+from backend.schemas.clothing_item import ClothingItemCreate
+from backend.services.item_service import ItemService
+
+MODES = ["default", "tuned"]
+
+# Items inserted per statement while seeding
+SEED_BATCH = 10_000
+
+
+def seed(engine, users: int, items: int) -> None:
+    """
+    Create the schema and spread the items evenly over the users.
+
+    Args:
+        engine: Engine of the database file
+        users: Number of users
+        items: Number of items
+    """
+    migrate(engine)
+    now = datetime.now()
+    with engine.begin() as connection:
+        connection.execute(
+            insert(User),
+            [
+                {
+                    "id": user_id,
+                    "email": f"user{user_id}@example.com",
+                    "full_name": f"User {user_id}",
+                    "hashed_password": "x",
+                    "salt": "x",
+                }
+                for user_id in range(1, users + 1)
+            ],
+        )
+        for first in range(0, items, SEED_BATCH):
+            connection.execute(
+                insert(ClothingItemModel),
+                [
+                    {
+                        "name": f"Item {i}",
+                        "category": CATEGORIES[i % len(CATEGORIES)],
+                        "color": "navy",
+                        "wear_count": i % 40,
+                        "user_id": 1 + i % users,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for i in range(first, min(first + SEED_BATCH, items))
+                ],
+            )
+
+
+def run_load(
+    read_sessions: sessionmaker,
+    write_sessions: sessionmaker,
+    item_ids: Dict[int, int],
+    threads: int,
+    writers: int,
+    seconds: float,
+) -> Dict[str, Any]:
+    """
+    Run reader and writer threads for a while and count what they did.
+
+    Args:
+        read_sessions: Sessions for the readers
+        write_sessions: Sessions for the writers
+        item_ids: An item ID of every user
+        threads: Number of reader threads
+        writers: Number of writer threads
+        seconds: How long to run
+
+    Returns:
+        Reads and writes per second, and the errors by type
+    """
+    counts: Counter = Counter()
+    lock = threading.Lock()
+    stop = threading.Event()
+    users = list(item_ids)
+
+    def loop(operation: Callable[[random.Random], None], name: str, seed: int):
+        rng = random.Random(seed)
+        done = Counter()
+        while not stop.is_set():
+            try:
+                operation(rng)
+                done[name] += 1
+            except (OperationalError, DatabaseBusyError) as e:
+                done[f"{name}_error:{type(e).__name__}"] += 1
+        with lock:
+            counts.update(done)
+
+    def read(rng: random.Random) -> None:
+        user_id = rng.choice(users)
+        with read_sessions() as session:
+            service = ItemService(session)
+            if rng.random() < 0.5:
+                service.get_all_items(user_id)
+            else:
+                service.get_item(item_ids[user_id], user_id)
+
+    def write(rng: random.Random) -> None:
+        user_id = rng.choice(users)
+        item = ClothingItemCreate(name="New Shirt", category="Tops", user_id=user_id)
+        with write_sessions() as session:
+            ItemService(session).create_item(item, user_id)
+
+    workers = [
+        threading.Thread(target=loop, args=(read, "reads", i)) for i in range(threads)
+    ] + [
+        threading.Thread(target=loop, args=(write, "writes", threads + i))
+        for i in range(writers)
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+
+    return {
+        "reads_per_second": counts.pop("reads", 0) / seconds,
+        "writes_per_second": counts.pop("writes", 0) / seconds,
+        "errors": dict(counts),
+    }
+
+
+def main():
+    """Seed a database per mode and measure the read throughput of each."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=5000, help="users")
+    parser.add_argument("--items", type=int, default=200_000, help="items")
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 4, 8], help="reader threads"
+    )
+    parser.add_argument(
+        "--writers", type=int, nargs="+", default=[0, 1], help="writer threads"
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=5.0, help="seconds per measurement"
+    )
+    parser.add_argument("--output", help="file to write the results to as JSON")
+    args = parser.parse_args()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "users": args.users,
+        "items": args.items,
+        "seconds": args.seconds,
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as scratch:
+        for mode in MODES:
+            url = f"sqlite:///{scratch}/{mode}.db"
+            if mode == "tuned":
+                writer = create_sqlite_engine(url)
+                readers = create_sqlite_engine(
+                    url, readers=max(max(args.threads), settings.sqlite_readers)
+                )
+            else:
+                writer = readers = create_engine(url)
+            seed(writer, args.users, args.items)
+            with writer.connect() as connection:
+                item_ids = dict(
+                    connection.execute(
+                        select(ClothingItemModel.user_id, ClothingItemModel.id)
+                    ).all()
+                )
+
+            for writers in args.writers:
+                for threads in args.threads:
+                    result = run_load(
+                        sessionmaker(bind=readers),
+                        sessionmaker(bind=writer),
+                        item_ids,
+                        threads,
+                        writers,
+                        args.seconds,
+                    )
+                    report["results"].append(
+                        {
+                            "mode": mode,
+                            "threads": threads,
+                            "writers": writers,
+                            **result,
+                        }
+                    )
+                    print(
+                        f"{mode:<8} {threads:3d} readers {writers:2d} writers "
+                        f"{result['reads_per_second']:10.0f} reads/s "
+                        f"{result['writes_per_second']:8.0f} writes/s"
+                        + (f"  errors: {result['errors']}" if result["errors"] else "")
+                    )
+            writer.dispose()
+            readers.dispose()
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
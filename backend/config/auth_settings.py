@@ -0,0 +1,91 @@
+"""
+Authentication configuration settings.
+"""
+
+from typing import Literal, Optional
+
+from pydantic import AliasChoices, ConfigDict, Field, field_validator
+from pydantic_settings import BaseSettings
+
+# Sample values from .env and older defaults that must never sign real tokens
+PLACEHOLDER_SECRET_KEYS = frozenset({"change-me-in-production", "your-secret-key-here"})
+
+
+class AuthSettings(BaseSettings):
+    """Auth settings for issuing and verifying access tokens."""
+
+    # Token signing settings
+    jwt_secret_key: str = Field(
+        validation_alias=AliasChoices("JWT_SECRET_KEY", "SECRET_KEY"),
+        description="Secret used to sign access tokens; required, SECRET_KEY also works",
+    )
+
+    jwt_algorithm: str = Field(
+        default="HS256",
+        alias="JWT_ALGORITHM",
+        description="Algorithm used to sign access tokens",
+    )
+
+    access_token_expire_minutes: int = Field(
+        default=60,
+        alias="ACCESS_TOKEN_EXPIRE_MINUTES",
+        description="Minutes an access token stays valid",
+        ge=1,
+    )
+
+    # Verification settings
+    token_cache_size: int = Field(
+        default=1024,
+        alias="TOKEN_CACHE_SIZE",
+        description="Number of verified tokens remembered to skip signature checks",
+        ge=0,
+    )
+
+    # Password hashing settings
+    password_hash_scheme: Literal["scrypt", "argon2", "bcrypt"] = Field(
+        default="scrypt",
+        alias="PASSWORD_HASH_SCHEME",
+        description="Password hash for new passwords; argon2 and bcrypt need their backends installed",
+    )
+
+    password_hash_rounds: Optional[int] = Field(
+        default=None,
+        alias="PASSWORD_HASH_ROUNDS",
+        description="Cost factor of the password hash, defaults to passlib's; see calibrate",
+        ge=1,
+    )
+
+    password_hash_workers: int = Field(
+        default=2,
+        alias="PASSWORD_HASH_WORKERS",
+        description="Threads that hash passwords; each scrypt hash also holds its memory",
+        ge=1,
+    )
+
+    password_hash_max_queue: int = Field(
+        default=32,
+        alias="PASSWORD_HASH_MAX_QUEUE",
+        description="Hashes waiting for a thread before logins are turned away with 503",
+        ge=0,
+    )
+
+    @field_validator("jwt_secret_key")
+    @classmethod
+    def reject_placeholder_secret(cls, value: str) -> str:
+        """Refuse to start with an empty or sample signing secret."""
+        if not value.strip() or value in PLACEHOLDER_SECRET_KEYS:
+            raise ValueError(
+                "JWT_SECRET_KEY must be set to a private value, "
+                "not left empty or as the sample"
+            )
+        return value
+
+    # Use ConfigDict instead of class-based config (recommended for Pydantic v2)
+    model_config = ConfigDict(  # type: ignore[reportCallIssue]
+        env_file=".env",
+        case_sensitive=False,
+    )
+
+
+# Global settings instance
+auth_settings = AuthSettings()
@@ -0,0 +1,72 @@
+"""
+Background job queue configuration settings.
+"""
+
+from typing import Literal
+
+from pydantic import ConfigDict, Field
+from pydantic_settings import BaseSettings
+
+
+class JobSettings(BaseSettings):
+    """Job settings for the background worker and retry policy."""
+
+    # Worker settings
+    worker_pool: Literal["thread", "process"] = Field(
+        default="thread",
+        alias="JOB_WORKER_POOL",
+        description="Pool that runs jobs: threads for I/O bound, processes for CPU bound",
+    )
+
+    worker_concurrency: int = Field(
+        default=4,
+        alias="JOB_WORKER_CONCURRENCY",
+        description="Number of jobs a worker process runs at the same time",
+        ge=1,
+    )
+
+    poll_interval: float = Field(
+        default=1.0,
+        alias="JOB_POLL_INTERVAL",
+        description="Seconds an idle worker waits before polling for jobs again",
+        gt=0,
+    )
+
+    lease_seconds: int = Field(
+        default=300,
+        alias="JOB_LEASE_SECONDS",
+        description="Seconds before a running job of a dead worker is claimed again",
+        ge=1,
+    )
+
+    # Retry settings
+    max_attempts: int = Field(
+        default=5,
+        alias="JOB_MAX_ATTEMPTS",
+        description="Default number of attempts before a job is marked failed",
+        ge=1,
+    )
+
+    retry_base_delay: float = Field(
+        default=2.0,
+        alias="JOB_RETRY_BASE_DELAY",
+        description="Seconds before the first retry; doubled on every attempt",
+        ge=0,
+    )
+
+    retry_max_delay: float = Field(
+        default=600.0,
+        alias="JOB_RETRY_MAX_DELAY",
+        description="Upper bound in seconds for the delay between retries",
+        ge=0,
+    )
+
+    # Use ConfigDict instead of class-based config (recommended for Pydantic v2)
+    model_config = ConfigDict(  # type: ignore[reportCallIssue]
+        env_file=".env",
+        case_sensitive=False,
+    )
+
+
+# Global settings instance
+job_settings = JobSettings()
@@ -0,0 +1,86 @@
+"""
+Operations endpoint configuration settings.
+"""
+
+from typing import Optional
+
+from pydantic import ConfigDict, Field
+from pydantic_settings import BaseSettings
+
+
+class OpsSettings(BaseSettings):
+    """Ops settings for the operator-only diagnostics endpoints."""
+
+    ops_token: Optional[str] = Field(
+        default=None,
+        alias="OPS_TOKEN",
+        description="Token operators send in X-Ops-Token; ops endpoints are disabled without it",
+    )
+
+    # Profiler settings
+    profile_max_seconds: float = Field(
+        default=60.0,
+        alias="PROFILE_MAX_SECONDS",
+        description="Longest profile an operator may request",
+        gt=0,
+    )
+
+    profile_interval: float = Field(
+        default=0.005,
+        alias="PROFILE_INTERVAL",
+        description="Seconds between stack samples while profiling",
+        gt=0,
+    )
+
+    # Event loop monitor settings
+    loop_monitor_enabled: bool = Field(
+        default=True,
+        alias="LOOP_MONITOR_ENABLED",
+        description="Whether the API measures event loop lag and reports stalls",
+    )
+
+    loop_monitor_interval: float = Field(
+        default=0.1,
+        alias="LOOP_MONITOR_INTERVAL",
+        description="Seconds between event loop lag measurements",
+        gt=0,
+    )
+
+    loop_stall_threshold: float = Field(
+        default=0.25,
+        alias="LOOP_STALL_THRESHOLD",
+        description="Seconds the event loop may be blocked before the stall is logged",
+        gt=0,
+    )
+
+    # Lifecycle settings
+    warmup_timeout: float = Field(
+        default=5.0,
+        alias="WARMUP_TIMEOUT",
+        description="Seconds startup waits for connections and caches to warm up",
+        gt=0,
+    )
+
+    shutdown_timeout: float = Field(
+        default=20.0,
+        alias="SHUTDOWN_TIMEOUT",
+        description="Seconds shutdown waits for in-flight requests",
+        gt=0,
+    )
+
+    shutdown_drain_delay: float = Field(
+        default=5.0,
+        alias="SHUTDOWN_DRAIN_DELAY",
+        description="Seconds SIGTERM refuses new requests before the server stops listening",
+        ge=0,
+    )
+
+    # Use ConfigDict instead of class-based config (recommended for Pydantic v2)
+    model_config = ConfigDict(  # type: ignore[reportCallIssue]
+        env_file=".env",
+        case_sensitive=False,
+    )
+
+
+# Global settings instance
+ops_settings = OpsSettings()
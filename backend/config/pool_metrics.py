@@ -0,0 +1,162 @@
+"""
+Connection pool instrumentation for the PostgreSQL engine.
+Pool event listeners and a timed pool class record how long checkouts wait,
+how many connections are in use or in overflow, how old connections are when
+they are handed out and how often they are invalidated, so the pool can be
+sized from data.
+"""
+
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+# Checkouts kept for the wait time and connection age percentiles
+RECENT_CHECKOUTS = 1000
+
+
+def _percentile(values: Deque[float], fraction: float) -> float:
+    """Get a percentile of recent values, 0 when there are none."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[
+        round(fraction * 100) - 1
+    ]
+
+
+class PoolMetrics:
+    """Thread-safe counters and recent samples of connection pool activity."""
+
+    def __init__(self, recent: int = RECENT_CHECKOUTS):
+        """
+        Initialize empty metrics.
+
+        Args:
+            recent: Checkouts kept for the wait time and age percentiles
+        """
+        self._lock = threading.Lock()
+        self._recent = recent
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.soft_invalidations = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+            self.waits: Deque[float] = deque(maxlen=self._recent)
+            self.ages: Deque[float] = deque(maxlen=self._recent)
+
+    def record_wait(
+        self, seconds: float, pool: QueuePool, timed_out: bool = False
+    ) -> None:
+        """Record how long a checkout waited and how busy the pool was after it."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+                self.peak_overflow = max(self.peak_overflow, pool.overflow())
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.waits.append(seconds)
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        """Remember when a new connection was opened."""
+        connection_record.info["connected_at"] = time.monotonic()
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, proxy) -> None:
+        """Record the age of a connection as it is handed out."""
+        connected_at = connection_record.info.get("connected_at")
+        with self._lock:
+            self.checkouts += 1
+            if connected_at is not None:
+                self.ages.append(time.monotonic() - connected_at)
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        """Count a connection that was discarded, usually after an error."""
+        with self._lock:
+            self.invalidations += 1
+
+    def on_soft_invalidate(
+        self, dbapi_connection, connection_record, exception
+    ) -> None:
+        """Count a connection that will be replaced once it is returned."""
+        with self._lock:
+            self.soft_invalidations += 1
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to the pool events of an engine, including recreated pools."""
+        event.listen(engine, "connect", self.on_connect)
+        event.listen(engine, "checkout", self.on_checkout)
+        event.listen(engine, "invalidate", self.on_invalidate)
+        event.listen(engine, "soft_invalidate", self.on_soft_invalidate)
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        """
+        Get the recorded metrics and the current state of a pool.
+
+        Args:
+            pool: Pool whose configuration and current usage to include
+
+        Returns:
+            Metrics keyed like the PoolStats schema
+        """
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "wait_seconds_p50": _percentile(self.waits, 0.5),
+                "wait_seconds_p95": _percentile(self.waits, 0.95),
+                "connection_age_seconds_p50": _percentile(self.ages, 0.5),
+                "connection_age_seconds_max": max(self.ages, default=0.0),
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+            }
+
+        if isinstance(pool, QueuePool):
+            stats.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return stats
+
+
+# Process-wide metrics of the application engine's pool
+pool_metrics = PoolMetrics()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - start, self, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - start, self)
+        return connection
@@ -0,0 +1,63 @@
+"""
+Rate limiting configuration settings.
+"""
+
+from pydantic import ConfigDict, Field
+from pydantic_settings import BaseSettings
+
+
+class RateLimitSettings(BaseSettings):
+    """Rate limit settings for the per-client and per-route token buckets."""
+
+    rate_limit_enabled: bool = Field(
+        default=True,
+        alias="RATE_LIMIT_ENABLED",
+        description="Whether API requests are rate limited",
+    )
+
+    # Per-client settings
+    client_rate: float = Field(
+        default=20.0,
+        alias="RATE_LIMIT_CLIENT_RATE",
+        description="Requests per second a user, or an anonymous IP, may sustain",
+        gt=0,
+    )
+
+    client_burst: int = Field(
+        default=60,
+        alias="RATE_LIMIT_CLIENT_BURST",
+        description="Requests a client may make at once before the rate applies",
+        ge=1,
+    )
+
+    # Per-route settings
+    route_rate: float = Field(
+        default=5.0,
+        alias="RATE_LIMIT_ROUTE_RATE",
+        description="Requests per second a client may sustain on a single route",
+        gt=0,
+    )
+
+    route_burst: int = Field(
+        default=20,
+        alias="RATE_LIMIT_ROUTE_BURST",
+        description="Requests a client may make at once to a single route",
+        ge=1,
+    )
+
+    max_tracked_buckets: int = Field(
+        default=10000,
+        alias="RATE_LIMIT_MAX_BUCKETS",
+        description="Buckets kept in memory; the least recently used are dropped",
+        ge=1,
+    )
+
+    # Use ConfigDict instead of class-based config (recommended for Pydantic v2)
+    model_config = ConfigDict(  # type: ignore[reportCallIssue]
+        env_file=".env",
+        case_sensitive=False,
+    )
+
+
+# Global settings instance
+rate_limit_settings = RateLimitSettings()
@@ -2,7 +2,7 @@
 Database configuration settings.
 """
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import ConfigDict, Field
 from pydantic_settings import BaseSettings
@@ -18,6 +18,31 @@ class DatabaseSettings(BaseSettings):
         description="PostgreSQL database connection URL",
     )
 
+    postgresql_replica_urls: Optional[str] = Field(
+        default=None,
+        alias="POSTGRES_REPLICA_URLS",
+        description="Comma-separated PostgreSQL read replica URLs for GET requests",
+    )
+
+    postgresql_read_your_writes_window: float = Field(
+        default=5.0,
+        alias="POSTGRES_READ_YOUR_WRITES_WINDOW",
+        description="Seconds after a write during which a client reads from the primary",
+        ge=0,
+    )
+
+    postgresql_shard_urls: Optional[str] = Field(
+        default=None,
+        alias="POSTGRES_SHARD_URLS",
+        description="Comma-separated PostgreSQL shard URLs; the primary holds the shard map",
+    )
+
+    storage_backend: Literal["database", "memory"] = Field(
+        default="database",
+        alias="STORAGE_BACKEND",
+        description="Where items and users are kept; memory is an ephemeral demo mode",
+    )
+
     # MongoDB settings
     mongodb_url: Optional[str] = Field(
         default=None, alias="MONGODB_URL", description="MongoDB database connection URL"
@@ -36,6 +61,82 @@ class DatabaseSettings(BaseSettings):
         description="PostgreSQL maximum overflow connections",
     )
 
+    postgresql_pool_timeout: float = Field(
+        default=30.0,
+        alias="POSTGRES_POOL_TIMEOUT",
+        description="Seconds a checkout waits for a connection before failing",
+        gt=0,
+    )
+
+    postgresql_pool_recycle: int = Field(
+        default=-1,
+        alias="POSTGRES_POOL_RECYCLE",
+        description="Seconds after which connections are replaced, -1 to keep them",
+    )
+
+    postgresql_pool_pre_ping: bool = Field(
+        default=True,
+        alias="POSTGRES_POOL_PRE_PING",
+        description="Test connections on checkout and replace dead ones",
+    )
+
+    postgresql_pool_warmup: int = Field(
+        default=2,
+        alias="POSTGRES_POOL_WARMUP",
+        description="Pool connections opened when the API starts, up to the pool size",
+        ge=0,
+    )
+
+    # Admission settings
+    postgresql_max_concurrency: Optional[int] = Field(
+        default=None,
+        alias="POSTGRES_MAX_CONCURRENCY",
+        description="Requests using a database session at once; defaults to pool size plus overflow",
+        ge=1,
+    )
+
+    postgresql_acquire_timeout: float = Field(
+        default=0.5,
+        alias="POSTGRES_ACQUIRE_TIMEOUT",
+        description="Seconds a request waits for a free session before a 503",
+        ge=0,
+    )
+
+    # SQLite settings, used when POSTGRES_URL is a sqlite:/// file URL
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        alias="SQLITE_SYNCHRONOUS",
+        description="SQLite synchronous pragma; NORMAL is durable per checkpoint in WAL mode",
+    )
+
+    sqlite_mmap_size: int = Field(
+        default=256 * 1024 * 1024,
+        alias="SQLITE_MMAP_SIZE",
+        description="Bytes of the SQLite database file read through memory mapping",
+        ge=0,
+    )
+
+    sqlite_cache_size: int = Field(
+        default=64 * 1024,
+        alias="SQLITE_CACHE_SIZE",
+        description="KiB of page cache per SQLite connection",
+        ge=0,
+    )
+
+    sqlite_busy_timeout: float = Field(
+        default=5.0,
+        alias="SQLITE_BUSY_TIMEOUT",
+        description="Seconds a SQLite write waits for the write lock before a 503",
+        ge=0,
+    )
+
+    sqlite_readers: int = Field(
+        default=4,
+        alias="SQLITE_READERS",
+        description="Read-only SQLite connections pooled next to the single writer",
+        ge=1,
+    )
+
     model_config = ConfigDict(  # type: ignore[reportCallIssue]
         env_file=".env",
         case_sensitive=False,
@@ -0,0 +1,272 @@
+"""
+User-keyed sharding across several PostgreSQL databases.
+Every row belongs to a user, so each user's rows live together on one shard
+and the requests of a user only ever touch that shard. The primary database
+keeps the shard map, the user_shards table, which allocates user IDs, finds
+users by email when they log in and names the shard of every user. New users
+are placed by a hash of their email; backend.move_user moves a user to
+another shard while the application runs.
+
+Without POSTGRES_SHARD_URLS sharding is off and everything stays on the
+primary database, with its read replicas.
+"""
+
+import threading
+import zlib
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.models.user_shard_model import UserShardModel
+
+from .database import (
+    DatabaseBusyError,
+    SessionLocal,
+    create_database_engine,
+    get_engine,
+)
+from .settings import settings
+
+
+def get_shard_urls() -> List[str]:
+    if not settings.postgresql_shard_urls:
+        return []
+    return [
+        url.strip() for url in settings.postgresql_shard_urls.split(",") if url.strip()
+    ]
+
+
+class UserMovingError(DatabaseBusyError):
+    """Raised for requests of a user whose rows are moving to another shard."""
+
+
+class ShardMap:
+    """Maps users to shards and binds sessions to the shard of a user."""
+
+    def __init__(
+        self,
+        directory: Optional[Engine] = None,
+        shards: Optional[List[Engine]] = None,
+    ):
+        """
+        Initialize the ShardMap.
+
+        Args:
+            directory: Engine of the database holding the shard map,
+                defaults to the primary engine
+            shards: Engines of the shards, defaults to POSTGRES_SHARD_URLS
+        """
+        self._directory = directory
+        self._shards = shards
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Engine:
+        """Engine of the database holding the shard map."""
+        if self._directory is None:
+            return get_engine()
+        return self._directory
+
+    @property
+    def shards(self) -> List[Engine]:
+        """Engines of the shards, created on first use."""
+        if self._shards is None:
+            with self._lock:
+                if self._shards is None:
+                    self._shards = [
+                        create_database_engine(url) for url in get_shard_urls()
+                    ]
+        return self._shards
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any shards are configured."""
+        return bool(self.shards)
+
+    def placement(self, email: str) -> int:
+        """
+        Get the shard a new user is placed on.
+
+        Args:
+            email: Email of the user
+
+        Returns:
+            Index of the shard
+        """
+        return zlib.crc32(email.lower().encode()) % len(self.shards)
+
+    def find_user(self, email: str) -> Optional[Row]:
+        """
+        Look up a user by email.
+
+        Args:
+            email: Email of the user
+
+        Returns:
+            The user's user_id, shard and moving flag, or None
+        """
+        with self.directory.connect() as connection:
+            return connection.execute(
+                select(
+                    UserShardModel.user_id, UserShardModel.shard, UserShardModel.moving
+                ).where(UserShardModel.email == email)
+            ).first()
+
+    def get_user(self, user_id: int) -> Optional[Row]:
+        """
+        Look up a user by ID.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            The user's user_id, shard and moving flag, or None
+        """
+        with self.directory.connect() as connection:
+            return connection.execute(
+                select(
+                    UserShardModel.user_id, UserShardModel.shard, UserShardModel.moving
+                ).where(UserShardModel.user_id == user_id)
+            ).first()
+
+    def add_user(self, email: str) -> Tuple[int, int]:
+        """
+        Allocate an ID for a new user and place them on a shard.
+
+        Args:
+            email: Email of the user
+
+        Returns:
+            ID and shard of the user
+
+        Raises:
+            ValueError: If a user with the email already exists
+        """
+        shard = self.placement(email)
+        try:
+            with self.directory.begin() as connection:
+                user_id = connection.execute(
+                    insert(UserShardModel)
+                    .values(email=email, shard=shard, moving=False)
+                    .returning(UserShardModel.user_id)
+                ).scalar_one()
+        except IntegrityError:
+            raise ValueError("User with this email already exists")
+        return user_id, shard
+
+    def remove_user(self, user_id: int) -> None:
+        """
+        Remove a user from the shard map.
+
+        Args:
+            user_id: ID of the user
+        """
+        with self.directory.begin() as connection:
+            connection.execute(
+                delete(UserShardModel).where(UserShardModel.user_id == user_id)
+            )
+
+    def set_shard(self, user_id: int, shard: int, moving: bool = False) -> None:
+        """
+        Record the shard of a user and whether their rows are moving.
+
+        Args:
+            user_id: ID of the user
+            shard: Index of the shard
+            moving: Whether requests of the user must wait
+        """
+        with self.directory.begin() as connection:
+            connection.execute(
+                update(UserShardModel)
+                .where(UserShardModel.user_id == user_id)
+                .values(shard=shard, moving=moving)
+            )
+
+    def bind(self, session: Session, shard: int) -> Session:
+        """
+        Bind a session that has not been used yet to a shard.
+
+        Args:
+            session: The session
+            shard: Index of the shard
+
+        Returns:
+            The same session
+        """
+        session.bind = self.shards[shard]
+        return session
+
+    def use_shard(self, session: Session, entry: Row) -> Session:
+        """
+        Bind a session that has not been used yet to the shard of a user.
+
+        Args:
+            session: The session
+            entry: The user's entry in the shard map
+
+        Returns:
+            The same session
+
+        Raises:
+            UserMovingError: If the user's rows are moving to another shard
+        """
+        if entry.moving:
+            raise UserMovingError("Your data is being moved, try again shortly")
+        return self.bind(session, entry.shard)
+
+    def route(self, session: Session, user_id: int) -> Session:
+        """
+        Bind a session that has not been used yet to the shard of a user,
+        when sharding is enabled.
+
+        Args:
+            session: The session
+            user_id: ID of the user
+
+        Returns:
+            The same session
+
+        Raises:
+            UserMovingError: If the user's rows are moving to another shard
+        """
+        if not self.enabled:
+            return session
+        entry = self.get_user(user_id)
+        if entry is None:
+            # Unknown to the shard map, so left on the primary database
+            return session
+        return self.use_shard(session, entry)
+
+    def dispose(self, close: bool = True) -> None:
+        """
+        Drop the pooled connections of the shard engines that were created.
+
+        Args:
+            close: Close the connections; False leaves them alone, for
+                processes that inherited them from their parent
+        """
+        for engine in self._shards or []:
+            engine.dispose(close=close)
+
+
+class ShardSessions:
+    """Session factory for one shard that can be sent to worker processes."""
+
+    def __init__(self, shard: int):
+        """
+        Initialize the factory.
+
+        Args:
+            shard: Index of the shard
+        """
+        self.shard = shard
+
+    def __call__(self) -> Session:
+        return shard_map.bind(SessionLocal(), self.shard)
+
+
+# Global shard map instance
+shard_map = ShardMap()
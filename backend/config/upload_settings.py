@@ -16,6 +16,20 @@ class UploadSettings(BaseSettings):
         description="Directory path for storing uploaded files",
     )
 
+    # Duplicate detection setting
+    duplicate_max_distance: int = Field(
+        default=8,
+        alias="DUPLICATE_MAX_DISTANCE",
+        description="Largest image hash Hamming distance flagged as a duplicate",
+    )
+
+    duplicate_index_ttl: float = Field(
+        default=60.0,
+        alias="DUPLICATE_INDEX_TTL",
+        description="Seconds a user's duplicate index is used before it is rebuilt",
+        gt=0,
+    )
+
     # Use ConfigDict instead of class-based config (recommended for Pydantic v2)
     model_config = ConfigDict(  # type: ignore[reportCallIssue]
         env_file=".env",
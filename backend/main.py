@@ -3,17 +3,53 @@ Main application file for the Closet Management Application.
 This file sets up the FastAPI application with all routes and configurations.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+
+from backend.api.middleware import (
+    AdmissionControlMiddleware,
+    MetricsMiddleware,
+    ServerTimingMiddleware,
+)
+from backend.api.v1 import auth, collections, items, jobs, ops, outfits
+from backend.config.ops_settings import ops_settings
+from backend.services.lifecycle_service import drain_on_sigterm, shut_down, warm_up
+from backend.services.loop_monitor_service import loop_monitor
+from backend.services.metrics_service import metrics
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up connections and caches and run background monitors for as long as
+    the application serves requests, then drain and close everything. The
+    schema is managed separately, by backend.migrate.
+
+    Run uvicorn with --timeout-graceful-shutdown at least SHUTDOWN_TIMEOUT so
+    it waits as long for open connections on SIGTERM, and give the process
+    SHUTDOWN_DRAIN_DELAY more than that to exit.
+    """
+    await warm_up()
+    drain_on_sigterm()
+    if ops_settings.loop_monitor_enabled:
+        loop_monitor.start()
+    try:
+        yield
+    finally:
+        if ops_settings.loop_monitor_enabled:
+            await loop_monitor.stop()
+        await shut_down()
 
-from backend.api.v1 import auth, items
-from backend.config.database import Base, engine
 
 # Create FastAPI application
 app = FastAPI(
     title="Closet Management App",
     version="1.0.0",
     description="API for managing clothing items in a virtual closet",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -25,9 +61,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Add server timing middleware
+app.add_middleware(ServerTimingMiddleware)
+
+# Add admission control middleware
+app.add_middleware(AdmissionControlMiddleware)
+
+# Add metrics middleware; added last so it runs first and sees rejected requests
+app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(items.router, prefix="/api/v1/items", tags=["items"])
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
+app.include_router(outfits.router, prefix="/api/v1/outfits", tags=["outfits"])
+app.include_router(
+    collections.router, prefix="/api/v1/collections", tags=["collections"]
+)
+app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["jobs"])
+app.include_router(ops.router, prefix="/api/v1/ops", tags=["ops"])
 
 
 @app.get("/")
@@ -40,4 +91,9 @@ async def health_check():
     return {"status": "healthy"}
 
 
-Base.metadata.create_all(bind=engine)
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Expose the process metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
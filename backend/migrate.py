@@ -0,0 +1,258 @@
+"""
+Schema migration step for the Closet Management Application.
+Run it once per deployment, before starting the API and the workers:
+
+    python -m backend.migrate
+
+The API no longer touches the schema when it starts, so workers start
+without database round trips. Missing tables and their indexes are
+created; existing tables are left as they are. With sharding on, every shard
+gets the tables too, except the shard map, and its own range of IDs.
+
+On PostgreSQL, --item-partitions N creates a new clothing_items table
+hash-partitioned by user_id into N partitions, each with its own indexes:
+
+    python -m backend.migrate --item-partitions 16
+
+PostgreSQL needs the partition key in the primary key, which becomes
+(id, user_id), and cannot enforce foreign keys to a partitioned table by
+id alone, so a trigger deletes the outfit and collection entries of a
+deleted item instead of ON DELETE CASCADE. An existing clothing_items table
+is not converted.
+"""
+
+import argparse
+import importlib
+import logging
+from typing import List, Optional
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable, DDLElement
+
+from backend.config.database import Base, get_engine
+from backend.config.sharding import shard_map
+
+logger = logging.getLogger(__name__)
+
+# Modules that define the tables of the schema
+MODEL_MODULES = [
+    "backend.models.user",
+    "backend.models.clothing_item_model",
+    "backend.models.outfit_model",
+    "backend.models.collection_model",
+    "backend.models.job_model",
+    "backend.models.user_shard_model",
+]
+
+# Tables that only the primary database has
+DIRECTORY_TABLES = {"user_shards"}
+
+# Each shard hands out IDs from its index times this on, so rows keep their
+# IDs when their user moves to another shard
+SHARD_ID_BLOCK = 100_000_000
+
+# Table that can be hash-partitioned by user_id
+ITEMS_TABLE = "clothing_items"
+
+
+def load_models() -> None:
+    """Import every module that defines tables."""
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
+
+def reserve_id_range(engine: Engine, shard: int) -> None:
+    """
+    Move the ID sequences of a PostgreSQL shard into the shard's range.
+    Other databases keep their IDs as they are.
+
+    Args:
+        engine: Engine of the shard
+        shard: Index of the shard
+    """
+    if engine.dialect.name != "postgresql" or shard == 0:
+        return
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            column = table.autoincrement_column
+            if table.name in DIRECTORY_TABLES or column is None:
+                continue
+            connection.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', "
+                    f"'{column.name}'), GREATEST(:start, "
+                    f"(SELECT COALESCE(MAX({column.name}), 0) FROM {table.name})))"
+                ),
+                {"start": shard * SHARD_ID_BLOCK},
+            )
+
+
+def partitioned_items_ddl(partitions: int) -> List[DDLElement]:
+    """
+    Get the PostgreSQL statements creating clothing_items hash-partitioned by
+    user_id. Indexes of the table are created on every partition.
+
+    Args:
+        partitions: Number of partitions
+
+    Returns:
+        Statements creating the table, its indexes and its partitions
+    """
+    # A copy of the schema, so the foreign keys of the table resolve
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(metadata)
+    items = metadata.tables[ITEMS_TABLE]
+    items.c.id.autoincrement = True
+    items.c.user_id.primary_key = True
+    items.append_constraint(PrimaryKeyConstraint(items.c.id, items.c.user_id))
+    items.dialect_options["postgresql"]["partition_by"] = "HASH (user_id)"
+
+    statements: List[DDLElement] = [CreateTable(items)]
+    statements += [CreateIndex(index) for index in items.indexes]
+    statements += [
+        text(
+            f"CREATE TABLE {ITEMS_TABLE}_p{remainder} PARTITION OF {ITEMS_TABLE} "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+        for remainder in range(partitions)
+    ]
+    return statements
+
+
+def item_references_trigger_ddl() -> List[DDLElement]:
+    """
+    Get the PostgreSQL statements creating the trigger that deletes the rows
+    referring to a deleted item, in place of ON DELETE CASCADE.
+
+    Returns:
+        Statements creating the trigger function and the trigger
+    """
+    deletes = "".join(
+        f"DELETE FROM {table.name} WHERE {key.parent.name} = OLD.{key.column.name}; "
+        for table in Base.metadata.sorted_tables
+        for key in table.foreign_keys
+        if key.column.table.name == ITEMS_TABLE
+    )
+    return [
+        text(
+            f"CREATE FUNCTION {ITEMS_TABLE}_delete_references() RETURNS trigger "
+            f"AS $$ BEGIN {deletes}RETURN OLD; END $$ LANGUAGE plpgsql"
+        ),
+        text(
+            f"CREATE TRIGGER {ITEMS_TABLE}_delete_references AFTER DELETE ON "
+            f"{ITEMS_TABLE} FOR EACH ROW EXECUTE FUNCTION "
+            f"{ITEMS_TABLE}_delete_references()"
+        ),
+    ]
+
+
+def create_with_partitioned_items(
+    connection: Connection, tables: List[Table], partitions: int
+) -> None:
+    """
+    Create tables on PostgreSQL, with clothing_items hash-partitioned.
+
+    Args:
+        connection: Connection to the database, in a transaction
+        tables: Tables to create, parents first
+        partitions: Number of partitions of clothing_items
+    """
+    for table in tables:
+        if table.name == ITEMS_TABLE:
+            statements = partitioned_items_ddl(partitions)
+        else:
+            statements = [
+                CreateTable(
+                    table,
+                    include_foreign_key_constraints=[
+                        key
+                        for key in table.foreign_key_constraints
+                        if key.referred_table.name != ITEMS_TABLE
+                    ],
+                )
+            ]
+            statements += [CreateIndex(index) for index in table.indexes]
+        for statement in statements:
+            connection.execute(statement)
+    for statement in item_references_trigger_ddl():
+        connection.execute(statement)
+
+
+def migrate(
+    engine: Optional[Engine] = None,
+    shard: Optional[int] = None,
+    item_partitions: Optional[int] = None,
+) -> List[str]:
+    """
+    Create the tables that are missing from the database.
+
+    Args:
+        engine: Engine of the database, defaults to the application engine
+        shard: Index of the shard the database is, None for the primary
+        item_partitions: Hash-partition a new clothing_items table by user_id
+            into this many partitions, on PostgreSQL
+
+    Returns:
+        Names of the tables that were created
+    """
+    engine = engine or get_engine()
+    load_models()
+    tables = [
+        table
+        for table in Base.metadata.sorted_tables
+        if shard is None or table.name not in DIRECTORY_TABLES
+    ]
+    existing = set(inspect(engine).get_table_names())
+    if (
+        item_partitions
+        and engine.dialect.name == "postgresql"
+        and ITEMS_TABLE not in existing
+    ):
+        with engine.begin() as connection:
+            create_with_partitioned_items(
+                connection,
+                [table for table in tables if table.name not in existing],
+                item_partitions,
+            )
+    else:
+        if item_partitions and ITEMS_TABLE not in existing:
+            logger.warning(
+                "Partitioning needs PostgreSQL; %s is created unpartitioned",
+                ITEMS_TABLE,
+            )
+        Base.metadata.create_all(bind=engine, tables=tables)
+    if shard is not None:
+        reserve_id_range(engine, shard)
+    return [table.name for table in tables if table.name not in existing]
+
+
+def main():
+    """Bring the configured database up to date."""
+    parser = argparse.ArgumentParser(description="Create missing database tables.")
+    parser.add_argument(
+        "--item-partitions",
+        type=int,
+        default=None,
+        help="hash-partition a new clothing_items table by user_id (PostgreSQL)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    databases = [("primary", get_engine(), None)] + [
+        (f"shard {shard}", engine, shard)
+        for shard, engine in enumerate(shard_map.shards)
+    ]
+    for name, engine, shard in databases:
+        created = migrate(engine, shard, args.item_partitions)
+        if created:
+            logger.info("Created tables on %s: %s", name, ", ".join(created))
+        else:
+            logger.info("Schema of %s is up to date", name)
+
+
+if __name__ == "__main__":
+    main()
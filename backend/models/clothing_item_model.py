@@ -2,7 +2,16 @@
 ClothingItem model for the Closet Management Application.
 """
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.orm import mapped_column, relationship
 
 from .abstract_base_model import AbstractBaseModel
@@ -27,11 +36,24 @@ class ClothingItemModel(AbstractBaseModel):
     price = mapped_column(Float, nullable=True)
     purchase_date = mapped_column(DateTime, nullable=True)
     image_path = mapped_column(String(500), nullable=True)
-    user_id = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    # Seasons the item is worn in, e.g. ["spring", "summer"]
+    seasons = mapped_column(JSON, nullable=True)
+    # Wear history, updated whenever an outfit containing the item is worn
+    wear_count = mapped_column(Integer, nullable=False, default=0)
+    last_worn_at = mapped_column(DateTime, nullable=True)
+    # Dominant image colors in CIELAB, packed by the color service
+    color_palette = mapped_column(LargeBinary, nullable=True)
+    # 64-bit perceptual hash of the image as hex, used to find duplicates
+    image_hash = mapped_column(String(16), nullable=True)
+    user_id = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
     # Relationships
     user = relationship("User", back_populates="clothing_items", lazy="select")
 
+    # Items are identified by ID and owner, so updates and deletes also name
+    # the partition when the table is hash-partitioned by user_id
+    __mapper_args__ = {"primary_key": [id, user_id]}
+
     def __repr__(self) -> str:
         """
         String representation of the ClothingItem instance.
@@ -0,0 +1,76 @@
+"""
+Collection models for the Closet Management Application.
+"""
+
+from sqlalchemy import JSON, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import mapped_column
+
+from .abstract_base_model import AbstractBaseModel
+
+
+class CollectionModel(AbstractBaseModel):
+    """
+    CollectionModel model representing a smart collection of clothing items.
+    Membership is defined by rules over clothing item fields.
+    """
+
+    __tablename__ = "collections"
+
+    # Primary key
+    id = mapped_column(Integer, primary_key=True, index=True)
+
+    # Fields
+    name = mapped_column(String(255), nullable=False)
+    description = mapped_column(Text, nullable=True)
+    rules = mapped_column(JSON, nullable=False, default=list)
+    user_id = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the Collection instance.
+
+        Returns:
+            str: String representation of the Collection
+        """
+        return (
+            f"<CollectionModel("
+            f"id={getattr(self, 'id', 'N/A')}, "
+            f"name='{getattr(self, 'name', 'N/A')}', "
+            f"user_id={getattr(self, 'user_id', 'N/A')}"
+            f")>"
+        )
+
+
+class CollectionItemModel(AbstractBaseModel):
+    """
+    CollectionItemModel model storing the materialized membership of a collection.
+    """
+
+    __tablename__ = "collection_items"
+
+    # Composite primary key, so opening a collection is an index range scan
+    collection_id = mapped_column(
+        Integer,
+        ForeignKey("collections.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    clothing_item_id = mapped_column(
+        Integer,
+        ForeignKey("clothing_items.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        """
+        String representation of the CollectionItem instance.
+
+        Returns:
+            str: String representation of the CollectionItem
+        """
+        return (
+            f"<CollectionItemModel("
+            f"collection_id={getattr(self, 'collection_id', 'N/A')}, "
+            f"clothing_item_id={getattr(self, 'clothing_item_id', 'N/A')}"
+            f")>"
+        )
@@ -0,0 +1,59 @@
+"""
+Job model for the Closet Management Application.
+"""
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import mapped_column
+
+from .abstract_base_model import AbstractBaseModel
+
+# Job statuses
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class JobModel(AbstractBaseModel):
+    """
+    JobModel model representing a unit of background work.
+    Workers claim due jobs and hold them with a lease until they finish.
+    """
+
+    __tablename__ = "jobs"
+    # Workers look for due jobs by status and run time
+    __table_args__ = (Index("ix_jobs_status_run_at", "status", "run_at"),)
+
+    # Primary key
+    id = mapped_column(Integer, primary_key=True, index=True)
+
+    # Fields
+    kind = mapped_column(String(100), nullable=False)
+    payload = mapped_column(JSON, nullable=False, default=dict)
+    status = mapped_column(String(20), nullable=False, default=JOB_QUEUED)
+    attempts = mapped_column(Integer, nullable=False, default=0)
+    max_attempts = mapped_column(Integer, nullable=False)
+    # Earliest time (UTC) the job may run, pushed back on every retry
+    run_at = mapped_column(DateTime, nullable=False)
+    # Worker holding the job and when (UTC) its lease expires
+    locked_by = mapped_column(String(255), nullable=True)
+    locked_until = mapped_column(DateTime, nullable=True)
+    result = mapped_column(JSON, nullable=True)
+    last_error = mapped_column(Text, nullable=True)
+    user_id = mapped_column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the Job instance.
+
+        Returns:
+            str: String representation of the Job
+        """
+        return (
+            f"<JobModel("
+            f"id={getattr(self, 'id', 'N/A')}, "
+            f"kind='{getattr(self, 'kind', 'N/A')}', "
+            f"status='{getattr(self, 'status', 'N/A')}', "
+            f"attempts={getattr(self, 'attempts', 'N/A')}"
+            f")>"
+        )
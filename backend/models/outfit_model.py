@@ -0,0 +1,103 @@
+"""
+Outfit models for the Closet Management Application.
+"""
+
+from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy.ext.orderinglist import ordering_list
+from sqlalchemy.orm import mapped_column, relationship
+
+from .abstract_base_model import AbstractBaseModel
+from .clothing_item_model import ClothingItemModel
+
+
+class OutfitModel(AbstractBaseModel):
+    """
+    OutfitModel model representing a user's outfit made up of clothing items.
+    """
+
+    __tablename__ = "outfits"
+
+    # Primary key
+    id = mapped_column(Integer, primary_key=True, index=True)
+
+    # Fields
+    name = mapped_column(String(255), nullable=False)
+    description = mapped_column(Text, nullable=True)
+    user_id = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    # Relationships
+    # Items are kept in order; ordering_list keeps the position column in sync
+    items = relationship(
+        "OutfitItemModel",
+        back_populates="outfit",
+        order_by="OutfitItemModel.position",
+        collection_class=ordering_list("position"),
+        cascade="all, delete-orphan",
+        lazy="select",
+    )
+
+    def __repr__(self) -> str:
+        """
+        String representation of the Outfit instance.
+
+        Returns:
+            str: String representation of the Outfit
+        """
+        return (
+            f"<OutfitModel("
+            f"id={getattr(self, 'id', 'N/A')}, "
+            f"name='{getattr(self, 'name', 'N/A')}', "
+            f"user_id={getattr(self, 'user_id', 'N/A')}"
+            f")>"
+        )
+
+
+class OutfitItemModel(AbstractBaseModel):
+    """
+    OutfitItemModel model representing a clothing item placed in an outfit.
+    Stores the layout metadata (position, rotation and layer) for the item.
+    """
+
+    __tablename__ = "outfit_items"
+
+    # Primary key
+    id = mapped_column(Integer, primary_key=True, index=True)
+
+    # Fields
+    outfit_id = mapped_column(
+        Integer,
+        ForeignKey("outfits.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    clothing_item_id = mapped_column(
+        Integer,
+        ForeignKey("clothing_items.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    position = mapped_column(Integer, nullable=False, default=0)
+    x = mapped_column(Float, nullable=False, default=0.0)
+    y = mapped_column(Float, nullable=False, default=0.0)
+    rotation = mapped_column(Float, nullable=False, default=0.0)
+    layer = mapped_column(Integer, nullable=False, default=0)
+
+    # Relationships
+    outfit = relationship("OutfitModel", back_populates="items", lazy="select")
+    clothing_item = relationship(ClothingItemModel, lazy="select")
+
+    def __repr__(self) -> str:
+        """
+        String representation of the OutfitItem instance.
+
+        Returns:
+            str: String representation of the OutfitItem
+        """
+        return (
+            f"<OutfitItemModel("
+            f"id={getattr(self, 'id', 'N/A')}, "
+            f"outfit_id={getattr(self, 'outfit_id', 'N/A')}, "
+            f"clothing_item_id={getattr(self, 'clothing_item_id', 'N/A')}, "
+            f"position={getattr(self, 'position', 'N/A')}"
+            f")>"
+        )
@@ -0,0 +1,41 @@
+"""
+User shard model for the Closet Management Application.
+"""
+
+from sqlalchemy import Boolean, Integer, String
+from sqlalchemy.orm import mapped_column
+
+from .abstract_base_model import AbstractBaseModel
+
+
+class UserShardModel(AbstractBaseModel):
+    """
+    UserShardModel model mapping a user to the shard holding their rows.
+    The table lives in the primary database only; it allocates the user IDs
+    used on every shard and finds users by email when they log in.
+    """
+
+    __tablename__ = "user_shards"
+
+    # Primary key, the ID of the user on their shard
+    user_id = mapped_column(Integer, primary_key=True)
+
+    # Fields
+    email = mapped_column(String(255), nullable=False, unique=True)
+    shard = mapped_column(Integer, nullable=False)
+    # Set while the user's rows are copied to another shard
+    moving = mapped_column(Boolean, nullable=False, default=False)
+
+    def __repr__(self) -> str:
+        """
+        String representation of the UserShard instance.
+
+        Returns:
+            str: String representation of the UserShard
+        """
+        return (
+            f"<UserShardModel("
+            f"user_id={getattr(self, 'user_id', 'N/A')}, "
+            f"shard={getattr(self, 'shard', 'N/A')}"
+            f")>"
+        )
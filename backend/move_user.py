@@ -0,0 +1,156 @@
+"""
+Move a user's rows to another shard while the application keeps running:
+
+    python -m backend.move_user 42 --to-shard 3
+
+Requests of the user are answered with 503 and Retry-After while the rows
+are copied, which takes a moment for a typical closet; other users are not
+affected. The copy commits on the new shard before the shard map points
+there, and the old rows are deleted only after that, so an interrupted move
+never loses rows. Rows it leaves behind on a shard are replaced if the user
+moves there again.
+"""
+
+import argparse
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Table, delete, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.elements import ColumnElement
+
+from backend.config.sharding import ShardMap, shard_map
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.collection_model import CollectionItemModel, CollectionModel
+from backend.models.job_model import JobModel
+from backend.models.outfit_model import OutfitItemModel, OutfitModel
+from backend.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait after turning the user's requests away, so requests that
+# were already routed to the old shard finish before the copy
+SETTLE_SECONDS = 2.0
+
+
+def user_rows(user_id: int) -> List[Tuple[Table, ColumnElement]]:
+    """
+    Get the tables holding a user's rows, parents first, each with the
+    condition selecting the user's rows.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        Tables and conditions
+    """
+    outfits = select(OutfitModel.id).where(OutfitModel.user_id == user_id)
+    collections = select(CollectionModel.id).where(CollectionModel.user_id == user_id)
+    return [
+        (User.__table__, User.id == user_id),
+        (ClothingItemModel.__table__, ClothingItemModel.user_id == user_id),
+        (OutfitModel.__table__, OutfitModel.user_id == user_id),
+        (OutfitItemModel.__table__, OutfitItemModel.outfit_id.in_(outfits)),
+        (CollectionModel.__table__, CollectionModel.user_id == user_id),
+        (
+            CollectionItemModel.__table__,
+            CollectionItemModel.collection_id.in_(collections),
+        ),
+        (JobModel.__table__, JobModel.user_id == user_id),
+    ]
+
+
+def delete_user_rows(connection: Connection, user_id: int) -> None:
+    """Delete a user's rows from a shard, children first."""
+    for table, condition in reversed(user_rows(user_id)):
+        connection.execute(delete(table).where(condition))
+
+
+def move_user(
+    user_id: int,
+    target: int,
+    shards: Optional[ShardMap] = None,
+    settle: float = SETTLE_SECONDS,
+) -> Dict[str, int]:
+    """
+    Move a user's rows to another shard.
+
+    Args:
+        user_id: ID of the user
+        target: Index of the shard to move to
+        shards: Shard map, defaults to the shared one
+        settle: Seconds to wait for requests already routed to the old shard
+
+    Returns:
+        Number of rows copied per table
+
+    Raises:
+        ValueError: If the user or the shard does not exist, the user is
+            already on the shard, or the user's IDs are taken on the shard
+    """
+    shards = shards if shards is not None else shard_map
+    entry = shards.get_user(user_id)
+    if entry is None:
+        raise ValueError(f"User {user_id} is not in the shard map")
+    if not 0 <= target < len(shards.shards):
+        raise ValueError(f"Shard {target} does not exist")
+    if entry.shard == target:
+        raise ValueError(f"User {user_id} is already on shard {target}")
+
+    source = shards.shards[entry.shard]
+    shards.set_shard(user_id, entry.shard, moving=True)
+    try:
+        time.sleep(settle)
+        copied = {}
+        with source.connect() as reader, shards.shards[target].begin() as writer:
+            # Leftovers of an interrupted move are replaced
+            delete_user_rows(writer, user_id)
+            for table, condition in user_rows(user_id):
+                rows = [
+                    row._asdict()
+                    for row in reader.execute(select(table).where(condition))
+                ]
+                if rows:
+                    writer.execute(insert(table), rows)
+                copied[table.name] = len(rows)
+    except IntegrityError as e:
+        shards.set_shard(user_id, entry.shard)
+        raise ValueError(
+            f"IDs of user {user_id} are already used on shard {target}: {e.orig}"
+        )
+    except BaseException:
+        shards.set_shard(user_id, entry.shard)
+        raise
+
+    shards.set_shard(user_id, target)
+    with source.begin() as connection:
+        delete_user_rows(connection, user_id)
+    return copied
+
+
+def main():
+    """Move a user to another shard."""
+    parser = argparse.ArgumentParser(description="Move a user to another shard.")
+    parser.add_argument("user_id", type=int)
+    parser.add_argument("--to-shard", type=int, required=True)
+    parser.add_argument("--settle", type=float, default=SETTLE_SECONDS)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    start = time.perf_counter()
+    copied = move_user(args.user_id, args.to_shard, settle=args.settle)
+    logger.info(
+        "Moved user %s to shard %s in %.2f s: %s",
+        args.user_id,
+        args.to_shard,
+        time.perf_counter() - start,
+        ", ".join(f"{count} {table}" for table, count in copied.items()),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+Repositories for clothing items.
+ItemRepository is what the item, upload and duplicate services use to load
+and store items. SQLAlchemyItemRepository keeps them in the database and
+maintains smart collection membership alongside; InMemoryItemRepository
+keeps them in a dict with a sorted list of item IDs per user, for the
+ephemeral demo mode and for benchmarks of the services without a database.
+"""
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.config.settings import settings
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.outfit_model import OutfitItemModel
+from backend.services.collection_membership import (
+    refresh_item_membership,
+    remove_item_membership,
+)
+from backend.services.color_service import enqueue_palette_extraction
+
+
+class ItemRepository(ABC):
+    """Loads and stores the clothing items of users."""
+
+    @abstractmethod
+    def get(self, item_id: int, user_id: int) -> Optional[ClothingItemModel]:
+        """
+        Get an item of a user.
+
+        Args:
+            item_id: ID of the item
+            user_id: ID of the user who owns the item
+
+        Returns:
+            The item, or None if the user has no such item
+        """
+
+    @abstractmethod
+    def list_for_user(self, user_id: int) -> List[ClothingItemModel]:
+        """
+        Get all items of a user, in the order they were created.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            The user's items
+        """
+
+    @abstractmethod
+    def image_hashes(self, user_id: int) -> List[Tuple[int, str]]:
+        """
+        Get the image hashes of a user's items that have one.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Item IDs and hex image hashes
+        """
+
+    @abstractmethod
+    def add(self, item: ClothingItemModel) -> ClothingItemModel:
+        """
+        Store a new item and give it an ID.
+
+        Args:
+            item: The new item
+
+        Returns:
+            The stored item
+        """
+
+    @abstractmethod
+    def update(self, item: ClothingItemModel) -> ClothingItemModel:
+        """
+        Store changes to fields of an item that collection rules may refer to.
+
+        Args:
+            item: The changed item
+
+        Returns:
+            The stored item
+        """
+
+    @abstractmethod
+    def save(self, item: ClothingItemModel) -> ClothingItemModel:
+        """
+        Store changes to other fields of an item, such as its image.
+
+        Args:
+            item: The changed item
+
+        Returns:
+            The stored item
+        """
+
+    @abstractmethod
+    def delete(self, item: ClothingItemModel) -> None:
+        """
+        Delete an item.
+
+        Args:
+            item: The item to delete
+        """
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard changes to items that were not stored yet."""
+
+    @abstractmethod
+    def extract_palette_later(
+        self, item_id: int, user_id: int, file_data: bytes
+    ) -> None:
+        """
+        Have the dominant colors of an item's new image extracted in the
+        background, by a worker once the image is stored.
+
+        Args:
+            item_id: ID of the item
+            user_id: ID of the user who owns the item
+            file_data: Contents of the image file
+        """
+
+
+class SQLAlchemyItemRepository(ItemRepository):
+    """Items in the database of a session."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the repository.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def get(self, item_id: int, user_id: int) -> Optional[ClothingItemModel]:
+        return (
+            self.db_session.query(ClothingItemModel)
+            .filter(ClothingItemModel.id == item_id)
+            .filter(ClothingItemModel.user_id == user_id)
+            .first()
+        )
+
+    def list_for_user(self, user_id: int) -> List[ClothingItemModel]:
+        return (
+            self.db_session.query(ClothingItemModel)
+            .filter(ClothingItemModel.user_id == user_id)
+            .all()
+        )
+
+    def image_hashes(self, user_id: int) -> List[Tuple[int, str]]:
+        return (
+            self.db_session.query(ClothingItemModel.id, ClothingItemModel.image_hash)
+            .filter(
+                ClothingItemModel.user_id == user_id,
+                ClothingItemModel.image_hash.isnot(None),
+            )
+            .all()
+        )
+
+    def add(self, item: ClothingItemModel) -> ClothingItemModel:
+        self.db_session.add(item)
+        self.db_session.flush()
+        refresh_item_membership(self.db_session, item)
+        self.db_session.commit()
+        self.db_session.refresh(item)
+        return item
+
+    def update(self, item: ClothingItemModel) -> ClothingItemModel:
+        # Only the changed item is re-checked against each collection
+        refresh_item_membership(self.db_session, item)
+        return self.save(item)
+
+    def save(self, item: ClothingItemModel) -> ClothingItemModel:
+        self.db_session.commit()
+        self.db_session.refresh(item)
+        return item
+
+    def delete(self, item: ClothingItemModel) -> None:
+        remove_item_membership(self.db_session, item.id)
+        # Foreign keys may be off (SQLite) or absent (partitioned items), so
+        # the ON DELETE CASCADE of outfit items cannot be relied on
+        self.db_session.query(OutfitItemModel).filter(
+            OutfitItemModel.clothing_item_id == item.id
+        ).delete(synchronize_session=False)
+        self.db_session.delete(item)
+        self.db_session.commit()
+
+    def rollback(self) -> None:
+        self.db_session.rollback()
+
+    def extract_palette_later(
+        self, item_id: int, user_id: int, file_data: bytes
+    ) -> None:
+        enqueue_palette_extraction(self.db_session, item_id, user_id)
+
+
+class InMemoryItemRepository(ItemRepository):
+    """
+    Items in process memory, indexed by ID and by user. Nothing is persisted
+    and there are no collections, so membership is not maintained; colors
+    are not extracted either. Items are stored as they are, so changes made
+    to a loaded item are visible before they are stored and cannot be rolled
+    back.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: Dict[int, ClothingItemModel] = {}
+        # Sorted item IDs of each user, and the user each item is listed under
+        self._user_items: Dict[int, List[int]] = {}
+        self._owners: Dict[int, int] = {}
+        # IDs are handed out above the highest stored one
+        self._next_id = 1
+
+    def _unlist(self, item_id: int) -> None:
+        owner = self._owners.pop(item_id)
+        item_ids = self._user_items[owner]
+        del item_ids[bisect.bisect_left(item_ids, item_id)]
+
+    def _list(self, item: ClothingItemModel) -> None:
+        bisect.insort(self._user_items.setdefault(item.user_id, []), item.id)
+        self._owners[item.id] = item.user_id
+
+    def get(self, item_id: int, user_id: int) -> Optional[ClothingItemModel]:
+        item = self._items.get(item_id)
+        if item is None or self._owners.get(item_id) != user_id:
+            return None
+        return item
+
+    def list_for_user(self, user_id: int) -> List[ClothingItemModel]:
+        with self._lock:
+            return [self._items[i] for i in self._user_items.get(user_id, [])]
+
+    def image_hashes(self, user_id: int) -> List[Tuple[int, str]]:
+        return [
+            (item.id, item.image_hash)
+            for item in self.list_for_user(user_id)
+            if item.image_hash is not None
+        ]
+
+    def add(self, item: ClothingItemModel) -> ClothingItemModel:
+        now = datetime.now()
+        if item.wear_count is None:
+            item.wear_count = 0
+        item.created_at = item.created_at or now
+        item.updated_at = item.updated_at or now
+        with self._lock:
+            if item.id is None:
+                item.id = self._next_id
+            elif item.id in self._items:
+                raise ValueError(f"Item {item.id} already exists")
+            self._next_id = max(self._next_id, item.id + 1)
+            self._items[item.id] = item
+            self._list(item)
+        return item
+
+    def update(self, item: ClothingItemModel) -> ClothingItemModel:
+        return self.save(item)
+
+    def save(self, item: ClothingItemModel) -> ClothingItemModel:
+        item.updated_at = datetime.now()
+        with self._lock:
+            if self._owners.get(item.id) != item.user_id:
+                self._unlist(item.id)
+                self._list(item)
+        return item
+
+    def delete(self, item: ClothingItemModel) -> None:
+        with self._lock:
+            if self._items.pop(item.id, None) is not None:
+                self._unlist(item.id)
+
+    def rollback(self) -> None:
+        pass
+
+    def extract_palette_later(
+        self, item_id: int, user_id: int, file_data: bytes
+    ) -> None:
+        pass
+
+    def clear(self) -> None:
+        """Forget every item."""
+        with self._lock:
+            self._items.clear()
+            self._user_items.clear()
+            self._owners.clear()
+
+
+# Items of the demo mode, kept for the life of the process
+memory_items = InMemoryItemRepository()
+
+
+def item_repository(db_session: Session) -> ItemRepository:
+    """
+    Get the item repository of the configured storage backend.
+
+    Args:
+        db_session: SQLAlchemy database session, for the database backend
+
+    Returns:
+        The repository
+    """
+    if settings.storage_backend == "memory":
+        return memory_items
+    return SQLAlchemyItemRepository(db_session)
@@ -0,0 +1,178 @@
+"""
+Repositories for user accounts.
+UserRepository is what the auth service uses to load and store users, in the
+database with SQLAlchemyUserRepository or in process memory with
+InMemoryUserRepository, for the ephemeral demo mode and for benchmarks.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.config.settings import settings
+from backend.models.user import User as UserModel
+
+
+class UserRepository(ABC):
+    """Loads and stores user accounts."""
+
+    @abstractmethod
+    def get(self, user_id: int) -> Optional[UserModel]:
+        """
+        Get a user by ID.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            The user, or None if there is no such user
+        """
+
+    @abstractmethod
+    def get_by_email(self, email: str) -> Optional[UserModel]:
+        """
+        Get a user by email.
+
+        Args:
+            email: Email of the user
+
+        Returns:
+            The user, or None if there is no such user
+        """
+
+    @abstractmethod
+    def add(self, user: UserModel) -> UserModel:
+        """
+        Store a new user, giving them an ID unless they have one.
+
+        Args:
+            user: The new user
+
+        Returns:
+            The stored user
+        """
+
+    @abstractmethod
+    def save(self, user: UserModel) -> UserModel:
+        """
+        Store changes to a user.
+
+        Args:
+            user: The changed user
+
+        Returns:
+            The stored user
+        """
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard changes to users that were not stored yet."""
+
+
+class SQLAlchemyUserRepository(UserRepository):
+    """Users in the database of a session."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the repository.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def get(self, user_id: int) -> Optional[UserModel]:
+        return self.db_session.query(UserModel).filter(UserModel.id == user_id).first()
+
+    def get_by_email(self, email: str) -> Optional[UserModel]:
+        return self.db_session.query(UserModel).filter(UserModel.email == email).first()
+
+    def add(self, user: UserModel) -> UserModel:
+        self.db_session.add(user)
+        return self.save(user)
+
+    def save(self, user: UserModel) -> UserModel:
+        self.db_session.commit()
+        self.db_session.refresh(user)
+        return user
+
+    def rollback(self) -> None:
+        self.db_session.rollback()
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    Users in process memory, indexed by ID and by email. Nothing is
+    persisted, and changes made to a loaded user cannot be rolled back.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users: Dict[int, UserModel] = {}
+        self._emails: Dict[str, int] = {}
+        # IDs are handed out above the highest stored one
+        self._next_id = 1
+
+    def get(self, user_id: int) -> Optional[UserModel]:
+        return self._users.get(user_id)
+
+    def get_by_email(self, email: str) -> Optional[UserModel]:
+        user_id = self._emails.get(email)
+        return None if user_id is None else self._users.get(user_id)
+
+    def add(self, user: UserModel) -> UserModel:
+        """
+        Store a new user, giving them an ID unless they have one.
+
+        Raises:
+            ValueError: If the email or the ID is taken
+        """
+        now = datetime.now()
+        user.created_at = user.created_at or now
+        user.updated_at = user.updated_at or now
+        with self._lock:
+            if user.email in self._emails:
+                raise ValueError("User with this email already exists")
+            if user.id is None:
+                user.id = self._next_id
+            elif user.id in self._users:
+                raise ValueError(f"User {user.id} already exists")
+            self._next_id = max(self._next_id, user.id + 1)
+            self._users[user.id] = user
+            self._emails[user.email] = user.id
+        return user
+
+    def save(self, user: UserModel) -> UserModel:
+        user.updated_at = datetime.now()
+        return user
+
+    def rollback(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        """Forget every user."""
+        with self._lock:
+            self._users.clear()
+            self._emails.clear()
+
+
+# Users of the demo mode, kept for the life of the process
+memory_users = InMemoryUserRepository()
+
+
+def user_repository(db_session: Session) -> UserRepository:
+    """
+    Get the user repository of the configured storage backend.
+
+    Args:
+        db_session: SQLAlchemy database session, for the database backend
+
+    Returns:
+        The repository
+    """
+    if settings.storage_backend == "memory":
+        return memory_users
+    return SQLAlchemyUserRepository(db_session)
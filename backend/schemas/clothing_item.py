@@ -3,13 +3,16 @@ Schema definitions for ClothingItem models.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
 
 from backend.models.clothing_item_model import ClothingItemModel
 
+# Seasons an item can be tagged with, matching the frontend ItemSeason values
+ItemSeason = Literal["spring", "summer", "fall", "winter", "allSeason"]
+
 
 class ClothingItemCreate(BaseModel):
     """
@@ -37,6 +40,9 @@ class ClothingItemCreate(BaseModel):
     purchase_date: Optional[datetime] = Field(
         None, description="Date when the item was purchased"
     )
+    seasons: Optional[List[ItemSeason]] = Field(
+        None, description="Seasons the item is worn in"
+    )
     image_data: Optional[str] = Field(None, description="Image Data in base 64")
     image_name: Optional[str] = Field(
         None,
@@ -55,6 +61,7 @@ class ClothingItemCreate(BaseModel):
             "color": self.color,
             "price": self.price,
             "purchase_date": self.purchase_date,
+            "seasons": self.seasons,
             "image_path": image_data,
         }
 
@@ -83,8 +90,52 @@ class ClothingItem(ClothingItemCreate):
     # Required fields (inherited from ClothingItemCreate)
     id: int = Field(..., description="Unique identifier for the clothing item")
 
+    # Wear history, maintained when outfits are worn
+    wear_count: int = Field(0, description="Number of times the item was worn")
+    last_worn_at: Optional[datetime] = Field(
+        None, description="Timestamp when the item was last worn"
+    )
+
+    # Set when an uploaded image looks like the image of another item
+    possible_duplicates: List[int] = Field(
+        default_factory=list,
+        description="IDs of items whose image is a near-duplicate of this upload",
+    )
+
     # Timestamps (inherited from base model)
     created_at: datetime = Field(..., description="Timestamp when the item was created")
     updated_at: datetime = Field(
         ..., description="Timestamp when the item was last updated"
     )
+
+
+class ColorMatch(BaseModel):
+    """
+    Schema for a clothing item matched by color.
+    Image data is not included; fetch the item to get its image.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    item: ClothingItem = Field(..., description="The matching clothing item")
+    delta_e: float = Field(
+        ..., description="CIEDE2000 distance to the requested color (lower is closer)"
+    )
+
+
+class DuplicateGroup(BaseModel):
+    """
+    Schema for a group of clothing items with near-identical images.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    item_ids: List[int] = Field(
+        ..., description="IDs of the clothing items that look like the same photo"
+    )
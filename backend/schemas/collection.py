@@ -0,0 +1,95 @@
+"""
+Schema definitions for Collection models.
+"""
+
+from datetime import datetime
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+from pydantic.config import ConfigDict
+
+RuleField = Literal[
+    "name", "description", "category", "size", "color", "price", "purchase_date"
+]
+RuleOperator = Literal["eq", "ne", "lt", "lte", "gt", "gte", "in", "contains"]
+
+# Text fields; substring matching only works on these, and ordering them would
+# depend on the database collation, which rules checked in Python cannot follow
+TEXT_RULE_FIELDS = frozenset({"name", "description", "category", "size", "color"})
+ORDERING_OPERATORS = frozenset({"lt", "lte", "gt", "gte"})
+
+
+class CollectionRule(BaseModel):
+    """
+    Schema for a single smart collection rule.
+    A rule is a predicate over a clothing item field, e.g. price lt 100.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    field: RuleField = Field(..., description="Clothing item field to test")
+    op: RuleOperator = Field(..., description="Comparison operator")
+    value: Any = Field(..., description="Value to compare the field against")
+
+    @model_validator(mode="after")
+    def check_operator_fits_field(self) -> "CollectionRule":
+        """Reject operators that do not apply to the type of the field."""
+        if self.op == "contains" and self.field not in TEXT_RULE_FIELDS:
+            raise ValueError(
+                f"'contains' only applies to text fields, not '{self.field}'"
+            )
+        if self.op in ORDERING_OPERATORS and self.field in TEXT_RULE_FIELDS:
+            raise ValueError(
+                f"'{self.op}' does not apply to the text field '{self.field}'"
+            )
+        return self
+
+
+class CollectionCreate(BaseModel):
+    """
+    Schema for creating a new Collection.
+    All rules must match for an item to be a member of the collection.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    # Required fields
+    name: str = Field(..., description="Name of the collection", min_length=1)
+
+    # Optional fields
+    description: Optional[str] = Field(
+        None, description="Description of the collection"
+    )
+    rules: List[CollectionRule] = Field(
+        default_factory=list, description="Rules that items must all match"
+    )
+
+
+class Collection(CollectionCreate):
+    """
+    Schema for representing a complete Collection.
+    This schema includes all fields including the ID and timestamps.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    # Required fields
+    id: int = Field(..., description="Unique identifier for the collection")
+    user_id: int = Field(..., description="ID of the user who owns this collection")
+
+    # Timestamps (inherited from base model)
+    created_at: datetime = Field(
+        ..., description="Timestamp when the collection was created"
+    )
+    updated_at: datetime = Field(
+        ..., description="Timestamp when the collection was last updated"
+    )
@@ -0,0 +1,48 @@
+"""
+Schema definitions for Job models.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+from pydantic.config import ConfigDict
+
+
+class Job(BaseModel):
+    """
+    Schema for representing a background job and its status.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    # Required fields
+    id: int = Field(..., description="Unique identifier for the job")
+    kind: str = Field(..., description="Kind of work the job performs")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(
+        ..., description="Current status of the job"
+    )
+    attempts: int = Field(..., description="Number of times the job was started")
+    max_attempts: int = Field(..., description="Attempts before the job is failed")
+    run_at: datetime = Field(..., description="Earliest time (UTC) the job may run")
+
+    # Optional fields
+    payload: Dict[str, Any] = Field(
+        default_factory=dict, description="Arguments for the job"
+    )
+    result: Optional[Any] = Field(None, description="Result of a succeeded job")
+    last_error: Optional[str] = Field(
+        None, description="Error of the most recent failed attempt"
+    )
+    user_id: Optional[int] = Field(
+        None, description="ID of the user the job belongs to, if any"
+    )
+
+    # Timestamps (inherited from base model)
+    created_at: datetime = Field(..., description="Timestamp when the job was created")
+    updated_at: datetime = Field(
+        ..., description="Timestamp when the job was last updated"
+    )
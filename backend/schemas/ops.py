@@ -0,0 +1,56 @@
+"""
+Schema definitions for operations diagnostics.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from pydantic.config import ConfigDict
+
+
+class PoolStats(BaseModel):
+    """
+    Schema for the configuration, usage and history of the connection pool.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    # Configuration
+    pool_size: Optional[int] = Field(None, description="Connections kept open")
+    max_overflow: int = Field(..., description="Connections allowed beyond the pool")
+    pool_timeout: float = Field(..., description="Seconds a checkout may wait")
+    pool_recycle: int = Field(
+        ..., description="Seconds before a connection is replaced, -1 for never"
+    )
+    pool_pre_ping: bool = Field(..., description="Whether checkouts test connections")
+
+    # Current usage
+    checked_out: Optional[int] = Field(None, description="Connections in use now")
+    checked_in: Optional[int] = Field(None, description="Idle connections now")
+    overflow: Optional[int] = Field(None, description="Overflow connections open now")
+
+    # Since start or the last reset
+    checkouts: int = Field(..., description="Connections handed out")
+    timeouts: int = Field(..., description="Checkouts that gave up waiting")
+    connects: int = Field(..., description="New connections opened")
+    invalidations: int = Field(..., description="Connections discarded after errors")
+    soft_invalidations: int = Field(
+        ..., description="Connections marked for replacement on return"
+    )
+    peak_checked_out: int = Field(..., description="Most connections in use at once")
+    peak_overflow: int = Field(..., description="Most overflow connections at once")
+    wait_seconds_total: float = Field(..., description="Total checkout wait")
+    wait_seconds_max: float = Field(..., description="Longest checkout wait")
+
+    # Over recent checkouts
+    wait_seconds_p50: float = Field(..., description="Median checkout wait")
+    wait_seconds_p95: float = Field(..., description="95th percentile checkout wait")
+    connection_age_seconds_p50: float = Field(
+        ..., description="Median age of connections when handed out"
+    )
+    connection_age_seconds_max: float = Field(
+        ..., description="Oldest connection handed out"
+    )
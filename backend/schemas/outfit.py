@@ -0,0 +1,117 @@
+"""
+Schema definitions for Outfit models.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+from pydantic.config import ConfigDict
+
+from backend.schemas.clothing_item import ClothingItem
+
+
+class OutfitItemCreate(BaseModel):
+    """
+    Schema for placing a clothing item in an outfit.
+    The order of these entries in an outfit defines the item position.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    # Required fields
+    clothing_item_id: int = Field(..., description="ID of the clothing item")
+
+    # Layout metadata
+    x: float = Field(0.0, description="Horizontal position of the item on the canvas")
+    y: float = Field(0.0, description="Vertical position of the item on the canvas")
+    rotation: float = Field(0.0, description="Rotation of the item in degrees")
+    layer: int = Field(0, description="Layering order of the item (higher is on top)")
+
+
+class OutfitItem(OutfitItemCreate):
+    """
+    Schema for representing a clothing item placed in an outfit.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    position: int = Field(..., description="Position of the item within the outfit")
+    clothing_item: ClothingItem = Field(..., description="The placed clothing item")
+
+
+class OutfitCreate(BaseModel):
+    """
+    Schema for creating a new Outfit.
+    This schema is used for API requests when creating or updating outfits.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    # Required fields
+    name: str = Field(..., description="Name of the outfit", min_length=1)
+
+    # Optional fields
+    description: Optional[str] = Field(None, description="Description of the outfit")
+    items: List[OutfitItemCreate] = Field(
+        default_factory=list, description="Ordered clothing items in the outfit"
+    )
+
+
+class Outfit(BaseModel):
+    """
+    Schema for representing a complete Outfit.
+    This schema includes all fields including the ID, timestamps and items.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    # Required fields
+    id: int = Field(..., description="Unique identifier for the outfit")
+    name: str = Field(..., description="Name of the outfit")
+    user_id: int = Field(..., description="ID of the user who owns this outfit")
+
+    # Optional fields
+    description: Optional[str] = Field(None, description="Description of the outfit")
+    items: List[OutfitItem] = Field(
+        default_factory=list, description="Ordered clothing items in the outfit"
+    )
+
+    # Timestamps (inherited from base model)
+    created_at: datetime = Field(
+        ..., description="Timestamp when the outfit was created"
+    )
+    updated_at: datetime = Field(
+        ..., description="Timestamp when the outfit was last updated"
+    )
+
+
+class OutfitRecommendation(BaseModel):
+    """
+    Schema for a recommended outfit.
+    Image data is not included; fetch the items to get their images.
+    """
+
+    model_config = ConfigDict(
+        # The key is 'from_attributes' (the new name for orm_mode)
+        from_attributes=True
+    )
+
+    items: List[ClothingItem] = Field(
+        ..., description="Recommended items ordered top, bottom, shoes, outerwear"
+    )
+    score: float = Field(
+        ..., description="Recommendation score between 0 and 1 (higher is better)"
+    )
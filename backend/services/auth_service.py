@@ -1,29 +1,55 @@
 """
 AuthService for handling user authentication operations.
 This service implements user registration, authentication, and token management.
+Passwords hashed with the salted SHA-256 scheme used before passlib are
+verified once more and then rehashed on the next successful login. With
+sharding on, emails are looked up in the shard map, which also allocates
+the IDs of new users, and the user rows live on the users' shards.
 """
 
-import hashlib
-import secrets
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from backend.config.sharding import ShardMap, shard_map
 from backend.models.user import User as UserModel
+from backend.repositories.user_repository import UserRepository, user_repository
 from backend.schemas.user import UserCreate, UserLogin, UserResponse
+from backend.services.password_service import (
+    PasswordHasher,
+    password_hasher,
+    verify_legacy_password,
+)
+
+# Salt stored for passlib hashes, which embed their own salt. Users with any
+# other salt still have a legacy SHA-256 hash.
+EMBEDDED_SALT = ""
 
 
 class AuthService:
     """Service class for handling user authentication operations."""
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        hasher: Optional[PasswordHasher] = None,
+        shards: Optional[ShardMap] = None,
+        users: Optional[UserRepository] = None,
+    ):
         """
         Initialize the AuthService with a database session.
 
         Args:
             db_session: SQLAlchemy database session
+            hasher: Password hasher, defaults to the shared one
+            shards: Shard map, defaults to the shared one
+            users: User repository, defaults to the one of the configured
+                storage backend
         """
         self.db_session = db_session
+        self.hasher = hasher or password_hasher
+        self.shards = shards if shards is not None else shard_map
+        self.users = users if users is not None else user_repository(db_session)
 
     def register_user(self, user_data: UserCreate) -> UserResponse:
         """
@@ -34,33 +60,54 @@ class AuthService:
 
         Returns:
             The created user with all fields
+
+        Raises:
+            ValueError: If a user with the email already exists
+            PasswordHasherBusyError: If too many passwords are being hashed
         """
+        if self.shards.enabled:
+            return self._register_sharded_user(user_data)
+
         # Check if user already exists
-        existing_user = (
-            self.db_session.query(UserModel)
-            .filter(UserModel.email == user_data.email)
-            .first()
-        )
+        existing_user = self.users.get_by_email(user_data.email)
 
         if existing_user:
             raise ValueError("User with this email already exists")
 
-        # Hash the password
-        salt = secrets.token_hex(16)
-        password_hash = hashlib.sha256((user_data.password + salt).encode()).hexdigest()
-
         # Create the model instance
         db_user = UserModel(
             email=user_data.email,
             full_name=user_data.full_name,
-            hashed_password=password_hash,
-            salt=salt,
+            hashed_password=self.hasher.hash(user_data.password),
+            salt=EMBEDDED_SALT,
         )
 
-        # Add to session and commit
-        self.db_session.add(db_user)
-        self.db_session.commit()
-        self.db_session.refresh(db_user)
+        # Store the user
+        self.users.add(db_user)
+
+        # Convert to schema and return
+        return UserResponse.model_validate(db_user)
+
+    def _register_sharded_user(self, user_data: UserCreate) -> UserResponse:
+        """Register a new user in the shard map and on their shard."""
+        hashed_password = self.hasher.hash(user_data.password)
+
+        # The shard map rejects taken emails and allocates the ID
+        user_id, shard = self.shards.add_user(user_data.email)
+        self.shards.bind(self.db_session, shard)
+        db_user = UserModel(
+            id=user_id,
+            email=user_data.email,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+            salt=EMBEDDED_SALT,
+        )
+        try:
+            self.users.add(db_user)
+        except Exception:
+            self.users.rollback()
+            self.shards.remove_user(user_id)
+            raise
 
         # Convert to schema and return
         return UserResponse.model_validate(db_user)
@@ -74,26 +121,43 @@ class AuthService:
 
         Returns:
             The user if authentication is successful, None otherwise
+
+        Raises:
+            PasswordHasherBusyError: If too many passwords are being hashed
+            UserMovingError: If the user's rows are moving to another shard
         """
+        if self.shards.enabled:
+            entry = self.shards.find_user(credentials.email)
+            if entry is None:
+                return None
+            self.shards.use_shard(self.db_session, entry)
+
         # Find user by email
-        db_user = (
-            self.db_session.query(UserModel)
-            .filter(UserModel.email == credentials.email)
-            .first()
-        )
+        db_user = self.users.get_by_email(credentials.email)
 
         if db_user is None:
             return None
 
-        # Hash the provided password with the stored salt
-        password_hash = hashlib.sha256(
-            (credentials.password + db_user.salt).encode()
-        ).hexdigest()
-
         # Check if password matches
-        if password_hash != db_user.hashed_password:
+        if db_user.salt != EMBEDDED_SALT:
+            verified = verify_legacy_password(
+                credentials.password, db_user.salt, db_user.hashed_password
+            )
+            new_hash = self.hasher.hash(credentials.password) if verified else None
+        else:
+            verified, new_hash = self.hasher.verify_and_update(
+                credentials.password, db_user.hashed_password
+            )
+
+        if not verified:
             return None
 
+        # Upgrade legacy hashes and hashes with an outdated cost
+        if new_hash is not None:
+            db_user.hashed_password = new_hash
+            db_user.salt = EMBEDDED_SALT
+            self.users.save(db_user)
+
         # Return user data (excluding sensitive fields)
         return UserResponse.model_validate(db_user)
 
@@ -107,9 +171,8 @@ class AuthService:
         Returns:
             The user if found, None otherwise
         """
-        db_user = (
-            self.db_session.query(UserModel).filter(UserModel.id == user_id).first()
-        )
+        self.shards.route(self.db_session, user_id)
+        db_user = self.users.get(user_id)
 
         if db_user is None:
             return None
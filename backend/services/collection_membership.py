@@ -0,0 +1,178 @@
+"""
+Smart collection rule evaluation and membership maintenance.
+Rules compile to a single SQL WHERE clause for full refreshes, and are evaluated
+in Python against a single changed item for incremental refreshes.
+"""
+
+import operator
+from datetime import datetime, timezone
+from typing import Any, Dict, List, get_args
+
+from sqlalchemy import and_, func, true
+from sqlalchemy.orm import Session
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.collection_model import CollectionItemModel, CollectionModel
+from backend.schemas.collection import RuleField
+
+# Clothing item columns that rules may reference
+RULE_COLUMNS = {
+    field: getattr(ClothingItemModel, field) for field in get_args(RuleField)
+}
+
+# Operators that behave the same on SQL columns and on Python values
+COMPARISONS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+}
+
+
+def _coerce_value(field: str, value: Any) -> Any:
+    """
+    Convert a JSON rule value to the Python type of the referenced column.
+
+    Raises:
+        ValueError: If the value cannot be converted
+    """
+    if isinstance(value, list):
+        return [_coerce_value(field, v) for v in value]
+
+    python_type = RULE_COLUMNS[field].type.python_type
+    if python_type is datetime:
+        if not isinstance(value, datetime):
+            value = datetime.fromisoformat(str(value))
+        # Columns store naive datetimes, so compare in naive UTC
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    return python_type(value)
+
+
+def compile_rules(rules: List[Dict[str, Any]]):
+    """
+    Compile collection rules into a single SQL WHERE clause.
+
+    Args:
+        rules: Collection rules as stored on the collection
+
+    Returns:
+        A SQLAlchemy boolean expression matching items that satisfy all rules
+
+    Raises:
+        ValueError: If a rule value does not fit its field
+    """
+    clauses = []
+    for rule in rules:
+        column = RULE_COLUMNS[rule["field"]]
+        op = rule["op"]
+
+        if op == "contains":
+            value = str(rule["value"]).lower()
+            clauses.append(func.lower(column).contains(value, autoescape=True))
+            continue
+
+        value = _coerce_value(rule["field"], rule["value"])
+        if op == "in":
+            clauses.append(column.in_(value if isinstance(value, list) else [value]))
+        else:
+            clauses.append(COMPARISONS[op](column, value))
+
+    return and_(true(), *clauses)
+
+
+def item_matches_rules(rules: List[Dict[str, Any]], db_item: ClothingItemModel) -> bool:
+    """
+    Check a single clothing item against collection rules without querying.
+    Mirrors compile_rules, including SQL semantics for NULL fields.
+
+    Args:
+        rules: Collection rules as stored on the collection
+        db_item: The clothing item to test
+
+    Returns:
+        True if the item satisfies all rules, False otherwise
+    """
+    for rule in rules:
+        actual = getattr(db_item, rule["field"])
+        op = rule["op"]
+
+        # Comparisons against NULL never match in SQL
+        if actual is None:
+            return False
+
+        if op == "contains":
+            if str(rule["value"]).lower() not in str(actual).lower():
+                return False
+            continue
+
+        value = _coerce_value(rule["field"], rule["value"])
+        if isinstance(actual, datetime) and actual.tzinfo is not None:
+            actual = actual.astimezone(timezone.utc).replace(tzinfo=None)
+
+        if op == "in":
+            matched = actual in (value if isinstance(value, list) else [value])
+        else:
+            matched = COMPARISONS[op](actual, value)
+
+        if not matched:
+            return False
+
+    return True
+
+
+def refresh_item_membership(db_session: Session, db_item: ClothingItemModel) -> None:
+    """
+    Update collection membership for a single created or updated item.
+    Only the changed item is checked against each of the owner's collections.
+    The caller is responsible for committing.
+
+    Args:
+        db_session: SQLAlchemy database session
+        db_item: The clothing item that was created or updated
+    """
+    collections = (
+        db_session.query(CollectionModel)
+        .filter(CollectionModel.user_id == db_item.user_id)
+        .all()
+    )
+    if not collections:
+        return
+
+    current = {
+        collection_id
+        for (collection_id,) in db_session.query(
+            CollectionItemModel.collection_id
+        ).filter(CollectionItemModel.clothing_item_id == db_item.id)
+    }
+
+    for collection in collections:
+        matches = item_matches_rules(collection.rules, db_item)
+        if matches and collection.id not in current:
+            db_session.add(
+                CollectionItemModel(
+                    collection_id=collection.id, clothing_item_id=db_item.id
+                )
+            )
+        elif not matches and collection.id in current:
+            db_session.query(CollectionItemModel).filter(
+                CollectionItemModel.collection_id == collection.id,
+                CollectionItemModel.clothing_item_id == db_item.id,
+            ).delete(synchronize_session=False)
+
+
+def remove_item_membership(db_session: Session, item_id: int) -> None:
+    """
+    Remove a deleted item from every collection.
+    The caller is responsible for committing.
+
+    Args:
+        db_session: SQLAlchemy database session
+        item_id: ID of the clothing item being deleted
+    """
+    db_session.query(CollectionItemModel).filter(
+        CollectionItemModel.clothing_item_id == item_id
+    ).delete(synchronize_session=False)
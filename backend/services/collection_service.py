@@ -0,0 +1,233 @@
+"""
+CollectionService for handling smart collection operations.
+This service implements CRUD operations for collections and lookups of their
+materialized membership.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import insert, literal, select
+from sqlalchemy.orm import Session
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.collection_model import CollectionItemModel, CollectionModel
+from backend.schemas.clothing_item import ClothingItem
+from backend.schemas.collection import Collection, CollectionCreate
+from backend.services.collection_membership import compile_rules
+from backend.services.item_service import ItemService
+
+
+class CollectionService:
+    """Service class for handling smart collection operations."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the CollectionService with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def _get_owned_collection(
+        self, collection_id: int, user_id: int
+    ) -> Optional[CollectionModel]:
+        """Get a collection model if it exists and is owned by the user."""
+        return (
+            self.db_session.query(CollectionModel)
+            .filter(
+                CollectionModel.id == collection_id,
+                CollectionModel.user_id == user_id,
+            )
+            .first()
+        )
+
+    def _materialize(self, db_collection: CollectionModel) -> None:
+        """
+        Rebuild the stored membership of a collection.
+
+        The rules are compiled to one WHERE clause and evaluated by the database
+        with a single INSERT ... SELECT. The caller is responsible for committing.
+        """
+        self.db_session.query(CollectionItemModel).filter(
+            CollectionItemModel.collection_id == db_collection.id
+        ).delete(synchronize_session=False)
+
+        matching_items = select(literal(db_collection.id), ClothingItemModel.id).where(
+            ClothingItemModel.user_id == db_collection.user_id,
+            compile_rules(db_collection.rules),
+        )
+        self.db_session.execute(
+            insert(CollectionItemModel).from_select(
+                ["collection_id", "clothing_item_id"], matching_items
+            )
+        )
+
+    def create_collection(
+        self, collection_data: CollectionCreate, user_id: int
+    ) -> Collection:
+        """
+        Create a new collection and materialize its membership.
+
+        Args:
+            collection_data: Data for creating the collection
+            user_id: ID of the user creating the collection
+
+        Returns:
+            The created collection
+
+        Raises:
+            ValueError: If a rule value does not fit its field
+        """
+        db_collection = CollectionModel(
+            name=collection_data.name,
+            description=collection_data.description,
+            rules=[rule.model_dump(mode="json") for rule in collection_data.rules],
+            user_id=user_id,
+        )
+
+        # Add to session, fill membership and commit together
+        self.db_session.add(db_collection)
+        try:
+            self.db_session.flush()
+            self._materialize(db_collection)
+        except ValueError:
+            self.db_session.rollback()
+            raise
+        self.db_session.commit()
+        self.db_session.refresh(db_collection)
+
+        return Collection.model_validate(db_collection)
+
+    def get_collection(self, collection_id: int, user_id: int) -> Optional[Collection]:
+        """
+        Get a collection by ID.
+
+        Args:
+            collection_id: ID of the collection to retrieve
+            user_id: ID of the user requesting the collection
+
+        Returns:
+            The collection if found and owned by user, None otherwise
+        """
+        db_collection = self._get_owned_collection(collection_id, user_id)
+
+        if db_collection is None:
+            return None
+
+        return Collection.model_validate(db_collection)
+
+    def get_all_collections(self, user_id: int) -> List[Collection]:
+        """
+        Get all collections for a user.
+
+        Args:
+            user_id: ID of the user requesting collections
+
+        Returns:
+            List of collections owned by the user
+        """
+        db_collections = (
+            self.db_session.query(CollectionModel)
+            .filter(CollectionModel.user_id == user_id)
+            .order_by(CollectionModel.id)
+            .all()
+        )
+        return [Collection.model_validate(c) for c in db_collections]
+
+    def get_collection_items(
+        self, collection_id: int, user_id: int
+    ) -> Optional[List[ClothingItem]]:
+        """
+        Get the clothing items in a collection from its stored membership.
+
+        Args:
+            collection_id: ID of the collection to open
+            user_id: ID of the user requesting the items
+
+        Returns:
+            The member clothing items if the collection is owned by user, None otherwise
+        """
+        if self._get_owned_collection(collection_id, user_id) is None:
+            return None
+
+        db_items = (
+            self.db_session.query(ClothingItemModel)
+            .join(
+                CollectionItemModel,
+                CollectionItemModel.clothing_item_id == ClothingItemModel.id,
+            )
+            .filter(CollectionItemModel.collection_id == collection_id)
+            .order_by(ClothingItemModel.id)
+            .all()
+        )
+
+        item_service = ItemService(self.db_session)
+        output = []
+        for db_item in db_items:
+            output_object = ClothingItem.model_validate(db_item)
+            output_object.image_data = item_service.get_item_image(db_item)
+            output.append(output_object)
+
+        return output
+
+    def update_collection(
+        self, collection_id: int, collection_data: CollectionCreate, user_id: int
+    ) -> Optional[Collection]:
+        """
+        Update a collection and rebuild its membership.
+
+        Args:
+            collection_id: ID of the collection to update
+            collection_data: Data to update the collection with
+            user_id: ID of the user requesting the update
+
+        Returns:
+            The updated collection if found and owned by user, None otherwise
+
+        Raises:
+            ValueError: If a rule value does not fit its field
+        """
+        db_collection = self._get_owned_collection(collection_id, user_id)
+
+        if db_collection is None:
+            return None
+
+        db_collection.name = collection_data.name
+        db_collection.description = collection_data.description
+        db_collection.rules = [
+            rule.model_dump(mode="json") for rule in collection_data.rules
+        ]
+
+        try:
+            self._materialize(db_collection)
+        except ValueError:
+            self.db_session.rollback()
+            raise
+        self.db_session.commit()
+        self.db_session.refresh(db_collection)
+
+        return Collection.model_validate(db_collection)
+
+    def delete_collection(self, collection_id: int, user_id: int) -> bool:
+        """
+        Delete a collection and its stored membership.
+
+        Args:
+            collection_id: ID of the collection to delete
+            user_id: ID of the user requesting the deletion
+
+        Returns:
+            True if deletion was successful and collection owned by user, False otherwise
+        """
+        db_collection = self._get_owned_collection(collection_id, user_id)
+
+        if db_collection is None:
+            return False
+
+        self.db_session.query(CollectionItemModel).filter(
+            CollectionItemModel.collection_id == collection_id
+        ).delete(synchronize_session=False)
+        self.db_session.delete(db_collection)
+        self.db_session.commit()
+        return True
@@ -0,0 +1,332 @@
+"""
+ColorService for extracting dominant colors from item images and matching items by color.
+Palettes are stored in CIELAB space and compared with vectorized CIEDE2000.
+"""
+
+import io
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.schemas.clothing_item import ClothingItem, ColorMatch
+from backend.schemas.job import Job
+from backend.services.job_service import JobService, job_handler
+
+# Number of colors kept per item
+PALETTE_SIZE = 5
+
+# Side length images are reduced to before quantizing
+PALETTE_SAMPLE_SIZE = 64
+
+# Palette colors covering less of the image than this are ignored when matching
+MIN_PALETTE_WEIGHT = 0.05
+
+# Compact on-disk layout: 4 bytes per color, always PALETTE_SIZE colors
+PALETTE_DTYPE = np.dtype([("L", "u1"), ("a", "i1"), ("b", "i1"), ("w", "u1")])
+
+# sRGB (D65) to CIE XYZ
+_RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert sRGB colors to CIELAB.
+
+    Args:
+        rgb: Array of shape (..., 3) with channels in [0, 1]
+
+    Returns:
+        Array of shape (..., 3) with L, a and b channels
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    linear = np.where(rgb > 0.04045, ((rgb + 0.055) / 1.055) ** 2.4, rgb / 12.92)
+    xyz = linear @ _RGB_TO_XYZ.T / _D65_WHITE
+
+    epsilon = 216 / 24389
+    kappa = 24389 / 27
+    f = np.where(xyz > epsilon, np.cbrt(xyz), (kappa * xyz + 16) / 116)
+
+    lightness = 116 * f[..., 1] - 16
+    a = 500 * (f[..., 0] - f[..., 1])
+    b = 200 * (f[..., 1] - f[..., 2])
+    return np.stack([lightness, a, b], axis=-1)
+
+
+def hex_to_lab(color: str) -> np.ndarray:
+    """
+    Convert a hex color such as "#1f3a5c" to CIELAB.
+
+    Raises:
+        ValueError: If the color is not a 6 digit hex color
+    """
+    value = color.strip().lstrip("#")
+    if len(value) != 6:
+        raise ValueError("Color must be a 6 digit hex color, e.g. #1f3a5c")
+    rgb = np.array([int(value[i : i + 2], 16) for i in (0, 2, 4)]) / 255
+    return rgb_to_lab(rgb)
+
+
+def ciede2000(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """
+    Compute the CIEDE2000 color difference between two sets of Lab colors.
+    Inputs broadcast against each other, so one color can be compared to many.
+
+    Args:
+        lab1: Array of shape (..., 3)
+        lab2: Array of shape (..., 3)
+
+    Returns:
+        Array of color differences (Delta E 2000)
+    """
+    lab1 = np.asarray(lab1, dtype=np.float64)
+    lab2 = np.asarray(lab2, dtype=np.float64)
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c_bar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - np.sqrt(c_bar**7 / (c_bar**7 + 25.0**7)))
+    a1p = (1 + g) * a1
+    a2p = (1 + g) * a2
+    c1p = np.hypot(a1p, b1)
+    c2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+    chroma_zero = c1p * c2p == 0
+
+    delta_lp = L2 - L1
+    delta_cp = c2p - c1p
+    delta_hp = h2p - h1p
+    delta_hp = np.where(delta_hp > 180, delta_hp - 360, delta_hp)
+    delta_hp = np.where(delta_hp < -180, delta_hp + 360, delta_hp)
+    delta_hp = np.where(chroma_zero, 0, delta_hp)
+    delta_big_hp = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(delta_hp) / 2)
+
+    l_bar_p = (L1 + L2) / 2
+    c_bar_p = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    h_bar_p = np.where(
+        np.abs(h1p - h2p) > 180,
+        np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2),
+        h_sum / 2,
+    )
+    h_bar_p = np.where(chroma_zero, h_sum, h_bar_p)
+
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(h_bar_p - 30))
+        + 0.24 * np.cos(np.radians(2 * h_bar_p))
+        + 0.32 * np.cos(np.radians(3 * h_bar_p + 6))
+        - 0.20 * np.cos(np.radians(4 * h_bar_p - 63))
+    )
+    delta_theta = 30 * np.exp(-(((h_bar_p - 275) / 25) ** 2))
+    r_c = 2 * np.sqrt(c_bar_p**7 / (c_bar_p**7 + 25.0**7))
+    s_l = 1 + 0.015 * (l_bar_p - 50) ** 2 / np.sqrt(20 + (l_bar_p - 50) ** 2)
+    s_c = 1 + 0.045 * c_bar_p
+    s_h = 1 + 0.015 * c_bar_p * t
+    r_t = -np.sin(np.radians(2 * delta_theta)) * r_c
+
+    return np.sqrt(
+        (delta_lp / s_l) ** 2
+        + (delta_cp / s_c) ** 2
+        + (delta_big_hp / s_h) ** 2
+        + r_t * (delta_cp / s_c) * (delta_big_hp / s_h)
+    )
+
+
+def extract_palette(file_data: bytes, colors: int = PALETTE_SIZE) -> np.ndarray:
+    """
+    Extract the dominant colors of an image.
+
+    Args:
+        file_data: Raw bytes of the image file
+        colors: Maximum number of colors to extract
+
+    Returns:
+        Array of shape (n, 4) with L, a, b and coverage weight, most dominant first
+
+    Raises:
+        PIL.UnidentifiedImageError: If the bytes are not a readable image
+    """
+    with Image.open(io.BytesIO(file_data)) as image:
+        image = image.convert("RGB")
+        image.thumbnail((PALETTE_SAMPLE_SIZE, PALETTE_SAMPLE_SIZE))
+        quantized = image.quantize(colors=colors, method=Image.Quantize.MEDIANCUT)
+
+    rgb = np.array(quantized.getpalette()[: colors * 3]).reshape(-1, 3)
+    counts = np.bincount(np.asarray(quantized).ravel(), minlength=len(rgb))
+    counts = counts[: len(rgb)]
+
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+    lab = rgb_to_lab(rgb[order] / 255)
+    weights = counts[order] / counts.sum()
+    return np.column_stack([lab, weights])
+
+
+def encode_palette(palette: np.ndarray) -> bytes:
+    """
+    Pack a palette into PALETTE_SIZE * 4 bytes, padding with zero-weight colors.
+    """
+    packed = np.zeros(PALETTE_SIZE, dtype=PALETTE_DTYPE)
+    palette = palette[:PALETTE_SIZE]
+    count = len(palette)
+    packed["L"][:count] = np.clip(np.rint(palette[:, 0] * 2.55), 0, 255)
+    packed["a"][:count] = np.clip(np.rint(palette[:, 1]), -128, 127)
+    packed["b"][:count] = np.clip(np.rint(palette[:, 2]), -128, 127)
+    packed["w"][:count] = np.clip(np.rint(palette[:, 3] * 255), 0, 255)
+    return packed.tobytes()
+
+
+def decode_palettes(blobs: List[bytes]) -> np.ndarray:
+    """
+    Unpack stored palettes in one step.
+
+    Returns:
+        Array of shape (len(blobs), PALETTE_SIZE, 4) with L, a, b and weight
+    """
+    packed = np.frombuffer(b"".join(blobs), dtype=PALETTE_DTYPE)
+    packed = packed.reshape(len(blobs), PALETTE_SIZE)
+    return np.stack(
+        [
+            packed["L"] / 2.55,
+            packed["a"].astype(np.float64),
+            packed["b"].astype(np.float64),
+            packed["w"] / 255,
+        ],
+        axis=-1,
+    )
+
+
+def enqueue_palette_extraction(db_session: Session, item_id: int, user_id: int) -> Job:
+    """
+    Queue a job that extracts the palette of an item's newly stored image.
+
+    Args:
+        db_session: SQLAlchemy database session on the user's shard
+        item_id: ID of the clothing item the image belongs to
+        user_id: ID of the user who owns the item
+
+    Returns:
+        The queued job
+    """
+    return JobService(db_session).enqueue(
+        "image.palette", {"item_id": item_id, "user_id": user_id}, user_id=user_id
+    )
+
+
+@job_handler("image.palette")
+def extract_item_palette(db_session: Session, payload: Dict[str, Any]):
+    """
+    Job handler that extracts and stores the palette of an item's stored image.
+    Uploads queue it, and it can be queued by hand to backfill palettes.
+
+    Args:
+        db_session: SQLAlchemy database session
+        payload: {"item_id": ID of the clothing item,
+            "user_id": ID of the user who owns it}
+
+    Returns:
+        {"colors": number of palette colors stored}, or None without an image
+    """
+    query = db_session.query(ClothingItemModel).filter(
+        ClothingItemModel.id == payload["item_id"]
+    )
+    # The owner lets a partitioned table read a single partition; jobs queued
+    # before it was in the payload are looked up by ID alone
+    if "user_id" in payload:
+        query = query.filter(ClothingItemModel.user_id == payload["user_id"])
+    db_item = query.first()
+    if db_item is None or db_item.image_path is None:
+        return None
+
+    palette = extract_palette(Path(db_item.image_path).read_bytes())
+    db_item.color_palette = encode_palette(palette)
+    db_session.commit()
+    return {"colors": len(palette)}
+
+
+class ColorService:
+    """Service class for matching clothing items by color."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the ColorService with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def find_matching_items(
+        self,
+        user_id: int,
+        color: str,
+        scheme: Literal["similar", "complementary"] = "similar",
+        limit: int = 20,
+        max_delta_e: Optional[float] = None,
+    ) -> List[ColorMatch]:
+        """
+        Find the user's items whose palette goes with a color.
+
+        Every palette color of every item is scored in a single vectorized
+        CIEDE2000 computation; an item's score is its closest significant color.
+
+        Args:
+            user_id: ID of the user whose closet is searched
+            color: Hex color to match, e.g. "#1f3a5c"
+            scheme: "similar" for close colors, "complementary" for opposite hues
+            limit: Maximum number of items to return
+            max_delta_e: Optional cutoff; items further away are excluded
+
+        Returns:
+            Matching items ordered from best to worst match
+
+        Raises:
+            ValueError: If the color is not a valid hex color
+        """
+        target = hex_to_lab(color)
+        if scheme == "complementary":
+            # Opposite hue at the same lightness
+            target = target * np.array([1, -1, -1])
+
+        db_items = (
+            self.db_session.query(ClothingItemModel)
+            .filter(
+                ClothingItemModel.user_id == user_id,
+                ClothingItemModel.color_palette.isnot(None),
+            )
+            .all()
+        )
+        if not db_items:
+            return []
+
+        palettes = decode_palettes([db_item.color_palette for db_item in db_items])
+        delta_e = ciede2000(palettes[..., :3], target)
+        delta_e = np.where(palettes[..., 3] >= MIN_PALETTE_WEIGHT, delta_e, np.inf)
+        scores = delta_e.min(axis=1)
+
+        order = np.argsort(scores, kind="stable")[:limit]
+        matches = []
+        for index in order:
+            score = float(scores[index])
+            if not np.isfinite(score):
+                break
+            if max_delta_e is not None and score > max_delta_e:
+                break
+            matches.append(
+                ColorMatch(
+                    item=ClothingItem.model_validate(db_items[index]), delta_e=score
+                )
+            )
+        return matches
@@ -0,0 +1,348 @@
+"""
+DuplicateService for detecting near-duplicate item photos.
+Images are reduced to a 64-bit difference hash (dHash) and indexed per user in
+a BK-tree, so each lookup only visits the part of the tree within the search radius.
+"""
+
+import io
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from backend.config.upload_settings import upload_settings
+from backend.repositories.item_repository import ItemRepository, item_repository
+from backend.schemas.clothing_item import DuplicateGroup
+
+# Hash is HASH_SIZE * HASH_SIZE bits
+HASH_SIZE = 8
+
+
+def dhash(file_data: bytes) -> int:
+    """
+    Compute the difference hash of an image.
+
+    Args:
+        file_data: Raw bytes of the image file
+
+    Returns:
+        64-bit integer hash; similar images have a small Hamming distance
+
+    Raises:
+        PIL.UnidentifiedImageError: If the bytes are not a readable image
+    """
+    with Image.open(io.BytesIO(file_data)) as image:
+        image.draft("L", (HASH_SIZE * 4, HASH_SIZE * 4))
+        pixels = np.asarray(
+            image.convert("L").resize(
+                (HASH_SIZE + 1, HASH_SIZE), Image.Resampling.LANCZOS
+            ),
+            dtype=np.int16,
+        )
+
+    bits = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def compute_image_hash(file_data: bytes) -> Optional[int]:
+    """
+    Compute the difference hash of an image, or None if it cannot be decoded.
+    """
+    try:
+        return dhash(file_data)
+    except Exception:
+        return None
+
+
+def format_image_hash(image_hash: int) -> str:
+    """Format a hash for storage in ClothingItemModel.image_hash."""
+    return format(image_hash, "016x")
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (first ^ second).bit_count()
+
+
+class _BKNode:
+    """A BK-tree node holding every item whose image has exactly this hash."""
+
+    __slots__ = ("image_hash", "item_ids", "children")
+
+    def __init__(self, image_hash: int, item_id: int):
+        self.image_hash = image_hash
+        self.item_ids = [item_id]
+        self.children: Dict[int, "_BKNode"] = {}
+
+
+class BKTree:
+    """
+    BK-tree over image hashes using Hamming distance.
+
+    Children are keyed by their distance to the parent; the triangle inequality
+    lets a search skip every subtree outside [d - radius, d + radius].
+    """
+
+    def __init__(self):
+        self._root: Optional[_BKNode] = None
+
+    def add(self, image_hash: int, item_id: int) -> None:
+        """Add an item's hash to the tree."""
+        if self._root is None:
+            self._root = _BKNode(image_hash, item_id)
+            return
+
+        node = self._root
+        while True:
+            distance = hamming_distance(image_hash, node.image_hash)
+            if distance == 0:
+                node.item_ids.append(item_id)
+                return
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _BKNode(image_hash, item_id)
+                return
+            node = child
+
+    def remove(self, image_hash: int, item_id: int) -> None:
+        """
+        Remove an item's hash from the tree.
+        The node itself is kept to route searches to its children.
+        """
+        node = self._root
+        while node is not None:
+            distance = hamming_distance(image_hash, node.image_hash)
+            if distance == 0:
+                if item_id in node.item_ids:
+                    node.item_ids.remove(item_id)
+                return
+            node = node.children.get(distance)
+
+    def search(self, image_hash: int, max_distance: int) -> List[Tuple[int, int]]:
+        """
+        Find items whose hash is within max_distance of image_hash.
+
+        Returns:
+            List of (item_id, distance) pairs
+        """
+        results = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(image_hash, node.image_hash)
+            if distance <= max_distance:
+                results.extend((item_id, distance) for item_id in node.item_ids)
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in node.children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        return results
+
+
+class _UserHashes:
+    """A user's BK-tree, the hash of each item in it, and when it was built."""
+
+    def __init__(self, tree: BKTree, hashes: Dict[int, int], loaded_at: float):
+        self.tree = tree
+        self.hashes = hashes
+        self.loaded_at = loaded_at
+
+
+class DuplicateIndex:
+    """
+    Per-user BK-trees of image hashes, kept in process memory.
+
+    A user's tree is built from the stored hashes when it is needed and then
+    maintained as images are uploaded or removed in this process. Changes
+    made by other processes, or missing from a lagging replica the tree was
+    built from, show up once the tree is rebuilt after its time to live.
+    Expired trees are dropped whenever a tree is built, so only users active
+    within the time to live stay in memory.
+    """
+
+    # Users share this many locks, so building one user's tree only holds up
+    # the few users whose ID falls on the same lock
+    LOCK_STRIPES = 64
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            ttl: Seconds a user's tree is used before it is rebuilt, defaults
+                to settings
+        """
+        self.ttl = ttl if ttl is not None else upload_settings.duplicate_index_ttl
+        # Guards _users only; held for dictionary updates, never for queries
+        self._lock = threading.Lock()
+        self._user_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        # Loaded trees in the order they were built, oldest first
+        self._users: Dict[int, _UserHashes] = {}
+
+    def _user_lock(self, user_id: int) -> threading.Lock:
+        """Get the lock that serializes changes to a user's tree."""
+        return self._user_locks[user_id % self.LOCK_STRIPES]
+
+    def _load(self, items: ItemRepository, user_id: int) -> _UserHashes:
+        """
+        Get a user's tree, building it from the stored items if needed.
+        The caller holds the user's lock.
+        """
+        now = time.monotonic()
+        with self._lock:
+            loaded = self._users.get(user_id)
+        if loaded is not None and now - loaded.loaded_at < self.ttl:
+            return loaded
+
+        tree = BKTree()
+        hashes = {}
+        for item_id, image_hash in items.image_hashes(user_id):
+            hashes[item_id] = int(image_hash, 16)
+            tree.add(hashes[item_id], item_id)
+        loaded = _UserHashes(tree, hashes, time.monotonic())
+
+        with self._lock:
+            self._drop_expired(now)
+            self._users.pop(user_id, None)
+            self._users[user_id] = loaded
+        return loaded
+
+    def _drop_expired(self, now: float) -> None:
+        """Forget the trees built more than the time to live ago."""
+        while self._users:
+            user_id, oldest = next(iter(self._users.items()))
+            if now - oldest.loaded_at < self.ttl:
+                return
+            del self._users[user_id]
+
+    @staticmethod
+    def _discard(loaded: _UserHashes, item_id: int) -> None:
+        """Remove an item from a loaded tree."""
+        old_hash = loaded.hashes.pop(item_id, None)
+        if old_hash is not None:
+            loaded.tree.remove(old_hash, item_id)
+
+    def check_and_add(
+        self,
+        items: ItemRepository,
+        user_id: int,
+        item_id: int,
+        image_hash: int,
+        max_distance: int,
+    ) -> List[int]:
+        """
+        Record an item's new image hash and return its near-duplicates.
+
+        Args:
+            items: Item repository used to build the tree
+            user_id: ID of the user who owns the item
+            item_id: ID of the item whose image changed
+            image_hash: The new image hash
+            max_distance: Largest Hamming distance counted as a duplicate
+
+        Returns:
+            IDs of the user's other items with near-identical images
+        """
+        with self._user_lock(user_id):
+            loaded = self._load(items, user_id)
+            if loaded.hashes.get(item_id) != image_hash:
+                self._discard(loaded, item_id)
+                loaded.hashes[item_id] = image_hash
+                loaded.tree.add(image_hash, item_id)
+
+            matches = loaded.tree.search(image_hash, max_distance)
+
+        return sorted(match_id for match_id, _ in matches if match_id != item_id)
+
+    def remove(self, user_id: int, item_id: int) -> None:
+        """Forget an item whose image or record was deleted."""
+        with self._user_lock(user_id):
+            with self._lock:
+                loaded = self._users.get(user_id)
+            if loaded is not None:
+                self._discard(loaded, item_id)
+
+    def find_groups(
+        self, items: ItemRepository, user_id: int, max_distance: int
+    ) -> List[List[int]]:
+        """
+        Group all of a user's items with near-identical images.
+
+        Returns:
+            Groups of two or more item IDs, each sorted
+        """
+        with self._user_lock(user_id):
+            loaded = self._load(items, user_id)
+            hashes = dict(loaded.hashes)
+            neighbours = {
+                item_id: loaded.tree.search(image_hash, max_distance)
+                for item_id, image_hash in hashes.items()
+            }
+
+        # Union-find over the near-duplicate pairs
+        parent = {item_id: item_id for item_id in hashes}
+
+        def find(item_id: int) -> int:
+            while parent[item_id] != item_id:
+                parent[item_id] = parent[parent[item_id]]
+                item_id = parent[item_id]
+            return item_id
+
+        for item_id, matches in neighbours.items():
+            for match_id, _ in matches:
+                if match_id in parent:
+                    parent[find(match_id)] = find(item_id)
+
+        groups: Dict[int, List[int]] = {}
+        for item_id in hashes:
+            groups.setdefault(find(item_id), []).append(item_id)
+
+        return sorted(sorted(group) for group in groups.values() if len(group) > 1)
+
+    def clear(self) -> None:
+        """Drop every loaded tree."""
+        with self._lock:
+            self._users.clear()
+
+
+# Process-wide index shared by all requests
+duplicate_index = DuplicateIndex()
+
+
+class DuplicateService:
+    """Service class for finding near-duplicate item images."""
+
+    def __init__(self, db_session: Session, items: Optional[ItemRepository] = None):
+        """
+        Initialize the DuplicateService with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+            items: Item repository, defaults to the one of the configured
+                storage backend
+        """
+        self.db_session = db_session
+        self.items = items if items is not None else item_repository(db_session)
+
+    def find_duplicates(
+        self, user_id: int, max_distance: Optional[int] = None
+    ) -> List[DuplicateGroup]:
+        """
+        Find groups of the user's items that have near-identical images.
+
+        Args:
+            user_id: ID of the user whose closet is searched
+            max_distance: Largest Hamming distance counted as a duplicate,
+                defaults to the configured threshold
+
+        Returns:
+            Groups of item IDs that look like the same photo
+        """
+        if max_distance is None:
+            max_distance = upload_settings.duplicate_max_distance
+
+        groups = duplicate_index.find_groups(self.items, user_id, max_distance)
+        return [DuplicateGroup(item_ids=group) for group in groups]
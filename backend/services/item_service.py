@@ -5,6 +5,7 @@ This service implements CRUD operations for clothing items with proper database
 
 import base64
 import os
+import time
 from datetime import datetime, timezone
 from typing import List, Optional
 
@@ -12,21 +13,28 @@ from sqlalchemy.orm import Session
 
 from backend.config.upload_settings import upload_settings
 from backend.models.clothing_item_model import ClothingItemModel
+from backend.repositories.item_repository import ItemRepository, item_repository
 from backend.schemas.clothing_item import ClothingItem, ClothingItemCreate
+from backend.services.duplicate_service import duplicate_index
+from backend.services.metrics_service import image_bytes
+from backend.services.timing_service import record_file_io
 from backend.services.upload_service import UploadService
 
 
 class ItemService:
     """Service class for handling clothing item operations."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, items: Optional[ItemRepository] = None):
         """
         Initialize the ItemService with a database session.
 
         Args:
             db_session: SQLAlchemy database session
+            items: Item repository, defaults to the one of the configured
+                storage backend
         """
         self.db_session = db_session
+        self.items = items if items is not None else item_repository(db_session)
 
     def create_item(self, item_data: ClothingItemCreate, user_id: int) -> ClothingItem:
         """
@@ -47,15 +55,13 @@ class ItemService:
 
         db_item = ClothingItemModel(**data)
 
-        # Add to session and commit
-        self.db_session.add(db_item)
-        self.db_session.commit()
-        self.db_session.refresh(db_item)
+        # Store the item, which also updates smart collection membership
+        self.items.add(db_item)
 
         # If image data was provided, upload it using UploadService
         if item_data.image_data is not None and item_data.image_name is not None:
             # Create UploadService instance
-            upload_service = UploadService(self.db_session)
+            upload_service = UploadService(self.db_session, items=self.items)
 
             # Upload image and update item with image path
             updated_item = upload_service.upload_image(
@@ -65,10 +71,10 @@ class ItemService:
                 user_id,
             )
             if updated_item:
-                # Refresh the item to get updated image path
-                self.db_session.refresh(db_item)
+                # The upload stored the image path on the same item
                 result = ClothingItem.model_validate(db_item)
                 result.image_data = item_data.image_data
+                result.possible_duplicates = updated_item.possible_duplicates
                 return result
             else:
                 # If upload fails, return item without image path
@@ -84,8 +90,11 @@ class ItemService:
 
         # Read file as bytes and encode to base64
         try:
+            start = time.perf_counter()
             with open(file_path, "rb") as f:
                 file_bytes = f.read()
+            record_file_io(len(file_bytes), time.perf_counter() - start)
+            image_bytes.inc("read", amount=len(file_bytes))
             return base64.b64encode(file_bytes).decode("utf-8")
         except FileNotFoundError:
             return None
@@ -101,12 +110,7 @@ class ItemService:
         Returns:
             The clothing item if found and owned by user, None otherwise
         """
-        db_item = (
-            self.db_session.query(ClothingItemModel)
-            .filter(ClothingItemModel.id == item_id)
-            .filter(ClothingItemModel.user_id == user_id)
-            .first()
-        )
+        db_item = self.items.get(item_id, user_id)
 
         if db_item is None:
             return None
@@ -125,12 +129,7 @@ class ItemService:
         Returns:
             List of clothing items owned by the user
         """
-        query = self.db_session.query(ClothingItemModel)
-
-        # Filter by user
-        query = query.filter(ClothingItemModel.user_id == user_id)
-
-        db_items = query.all()
+        db_items = self.items.list_for_user(user_id)
 
         output = []
 
@@ -160,28 +159,25 @@ class ItemService:
         Returns:
             The updated clothing item if found and owned by user, None otherwise
         """
-        db_item = (
-            self.db_session.query(ClothingItemModel)
-            .filter(
-                ClothingItemModel.id == item_id, ClothingItemModel.user_id == user_id
-            )
-            .first()
-        )
+        db_item = self.items.get(item_id, user_id)
 
         if db_item is None:
             return None
 
-        # Update the item fields
-        for key, value in item.to_model().items():
+        # Update the item fields; the item stays with the requesting user
+        # whatever user_id the request body names
+        data = item.to_model()
+        data["user_id"] = user_id
+        for key, value in data.items():
             setattr(db_item, key, value)
 
-        self.db_session.commit()
-        self.db_session.refresh(db_item)
+        # Store the changes, which also updates smart collection membership
+        self.items.update(db_item)
 
         # If image data was provided, upload it using UploadService
         if item.image_data is not None and item.image_name is not None:
             # Create UploadService instance
-            upload_service = UploadService(self.db_session)
+            upload_service = UploadService(self.db_session, items=self.items)
 
             # Upload image and update item with image path
             updated_item = upload_service.upload_image(
@@ -191,10 +187,10 @@ class ItemService:
                 user_id,
             )
             if updated_item:
-                # Refresh the item to get updated image path
-                self.db_session.refresh(db_item)
+                # The upload stored the image path on the same item
                 result = ClothingItem.model_validate(db_item)
                 result.image_data = item.image_data
+                result.possible_duplicates = updated_item.possible_duplicates
                 return result
             else:
                 # If upload fails, return item without image path
@@ -214,17 +210,12 @@ class ItemService:
         Returns:
             True if deletion was successful and item owned by user, False otherwise
         """
-        db_item = (
-            self.db_session.query(ClothingItemModel)
-            .filter(
-                ClothingItemModel.id == item_id, ClothingItemModel.user_id == user_id
-            )
-            .first()
-        )
+        db_item = self.items.get(item_id, user_id)
 
         if db_item is None:
             return False
 
-        self.db_session.delete(db_item)
-        self.db_session.commit()
+        # Deleting also removes the item from its collections
+        self.items.delete(db_item)
+        duplicate_index.remove(user_id, item_id)
         return True
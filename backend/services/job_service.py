@@ -0,0 +1,334 @@
+"""
+JobService for the durable background job queue.
+Jobs are rows in the jobs table. Workers claim due jobs with
+SELECT ... FOR UPDATE SKIP LOCKED, so any number of worker processes on any
+number of nodes can share the queue through PostgreSQL alone.
+"""
+
+import random
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from backend.config.database import SessionLocal
+from backend.config.job_settings import job_settings
+from backend.models.job_model import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobModel,
+)
+from backend.schemas.job import Job
+
+# Handlers by job kind. A handler receives its own database session and the
+# job payload, and returns a JSON serializable result.
+JobHandler = Callable[[Session, Dict[str, Any]], Any]
+job_handlers: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    Register a function as the handler for a kind of job.
+
+    Handlers must be module level functions so process pools can run them,
+    and must be safe to run more than once for the same job.
+    """
+
+    def register(handler: JobHandler) -> JobHandler:
+        job_handlers[kind] = handler
+        return handler
+
+    return register
+
+
+def utcnow() -> datetime:
+    """Get the current time as a naive UTC datetime, as stored on jobs."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Get the delay before retrying a job that failed attempts times.
+
+    The delay doubles with every attempt up to the configured maximum, with
+    jitter so jobs that failed together do not all retry at the same moment.
+    """
+    delay = min(
+        job_settings.retry_max_delay,
+        job_settings.retry_base_delay * 2 ** max(attempts - 1, 0),
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+def run_job_handler(
+    kind: str, payload: Dict[str, Any], session_factory: Callable = SessionLocal
+) -> Any:
+    """
+    Run the handler for a job in a new database session.
+
+    This is what worker pools execute; with a process pool it runs in a child
+    process, which uses the application's session factory.
+
+    Args:
+        kind: Kind of the job
+        payload: Arguments for the handler
+        session_factory: Factory for the handler's database session
+
+    Returns:
+        The result of the handler
+
+    Raises:
+        ValueError: If no handler is registered for the kind
+    """
+    handler = job_handlers.get(kind)
+    if handler is None:
+        raise ValueError(f"No handler registered for job kind '{kind}'")
+
+    with session_factory() as db_session:
+        return handler(db_session, payload)
+
+
+class JobService:
+    """Service class for enqueuing, claiming and finishing background jobs."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the JobService with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        user_id: Optional[int] = None,
+        delay: float = 0,
+        max_attempts: Optional[int] = None,
+    ) -> Job:
+        """
+        Add a job to the queue.
+
+        Args:
+            kind: Kind of the job, which selects its handler
+            payload: JSON serializable arguments for the handler
+            user_id: Optional ID of the user the job belongs to
+            delay: Seconds to wait before the job may run
+            max_attempts: Attempts before the job is failed, defaults to settings
+
+        Returns:
+            The queued job
+
+        Raises:
+            ValueError: If no handler is registered for the kind
+        """
+        if kind not in job_handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+
+        db_job = JobModel(
+            kind=kind,
+            payload=payload or {},
+            status=JOB_QUEUED,
+            attempts=0,
+            max_attempts=max_attempts or job_settings.max_attempts,
+            run_at=utcnow() + timedelta(seconds=delay),
+            user_id=user_id,
+        )
+
+        # Add to session and commit
+        self.db_session.add(db_job)
+        self.db_session.commit()
+        self.db_session.refresh(db_job)
+
+        return Job.model_validate(db_job)
+
+    def get_job(self, job_id: int, user_id: int) -> Optional[Job]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: ID of the job to retrieve
+            user_id: ID of the user requesting the job
+
+        Returns:
+            The job if found and owned by user, None otherwise
+        """
+        db_job = (
+            self.db_session.query(JobModel)
+            .filter(JobModel.id == job_id, JobModel.user_id == user_id)
+            .first()
+        )
+
+        if db_job is None:
+            return None
+
+        return Job.model_validate(db_job)
+
+    def claim_jobs(self, worker_id: str, limit: int) -> List[Job]:
+        """
+        Claim due jobs for a worker.
+
+        Due jobs are queued jobs whose run time has passed, and running jobs
+        whose lease expired because their worker died; those are failed instead
+        if that was their last attempt. Rows locked by another
+        worker's claim are skipped instead of waited on. The claim commits
+        right away, so the lease rather than the row lock protects the job
+        while it runs; the worker renews it until the job finishes.
+
+        Args:
+            worker_id: Unique name of the claiming worker
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            The claimed jobs, oldest due first
+        """
+        now = utcnow()
+        db_jobs = (
+            self.db_session.query(JobModel)
+            .filter(
+                or_(
+                    and_(JobModel.status == JOB_QUEUED, JobModel.run_at <= now),
+                    and_(JobModel.status == JOB_RUNNING, JobModel.locked_until < now),
+                )
+            )
+            .order_by(JobModel.run_at, JobModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        claimed = []
+        locked_until = now + timedelta(seconds=job_settings.lease_seconds)
+        for db_job in db_jobs:
+            # A job whose worker died on its last attempt is not run again
+            if db_job.status == JOB_RUNNING and db_job.attempts >= db_job.max_attempts:
+                db_job.status = JOB_FAILED
+                db_job.last_error = "Worker lease expired"
+                db_job.locked_by = None
+                db_job.locked_until = None
+                continue
+
+            db_job.status = JOB_RUNNING
+            db_job.attempts += 1
+            db_job.locked_by = worker_id
+            db_job.locked_until = locked_until
+            claimed.append(db_job)
+
+        # Build the results before committing expires the loaded jobs
+        self.db_session.flush()
+        jobs = [Job.model_validate(db_job) for db_job in claimed]
+        self.db_session.commit()
+
+        return jobs
+
+    def renew_leases(self, worker_id: str, job_ids: List[int]) -> int:
+        """
+        Extend the leases of jobs a worker is still running.
+
+        Args:
+            worker_id: Name of the worker running the jobs
+            job_ids: IDs of the running jobs
+
+        Returns:
+            Number of leases renewed; jobs whose lease already expired and
+            were claimed by another worker are not renewed
+        """
+        if not job_ids:
+            return 0
+
+        renewed = (
+            self.db_session.query(JobModel)
+            .filter(
+                JobModel.id.in_(job_ids),
+                JobModel.status == JOB_RUNNING,
+                JobModel.locked_by == worker_id,
+            )
+            .update(
+                {
+                    JobModel.locked_until: utcnow()
+                    + timedelta(seconds=job_settings.lease_seconds)
+                },
+                synchronize_session=False,
+            )
+        )
+        self.db_session.commit()
+        return renewed
+
+    def _get_leased_job(self, job_id: int, worker_id: str) -> Optional[JobModel]:
+        """Get a running job if the worker still holds its lease."""
+        return (
+            self.db_session.query(JobModel)
+            .filter(
+                JobModel.id == job_id,
+                JobModel.status == JOB_RUNNING,
+                JobModel.locked_by == worker_id,
+            )
+            .with_for_update()
+            .first()
+        )
+
+    def complete_job(self, job_id: int, worker_id: str, result: Any = None) -> bool:
+        """
+        Mark a claimed job as succeeded.
+
+        Args:
+            job_id: ID of the finished job
+            worker_id: Name of the worker that ran the job
+            result: JSON serializable result of the handler
+
+        Returns:
+            True if recorded, False if the worker no longer held the job
+        """
+        db_job = self._get_leased_job(job_id, worker_id)
+
+        if db_job is None:
+            self.db_session.rollback()
+            return False
+
+        db_job.status = JOB_SUCCEEDED
+        db_job.result = result
+        db_job.last_error = None
+        db_job.locked_by = None
+        db_job.locked_until = None
+        self.db_session.commit()
+        return True
+
+    def fail_job(self, job_id: int, worker_id: str, error: BaseException) -> bool:
+        """
+        Record a failed attempt of a claimed job.
+
+        The job is queued again with exponential backoff until it has used all
+        of its attempts, after which it is marked failed.
+
+        Args:
+            job_id: ID of the failed job
+            worker_id: Name of the worker that ran the job
+            error: The exception raised by the handler
+
+        Returns:
+            True if recorded, False if the worker no longer held the job
+        """
+        db_job = self._get_leased_job(job_id, worker_id)
+
+        if db_job is None:
+            self.db_session.rollback()
+            return False
+
+        db_job.last_error = "".join(
+            traceback.format_exception_only(type(error), error)
+        ).strip()
+        db_job.locked_by = None
+        db_job.locked_until = None
+        if db_job.attempts >= db_job.max_attempts:
+            db_job.status = JOB_FAILED
+        else:
+            db_job.status = JOB_QUEUED
+            db_job.run_at = utcnow() + timedelta(seconds=retry_delay(db_job.attempts))
+        self.db_session.commit()
+        return True
@@ -0,0 +1,216 @@
+"""
+Warm-up and graceful shutdown of the API process.
+On startup the lifespan opens pool connections, pings MongoDB and runs the
+hot queries once, so the first requests after a deploy do not pay for
+connections, mapper configuration or statement compilation. SIGTERM turns
+new requests away at once, for a drain delay before the server stops
+listening, so load balancers move clients elsewhere. On shutdown it waits
+for the requests still in flight and for queued background work, then
+closes the pools, all within a deadline.
+"""
+
+import asyncio
+import logging
+import signal
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import QueuePool
+
+from backend.config.database import (
+    SessionLocal,
+    close_mongo_client,
+    dispose_engine,
+    get_engine,
+    get_mongo_client,
+)
+from backend.config.ops_settings import ops_settings
+from backend.config.settings import settings
+from backend.services.item_service import ItemService
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks for in-flight requests while draining
+DRAIN_POLL_INTERVAL = 0.01
+
+# A user ID no row has, so priming queries return nothing
+NO_USER = -1
+
+
+class InFlightRequests:
+    """Counts the requests being handled and turns new ones away once draining."""
+
+    def __init__(self):
+        """Initialize with no requests and accepting work."""
+        self.count = 0
+        self.draining = False
+
+    def start(self) -> bool:
+        """
+        Register a new request.
+
+        Returns:
+            False if the process is draining and the request must be refused
+        """
+        if self.draining:
+            return False
+        self.count += 1
+        return True
+
+    def finish(self) -> None:
+        """Register that a request finished."""
+        self.count -= 1
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """
+        Wait until no request is in flight.
+
+        Args:
+            timeout: Most seconds to wait
+
+        Returns:
+            True if the requests finished in time, False otherwise
+        """
+        deadline = time.monotonic() + timeout
+        while self.count > 0:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(DRAIN_POLL_INTERVAL)
+        return True
+
+
+# Requests in flight in this process, maintained by the admission middleware
+in_flight = InFlightRequests()
+
+
+def warm_up_pool(engine: Engine, connections: int) -> int:
+    """
+    Open pool connections and return them to the pool, ready for requests.
+
+    Args:
+        engine: Engine whose pool to fill
+        connections: Number of connections, capped at the pool size
+
+    Returns:
+        Number of connections opened
+    """
+    if isinstance(engine.pool, QueuePool):
+        connections = min(connections, engine.pool.size())
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+def prime_caches(session_factory: Callable = SessionLocal) -> None:
+    """
+    Configure the ORM mappers and run the hot queries once, for nobody, so
+    their SQL is compiled and cached before the first request needs it.
+
+    Args:
+        session_factory: Factory for database sessions
+    """
+    configure_mappers()
+    with session_factory() as session:
+        service = ItemService(session)
+        service.get_all_items(NO_USER)
+        service.get_item(0, NO_USER)
+
+
+def _warm_up_database() -> int:
+    opened = warm_up_pool(get_engine(), settings.postgresql_pool_warmup)
+    prime_caches()
+    return opened
+
+
+async def warm_up() -> None:
+    """
+    Prepare connections and caches before serving. Failures are logged, not
+    raised, so the API still starts while a database is briefly unavailable.
+    """
+    # Accept requests again if an earlier lifespan of the app drained them
+    in_flight.draining = False
+    start = time.monotonic()
+    timeout = ops_settings.warmup_timeout
+    if settings.storage_backend == "memory":
+        logger.info("Demo mode: users and items are kept in memory only")
+    else:
+        try:
+            opened = await asyncio.wait_for(
+                asyncio.to_thread(_warm_up_database), timeout
+            )
+            logger.info("Opened %d database connections", opened)
+        except Exception as e:
+            logger.warning("Database warm-up failed: %r", e)
+
+    if settings.mongodb_url:
+        remaining = max(timeout - (time.monotonic() - start), 0.001)
+        try:
+            await asyncio.wait_for(get_mongo_client().admin.command("ping"), remaining)
+        except Exception as e:
+            logger.warning("MongoDB ping failed: %r", e)
+
+    logger.info("Warm-up took %.0f ms", (time.monotonic() - start) * 1000)
+
+
+def drain_on_sigterm(delay: Optional[float] = None) -> bool:
+    """
+    Start draining as soon as the process gets SIGTERM. uvicorn runs the
+    lifespan shutdown only once it stopped listening and its connections
+    closed, too late to turn anyone away, so its SIGTERM handler is wrapped:
+    the signal starts draining at once and the server's handler runs after
+    the delay. A second SIGTERM stops the server right away.
+
+    Call it from the lifespan startup, after the server installed its signal
+    handlers.
+
+    Args:
+        delay: Seconds to refuse requests before the server stops, defaults
+            to settings
+
+    Returns:
+        True if installed; False off the main thread or without a server
+        handler to pass the signal on to
+    """
+    delay = ops_settings.shutdown_drain_delay if delay is None else delay
+    server_handler = signal.getsignal(signal.SIGTERM)
+    if threading.current_thread() is not threading.main_thread() or not callable(
+        server_handler
+    ):
+        return False
+    loop = asyncio.get_running_loop()
+
+    def on_sigterm(signum, frame):
+        if in_flight.draining:
+            server_handler(signum, frame)
+            return
+        logger.info("Draining for %.1f s before shutting down", delay)
+        in_flight.draining = True
+        loop.call_soon_threadsafe(loop.call_later, delay, server_handler, signum, frame)
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+    return True
+
+
+async def shut_down() -> None:
+    """
+    Stop taking requests, let in-flight requests finish within the shutdown
+    timeout, then close the connection pools. Background work is in the job
+    queue and survives the restart.
+    """
+    in_flight.draining = True
+
+    if not await in_flight.wait_idle(ops_settings.shutdown_timeout):
+        logger.warning(
+            "Shutting down with %d requests still in flight", in_flight.count
+        )
+
+    dispose_engine()
+    close_mongo_client()
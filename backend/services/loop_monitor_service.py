@@ -0,0 +1,133 @@
+"""
+Event loop lag monitoring for the API process.
+A task on the event loop wakes up at a fixed interval and records how late it
+woke. A watchdog thread notices when the task has not run for longer than
+the stall threshold, and while the loop is still blocked captures the stack
+of the code blocking it and the route of the request it belongs to, then
+logs and counts the stall.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+
+from backend.config.ops_settings import ops_settings
+from backend.services.metrics_service import metrics
+
+logger = logging.getLogger(__name__)
+
+event_loop_lag = metrics.histogram(
+    "event_loop_lag_seconds",
+    "How much later than scheduled the event loop ran the lag monitor.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+event_loop_stalls = metrics.counter(
+    "event_loop_stalls_total",
+    "Times the event loop was blocked longer than the stall threshold.",
+    ("route",),
+)
+
+# Route label of stalls outside of any request
+NO_ROUTE = "none"
+
+
+class EventLoopMonitor:
+    """Measures event loop lag and reports what blocks the loop."""
+
+    def __init__(self, interval: float, threshold: float):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Seconds between lag measurements and watchdog checks
+            threshold: Seconds the loop may be blocked before it is a stall
+        """
+        self.interval = interval
+        self.threshold = threshold
+        # Route of each request task, maintained by the metrics middleware
+        self.active_routes: Dict[asyncio.Task, str] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._reported_heartbeat: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start monitoring the running event loop; call from a coroutine."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop_event.clear()
+        self._task = self._loop.create_task(self._tick())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop_event.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join()
+
+    async def _tick(self) -> None:
+        """Wake up every interval and record how late the wake-up was."""
+        while True:
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = time.monotonic() - self._heartbeat - self.interval
+            event_loop_lag.observe(value=max(lag, 0.0))
+
+    def _watch(self) -> None:
+        """Check the heartbeat from a separate thread and report stalls."""
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def check(self) -> Optional[Dict[str, str]]:
+        """
+        Report the current stall, if the loop is blocked past the threshold.
+
+        Each stall is reported once, while it is still happening, so the
+        captured stack is the one blocking the loop.
+
+        Returns:
+            The route and stack of a newly reported stall, None otherwise
+        """
+        heartbeat = self._heartbeat
+        blocked = time.monotonic() - heartbeat - self.interval
+        if blocked < self.threshold or heartbeat == self._reported_heartbeat:
+            return None
+        self._reported_heartbeat = heartbeat
+
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame else ""
+        task = asyncio.current_task(self._loop) if self._loop else None
+        route = self.active_routes.get(task, NO_ROUTE)
+
+        event_loop_stalls.inc(route)
+        logger.warning(
+            "Event loop blocked for %.0f ms in route %s:\n%s",
+            blocked * 1000,
+            route,
+            stack,
+            extra={"stall": {"route": route, "blocked_ms": blocked * 1000}},
+        )
+        return {"route": route, "stack": stack}
+
+
+# Process-wide event loop monitor
+loop_monitor = EventLoopMonitor(
+    ops_settings.loop_monitor_interval, ops_settings.loop_stall_threshold
+)
@@ -0,0 +1,256 @@
+"""
+OutfitService for handling outfit operations.
+This service implements CRUD operations for outfits and their component items,
+and records when outfits are worn.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.outfit_model import OutfitItemModel, OutfitModel
+from backend.schemas.outfit import Outfit, OutfitCreate, OutfitItemCreate
+
+
+class OutfitService:
+    """Service class for handling outfit operations."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the OutfitService with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def _query_outfits(self, user_id: int):
+        """
+        Build a query for a user's outfits that eagerly loads the component items.
+
+        The outfit items and their clothing items are each fetched with a single
+        batched IN query, so the number of statements does not grow with the
+        number of outfits returned.
+        """
+        return (
+            self.db_session.query(OutfitModel)
+            .options(
+                selectinload(OutfitModel.items).selectinload(
+                    OutfitItemModel.clothing_item
+                )
+            )
+            .filter(OutfitModel.user_id == user_id)
+        )
+
+    def _get_owned_items(
+        self, items: List[OutfitItemCreate], user_id: int
+    ) -> Dict[int, ClothingItemModel]:
+        """
+        Load the clothing items referenced by an outfit in a single query.
+
+        Args:
+            items: The outfit items being placed
+            user_id: ID of the user who must own every clothing item
+
+        Returns:
+            Mapping of clothing item ID to the clothing item model
+
+        Raises:
+            ValueError: If any clothing item is missing or not owned by the user
+        """
+        item_ids = {item.clothing_item_id for item in items}
+        if not item_ids:
+            return {}
+
+        db_items = (
+            self.db_session.query(ClothingItemModel)
+            .filter(
+                ClothingItemModel.id.in_(item_ids),
+                ClothingItemModel.user_id == user_id,
+            )
+            .all()
+        )
+        owned = {db_item.id: db_item for db_item in db_items}
+
+        if len(owned) != len(item_ids):
+            raise ValueError("Clothing item not found or not owned by user")
+
+        return owned
+
+    def _build_outfit_items(
+        self, items: List[OutfitItemCreate], user_id: int
+    ) -> List[OutfitItemModel]:
+        """Create the ordered outfit item models for an outfit."""
+        owned = self._get_owned_items(items, user_id)
+        return [
+            OutfitItemModel(
+                clothing_item=owned[item.clothing_item_id],
+                x=item.x,
+                y=item.y,
+                rotation=item.rotation,
+                layer=item.layer,
+            )
+            for item in items
+        ]
+
+    def create_outfit(self, outfit_data: OutfitCreate, user_id: int) -> Outfit:
+        """
+        Create a new outfit.
+
+        Args:
+            outfit_data: Data for creating the outfit
+            user_id: ID of the user creating the outfit
+
+        Returns:
+            The created outfit with its ordered items
+
+        Raises:
+            ValueError: If a referenced clothing item is not owned by the user
+        """
+        db_outfit = OutfitModel(
+            name=outfit_data.name,
+            description=outfit_data.description,
+            user_id=user_id,
+            items=self._build_outfit_items(outfit_data.items, user_id),
+        )
+
+        # Add to session and commit
+        self.db_session.add(db_outfit)
+        self.db_session.commit()
+
+        return self.get_outfit(db_outfit.id, user_id)
+
+    def get_outfit(self, outfit_id: int, user_id: int) -> Optional[Outfit]:
+        """
+        Get an outfit by ID.
+
+        Args:
+            outfit_id: ID of the outfit to retrieve
+            user_id: ID of the user requesting the outfit
+
+        Returns:
+            The outfit if found and owned by user, None otherwise
+        """
+        db_outfit = (
+            self._query_outfits(user_id).filter(OutfitModel.id == outfit_id).first()
+        )
+
+        if db_outfit is None:
+            return None
+
+        return Outfit.model_validate(db_outfit)
+
+    def get_all_outfits(self, user_id: int) -> List[Outfit]:
+        """
+        Get all outfits for a user.
+
+        Args:
+            user_id: ID of the user requesting outfits (required for ownership enforcement)
+
+        Returns:
+            List of outfits owned by the user
+        """
+        db_outfits = self._query_outfits(user_id).order_by(OutfitModel.id).all()
+        return [Outfit.model_validate(db_outfit) for db_outfit in db_outfits]
+
+    def update_outfit(
+        self, outfit_id: int, outfit_data: OutfitCreate, user_id: int
+    ) -> Optional[Outfit]:
+        """
+        Update an outfit, replacing its items with the given ordered items.
+
+        Args:
+            outfit_id: ID of the outfit to update
+            outfit_data: Data to update the outfit with
+            user_id: ID of the user requesting the update (required for ownership enforcement)
+
+        Returns:
+            The updated outfit if found and owned by user, None otherwise
+
+        Raises:
+            ValueError: If a referenced clothing item is not owned by the user
+        """
+        db_outfit = (
+            self._query_outfits(user_id).filter(OutfitModel.id == outfit_id).first()
+        )
+
+        if db_outfit is None:
+            return None
+
+        db_outfit.name = outfit_data.name
+        db_outfit.description = outfit_data.description
+        db_outfit.items = self._build_outfit_items(outfit_data.items, user_id)
+
+        self.db_session.commit()
+
+        return self.get_outfit(outfit_id, user_id)
+
+    def wear_outfit(
+        self, outfit_id: int, user_id: int, worn_at: Optional[datetime] = None
+    ) -> Optional[Outfit]:
+        """
+        Record that an outfit was worn, updating the wear history of its items.
+
+        All component items are updated with a single UPDATE statement.
+
+        Args:
+            outfit_id: ID of the outfit that was worn
+            user_id: ID of the user who wore the outfit (required for ownership enforcement)
+            worn_at: When the outfit was worn, defaults to now
+
+        Returns:
+            The outfit with updated item wear history if found and owned by user,
+            None otherwise
+        """
+        owned = (
+            self.db_session.query(OutfitModel.id)
+            .filter(OutfitModel.id == outfit_id, OutfitModel.user_id == user_id)
+            .first()
+        )
+
+        if owned is None:
+            return None
+
+        outfit_item_ids = select(OutfitItemModel.clothing_item_id).where(
+            OutfitItemModel.outfit_id == outfit_id
+        )
+        self.db_session.query(ClothingItemModel).filter(
+            ClothingItemModel.id.in_(outfit_item_ids),
+            ClothingItemModel.user_id == user_id,
+        ).update(
+            {
+                ClothingItemModel.wear_count: ClothingItemModel.wear_count + 1,
+                ClothingItemModel.last_worn_at: worn_at or datetime.now(),
+            },
+            synchronize_session=False,
+        )
+        self.db_session.commit()
+
+        return self.get_outfit(outfit_id, user_id)
+
+    def delete_outfit(self, outfit_id: int, user_id: int) -> bool:
+        """
+        Delete an outfit.
+
+        Args:
+            outfit_id: ID of the outfit to delete
+            user_id: ID of the user requesting the deletion (required for ownership enforcement)
+
+        Returns:
+            True if deletion was successful and outfit owned by user, False otherwise
+        """
+        db_outfit = (
+            self.db_session.query(OutfitModel)
+            .filter(OutfitModel.id == outfit_id, OutfitModel.user_id == user_id)
+            .first()
+        )
+
+        if db_outfit is None:
+            return False
+
+        self.db_session.delete(db_outfit)
+        self.db_session.commit()
+        return True
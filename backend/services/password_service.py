@@ -0,0 +1,222 @@
+"""
+Password hashing for the Closet Management Application.
+Passwords are hashed with a deliberately slow, salted hash from passlib.
+Hashing runs on a small dedicated thread pool, so a burst of logins cannot
+occupy every request thread, and is refused once too many hashes are waiting.
+
+Pick the cost factor for a target latency on the production hardware with:
+
+    python -m backend.services.password_service --target-ms 250
+"""
+
+import argparse
+import hashlib
+import hmac
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from passlib.context import CryptContext
+from passlib.registry import get_crypt_handler
+
+from backend.config.auth_settings import auth_settings
+
+# Hashes the context can verify; the configured one hashes new passwords
+SUPPORTED_SCHEMES = ("scrypt", "argon2", "bcrypt")
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when too many passwords are already waiting to be hashed."""
+
+
+def create_password_context(
+    scheme: Optional[str] = None, rounds: Optional[int] = None
+) -> CryptContext:
+    """
+    Create the passlib context that hashes and verifies passwords.
+
+    Args:
+        scheme: Hash for new passwords, defaults to settings
+        rounds: Cost factor of the hash, defaults to settings
+
+    Returns:
+        A context that verifies every supported scheme and flags hashes of
+        another scheme or with a different cost for rehashing
+    """
+    scheme = scheme or auth_settings.password_hash_scheme
+    rounds = rounds or auth_settings.password_hash_rounds
+    options = {f"{scheme}__rounds": rounds} if rounds else {}
+    # The first scheme is the default; the others stay so that hashes stored
+    # before PASSWORD_HASH_SCHEME changed still verify
+    schemes = [scheme] + [other for other in SUPPORTED_SCHEMES if other != scheme]
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+def verify_legacy_password(password: str, salt: str, hashed_password: str) -> bool:
+    """
+    Check a password against a salted SHA-256 hash stored before passlib.
+
+    Args:
+        password: The plain text password
+        salt: The salt stored next to the hash
+        hashed_password: The stored hex digest
+
+    Returns:
+        True if the password matches
+    """
+    password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
+    return hmac.compare_digest(password_hash, hashed_password)
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords on a bounded thread pool."""
+
+    def __init__(
+        self,
+        context: Optional[CryptContext] = None,
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+    ):
+        """
+        Initialize the PasswordHasher.
+
+        Args:
+            context: Passlib context to hash with, defaults to settings
+            workers: Number of hashing threads, defaults to settings
+            max_queue: Hashes that may wait for a thread, defaults to settings
+        """
+        self.context = context or create_password_context()
+        self.workers = workers or auth_settings.password_hash_workers
+        self.max_queue = (
+            max_queue
+            if max_queue is not None
+            else auth_settings.password_hash_max_queue
+        )
+        # One slot per running or waiting hash
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hash"
+        )
+
+    def _run(self, function: Callable, *args):
+        """
+        Run a hashing function on the pool and wait for its result.
+
+        Raises:
+            PasswordHasherBusyError: If the pool and its queue are full
+        """
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusyError(
+                "Too many password checks in progress, try again later"
+            )
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password: str) -> str:
+        """
+        Hash a password with the configured scheme and cost.
+
+        Args:
+            password: The plain text password
+
+        Returns:
+            The hash, which embeds its scheme, cost and salt
+
+        Raises:
+            PasswordHasherBusyError: If too many hashes are waiting
+        """
+        return self._run(self.context.hash, password)
+
+    def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its hash uses outdated settings.
+
+        Args:
+            password: The plain text password
+            hashed_password: The stored hash
+
+        Returns:
+            Whether the password matches, and a replacement hash if one is due
+
+        Raises:
+            PasswordHasherBusyError: If too many hashes are waiting
+        """
+        if self.context.identify(hashed_password) is None:
+            return False, None
+        return self._run(self.context.verify_and_update, password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Wait for running hashes and stop the pool."""
+        self._executor.shutdown(wait=True)
+
+
+# Process-wide password hasher
+password_hasher = PasswordHasher()
+
+
+def calibrate_rounds(
+    scheme: str, target_seconds: float, samples: int = 3
+) -> Tuple[int, float]:
+    """
+    Find the highest cost factor whose hash takes no longer than the target.
+
+    Args:
+        scheme: Passlib scheme to calibrate
+        target_seconds: Acceptable time for a single hash
+        samples: Hashes timed per cost factor; the median is used
+
+    Returns:
+        The cost factor and the median seconds a hash took with it
+    """
+    handler = get_crypt_handler(scheme)
+
+    def time_hash(rounds: int) -> float:
+        hasher = handler.using(rounds=rounds)
+        timings = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            hasher.hash("calibration password")
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    rounds = handler.min_rounds
+    elapsed = time_hash(rounds)
+    while rounds < handler.max_rounds:
+        next_elapsed = time_hash(rounds + 1)
+        if next_elapsed > target_seconds:
+            break
+        rounds, elapsed = rounds + 1, next_elapsed
+
+    return rounds, elapsed
+
+
+def main():
+    """Print the cost factor that meets a target hashing latency."""
+    parser = argparse.ArgumentParser(
+        description="Calibrate the password hash cost for a target latency."
+    )
+    parser.add_argument(
+        "--scheme",
+        choices=SUPPORTED_SCHEMES,
+        default=auth_settings.password_hash_scheme,
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    args = parser.parse_args()
+
+    rounds, elapsed = calibrate_rounds(args.scheme, args.target_ms / 1000)
+    print(f"# {args.scheme} hashes in {elapsed * 1000:.0f} ms on this machine")
+    print(f"PASSWORD_HASH_SCHEME={args.scheme}")
+    print(f"PASSWORD_HASH_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Statistical sampling profiler for live API processes.
+A background thread reads the stack of every other thread at a fixed
+interval with sys._current_frames(), so the profiled code runs unmodified
+and the overhead is one stack walk per thread per sample. Samples can be
+limited to stacks that pass through given functions, such as the endpoint
+of one route, and are returned as collapsed stacks for flame graphs or as a
+pstats file.
+"""
+
+import marshal
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Optional, Tuple
+
+# (file name, first line, function name), the way pstats identifies functions
+FunctionKey = Tuple[str, int, str]
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _function_key(code) -> FunctionKey:
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+class SamplingProfiler:
+    """Samples the stacks of all other threads of the process."""
+
+    def __init__(self, interval: float, only_through: Optional[FrozenSet] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+            only_through: Code objects a stack must contain to be sampled,
+                None to sample every stack
+        """
+        self.interval = interval
+        self.only_through = only_through
+        # Root-first stacks and how often each was seen
+        self.stacks: Counter = Counter()
+        self.samples = 0
+
+    def sample(self) -> None:
+        """Record the current stack of every other thread."""
+        own_thread = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            stack = []
+            matched = self.only_through is None
+            while frame is not None:
+                code = frame.f_code
+                if not matched and code in self.only_through:
+                    matched = True
+                stack.append(_function_key(code))
+                frame = frame.f_back
+            if matched:
+                stack.reverse()
+                self.stacks[tuple(stack)] += 1
+        self.samples += 1
+
+    def run(self, duration: float) -> None:
+        """Sample at the interval for a number of seconds, in this thread."""
+        deadline = time.monotonic() + duration
+        next_sample = time.monotonic()
+        while next_sample < deadline:
+            self.sample()
+            next_sample += self.interval
+            delay = next_sample - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Running behind, e.g. on a busy GIL; skip missed samples
+                next_sample = time.monotonic()
+
+    def collapsed(self) -> str:
+        """
+        Get the samples as collapsed stacks, the input format of flame graphs.
+
+        Returns:
+            One "root;...;leaf count" line per distinct stack
+        """
+        lines = []
+        for stack, count in self.stacks.most_common():
+            frames = ";".join(
+                f"{name} ({filename}:{line})" for filename, line, name in stack
+            )
+            lines.append(f"{frames} {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def pstats(self) -> bytes:
+        """
+        Get the samples as a marshalled stats dict that pstats.Stats can load.
+
+        Times are estimated as samples times the interval: a function's own
+        time counts stacks it is the leaf of, its cumulative time stacks it is
+        anywhere in.
+
+        Returns:
+            The contents of a .pstats file
+        """
+        own: Dict[FunctionKey, int] = defaultdict(int)
+        total: Dict[FunctionKey, int] = defaultdict(int)
+        calls: Dict[FunctionKey, Dict[FunctionKey, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for function in set(stack):
+                total[function] += count
+            seen_edges = set()
+            for caller, callee in zip(stack, stack[1:]):
+                if (caller, callee) not in seen_edges:
+                    seen_edges.add((caller, callee))
+                    calls[callee][caller] += count
+
+        stats = {}
+        for function, inclusive in total.items():
+            own_time = own[function] * self.interval
+            callers = {
+                caller: (count, count, 0.0, count * self.interval)
+                for caller, count in calls[function].items()
+            }
+            stats[function] = (
+                inclusive,
+                inclusive,
+                own_time,
+                inclusive * self.interval,
+                callers,
+            )
+        return marshal.dumps(stats)
+
+
+# Only one profile runs per process at a time
+_profile_lock = threading.Lock()
+
+
+def profile_process(
+    duration: float, interval: float, only_through: Optional[FrozenSet] = None
+) -> SamplingProfiler:
+    """
+    Profile this process for a while.
+
+    Args:
+        duration: Seconds to sample for
+        interval: Seconds between samples
+        only_through: Code objects a stack must contain to be sampled
+
+    Returns:
+        The profiler holding the samples
+
+    Raises:
+        ProfilerBusyError: If another profile is running
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("Another profile is already running")
+    try:
+        profiler = SamplingProfiler(interval, only_through)
+        profiler.run(duration)
+        return profiler
+    finally:
+        _profile_lock.release()
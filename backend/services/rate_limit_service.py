@@ -0,0 +1,68 @@
+"""
+Token bucket rate limiting for the Closet Management Application.
+Every key owns a bucket that holds up to burst tokens and refills at rate
+tokens per second; a request takes one token or is refused with the time
+until the next token arrives.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+
+class TokenBucketLimiter:
+    """Thread-safe token buckets by key, keeping the most recently used keys."""
+
+    def __init__(self, rate: float, burst: int, max_keys: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Tokens added to a bucket per second
+            burst: Capacity of a bucket, which new keys start with
+            max_keys: Buckets kept; dropping one only forgets its debt
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        # Key -> [tokens, monotonic time of the last refill]
+        self._buckets: "OrderedDict[Hashable, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, now: Optional[float] = None) -> float:
+        """
+        Take a token from the key's bucket.
+
+        Args:
+            key: Who or what is being limited
+            now: Current monotonic time, defaults to time.monotonic()
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now]
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                tokens, updated = bucket
+                bucket[0] = min(self.burst, tokens + (now - updated) * self.rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / self.rate
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
@@ -0,0 +1,304 @@
+"""
+RecommendationService for suggesting outfits from a user's closet.
+Each item is reduced to a small feature vector (outfit slot, dominant color,
+seasons and wear history). Candidate outfits are scored slot by slot with
+batched NumPy matrix operations and pruned to a fixed beam after every slot.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.schemas.clothing_item import ClothingItem, ItemSeason
+from backend.schemas.outfit import OutfitRecommendation
+from backend.services.color_service import MIN_PALETTE_WEIGHT, decode_palettes
+
+# Outfit slots, in the order recommended items are returned
+TOP, BOTTOM, SHOES, OUTERWEAR = range(4)
+
+# Lowercase category names that fill each slot; other categories are skipped
+SLOT_CATEGORIES = {
+    TOP: ["top", "shirt", "t-shirt", "blouse", "sweater", "hoodie"],
+    BOTTOM: ["bottom", "pants", "jeans", "trousers", "shorts", "skirt", "leggings"],
+    SHOES: ["shoe", "sneaker", "boot", "sandal"],
+    OUTERWEAR: ["outerwear", "coat", "jacket", "parka", "blazer"],
+}
+CATEGORY_SLOTS = {
+    category: slot
+    for slot, categories in SLOT_CATEGORIES.items()
+    for category in categories
+}
+
+# Seasons as bits, so the seasons shared by an outfit are a bitwise AND
+SEASON_BITS = {"spring": 1, "summer": 2, "fall": 4, "winter": 8, "allSeason": 15}
+ALL_SEASONS = SEASON_BITS["allSeason"]
+
+# Chroma at which a color counts as fully saturated. Less saturated colors are
+# increasingly treated as neutrals, which go with everything.
+SATURATED_CHROMA = 30.0
+
+# Days over which a worn item recovers its freshness
+WEAR_RECOVERY_DAYS = 14.0
+
+# How much an item's share of all wears lowers its freshness
+WEAR_COUNT_PENALTY = 0.5
+
+# Share of the score that comes from wear history; the rest is color harmony
+FRESHNESS_WEIGHT = 0.25
+
+# Partial outfits kept after each slot is added
+DEFAULT_BEAM_WIDTH = 256
+
+
+@dataclass
+class ItemFeatures:
+    """Feature vectors for a set of clothing items, one row per item."""
+
+    ids: np.ndarray  # (n,) clothing item IDs
+    slots: np.ndarray  # (n,) outfit slot, -1 for items that fill no slot
+    hues: np.ndarray  # (n, 2) unit a/b direction of the dominant color
+    saturation: np.ndarray  # (n,) 0 for neutral or unknown colors, up to 1
+    seasons: np.ndarray  # (n,) bitmask of the seasons the item is worn in
+    freshness: np.ndarray  # (n,) 1 for unworn items, lower for worn items
+
+
+def category_slot(category: Optional[str]) -> int:
+    """Get the outfit slot filled by a category, or -1 if it fills none."""
+    name = (category or "").strip().lower()
+    return CATEGORY_SLOTS.get(name, CATEGORY_SLOTS.get(name.removesuffix("s"), -1))
+
+
+def season_mask(seasons: Optional[List[str]]) -> int:
+    """Get the season bitmask of an item; items without seasons fit all."""
+    mask = 0
+    for season in seasons or []:
+        mask |= SEASON_BITS.get(season, 0)
+    return mask or ALL_SEASONS
+
+
+def build_features(rows: Sequence[tuple], now: datetime) -> ItemFeatures:
+    """
+    Build feature vectors for clothing items.
+
+    Args:
+        rows: Tuples of (id, category, color_palette, seasons, wear_count,
+            last_worn_at), as selected from the clothing items table
+        now: Current time, used to age the wear history
+
+    Returns:
+        Feature vectors for the items, in the order of the rows
+    """
+    count = len(rows)
+    ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=count)
+    slots = np.fromiter(
+        (category_slot(row[1]) for row in rows), dtype=np.int8, count=count
+    )
+    seasons = np.fromiter(
+        (season_mask(row[3]) for row in rows), dtype=np.int8, count=count
+    )
+
+    # Dominant color of every item with a palette, decoded in one step
+    dominant = np.zeros((count, 2))
+    with_palette = [index for index, row in enumerate(rows) if row[2]]
+    if with_palette:
+        palettes = decode_palettes([rows[index][2] for index in with_palette])
+        significant = palettes[:, 0, 3] >= MIN_PALETTE_WEIGHT
+        dominant[with_palette] = np.where(
+            significant[:, None], palettes[:, 0, 1:3], 0.0
+        )
+    chroma = np.hypot(dominant[:, 0], dominant[:, 1])
+    hues = dominant / np.where(chroma > 0, chroma, 1.0)[:, None]
+    saturation = np.clip(chroma / SATURATED_CHROMA, 0.0, 1.0)
+
+    # Recently worn items recover over time; often worn items stay less fresh
+    days_since_worn = np.fromiter(
+        (
+            (now - row[5]).total_seconds() / 86400 if row[5] is not None else np.inf
+            for row in rows
+        ),
+        dtype=np.float64,
+        count=count,
+    )
+    wear_counts = np.fromiter(
+        (row[4] or 0 for row in rows), dtype=np.float64, count=count
+    )
+    recency = 1 - np.exp(-np.maximum(days_since_worn, 0) / WEAR_RECOVERY_DAYS)
+    usage = wear_counts / max(wear_counts.max(initial=0), 1)
+    freshness = recency * (1 - WEAR_COUNT_PENALTY * usage)
+
+    return ItemFeatures(ids, slots, hues, saturation, seasons, freshness)
+
+
+def _harmony(features: ItemFeatures, rows: np.ndarray, columns: np.ndarray):
+    """
+    Score how well every item in rows goes with every item in columns.
+
+    Matching and opposite hues score 1 and hues at right angles clash. The clash
+    is scaled by how saturated both colors are, so neutrals go with anything.
+
+    Returns:
+        Array of shape (len(rows), len(columns)) with scores between 0 and 1
+    """
+    cosine = features.hues[rows] @ features.hues[columns].T
+    clash = 1 - cosine**2
+    return 1 - np.outer(features.saturation[rows], features.saturation[columns]) * clash
+
+
+def rank_outfits(
+    features: ItemFeatures,
+    limit: int = 10,
+    season: Optional[int] = None,
+    outerwear: bool = False,
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+) -> List[Tuple[np.ndarray, float]]:
+    """
+    Find the best scoring outfits of one top, bottom and pair of shoes, and
+    optionally outerwear.
+
+    Outfits are grown one slot at a time. Each step scores every kept partial
+    outfit against every candidate for the next slot as one matrix, drops
+    combinations without a shared season and keeps only the best beam_width.
+    An outfit's score blends its mean pairwise color harmony with the mean
+    freshness of its items.
+
+    Args:
+        features: Feature vectors of the closet
+        limit: Maximum number of outfits to return
+        season: Optional season bitmask every item must be worn in
+        outerwear: Whether outfits include an outerwear item
+        beam_width: Partial outfits kept after each slot is added
+
+    Returns:
+        (item row indices in slot order, score) pairs, best first
+    """
+    slots = [TOP, BOTTOM, SHOES] + ([OUTERWEAR] if outerwear else [])
+    candidates = []
+    for slot in slots:
+        mask = features.slots == slot
+        if season is not None:
+            mask &= (features.seasons & season) != 0
+        if not mask.any():
+            return []
+        candidates.append(np.flatnonzero(mask))
+
+    # Every top starts a partial outfit
+    chosen = candidates[0][:, None]
+    harmony_sum = np.zeros(len(chosen))
+    freshness_sum = features.freshness[chosen[:, 0]]
+    shared_seasons = features.seasons[chosen[:, 0]]
+
+    for step, columns in enumerate(candidates[1:], start=1):
+        harmony = harmony_sum[:, None]
+        for slot_rows in chosen.T:
+            harmony = harmony + _harmony(features, slot_rows, columns)
+        freshness = freshness_sum[:, None] + features.freshness[columns]
+        seasons = shared_seasons[:, None] & features.seasons[columns]
+
+        item_count = step + 1
+        pair_count = item_count * (item_count - 1) / 2
+        combined = (1 - FRESHNESS_WEIGHT) * harmony / pair_count
+        combined += FRESHNESS_WEIGHT * freshness / item_count
+        combined = np.where(seasons != 0, combined, -np.inf).ravel()
+
+        keep = limit if step == len(candidates) - 1 else beam_width
+        keep = min(keep, int(np.isfinite(combined).sum()))
+        if keep == 0:
+            return []
+        best = np.argpartition(-combined, keep - 1)[:keep]
+        parents, picks = np.divmod(best, len(columns))
+
+        chosen = np.column_stack([chosen[parents], columns[picks]])
+        harmony_sum = harmony.ravel()[best]
+        freshness_sum = freshness.ravel()[best]
+        shared_seasons = seasons.ravel()[best]
+        scores = combined[best]
+
+    order = np.argsort(-scores, kind="stable")[:limit]
+    return [(chosen[index], float(scores[index])) for index in order]
+
+
+class RecommendationService:
+    """Service class for recommending outfits."""
+
+    def __init__(self, db_session: Session):
+        """
+        Initialize the RecommendationService with a database session.
+
+        Args:
+            db_session: SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    def recommend_outfits(
+        self,
+        user_id: int,
+        limit: int = 10,
+        season: Optional[ItemSeason] = None,
+        outerwear: bool = False,
+    ) -> List[OutfitRecommendation]:
+        """
+        Recommend outfits from the user's closet.
+
+        Only the columns needed for the features are loaded for the whole
+        closet; full items are loaded for the recommended outfits alone.
+
+        Args:
+            user_id: ID of the user whose closet is used
+            limit: Maximum number of outfits to return
+            season: Optional season every item must be worn in
+            outerwear: Whether outfits include an outerwear item
+
+        Returns:
+            Recommended outfits ordered from best to worst
+        """
+        rows = (
+            self.db_session.query(
+                ClothingItemModel.id,
+                ClothingItemModel.category,
+                ClothingItemModel.color_palette,
+                ClothingItemModel.seasons,
+                ClothingItemModel.wear_count,
+                ClothingItemModel.last_worn_at,
+            )
+            .filter(ClothingItemModel.user_id == user_id)
+            .all()
+        )
+        if not rows:
+            return []
+
+        features = build_features(rows, datetime.now())
+        ranked = rank_outfits(
+            features,
+            limit=limit,
+            season=SEASON_BITS[season] if season is not None else None,
+            outerwear=outerwear,
+        )
+        if not ranked:
+            return []
+
+        item_ids = {
+            int(features.ids[index]) for indices, _ in ranked for index in indices
+        }
+        db_items = (
+            self.db_session.query(ClothingItemModel)
+            .filter(
+                ClothingItemModel.user_id == user_id,
+                ClothingItemModel.id.in_(item_ids),
+            )
+            .all()
+        )
+        items = {
+            db_item.id: ClothingItem.model_validate(db_item) for db_item in db_items
+        }
+
+        return [
+            OutfitRecommendation(
+                items=[items[int(features.ids[index])] for index in indices],
+                score=score,
+            )
+            for indices, score in ranked
+        ]
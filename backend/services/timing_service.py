@@ -0,0 +1,102 @@
+"""
+Per-request timing of SQL, file I/O and response serialization.
+The request being handled owns a RequestTimings object in a context variable,
+which follows it into the thread pool that runs sync routes and
+dependencies. SQLAlchemy cursor hooks and the file I/O helpers add to it
+only while a request is being timed, so the cost is a few clock reads per
+statement or file.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class RequestTimings:
+    """Where the time of one request went."""
+
+    started: float = field(default_factory=time.perf_counter)
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+    file_count: int = 0
+    file_bytes: int = 0
+    file_seconds: float = 0.0
+    # When the route's endpoint returned; the response starts after serializing
+    endpoint_done: Optional[float] = None
+    serialize_seconds: float = 0.0
+
+    def server_timing(self, total_seconds: float) -> str:
+        """
+        Format the timings as a Server-Timing header value.
+
+        Args:
+            total_seconds: Time the application took for the request
+
+        Returns:
+            Metrics for the database, files, serialization and the total
+        """
+        return ", ".join(
+            [
+                f'db;dur={self.sql_seconds * 1000:.1f};desc="{self.sql_count} queries"',
+                f'file;dur={self.file_seconds * 1000:.1f};desc="{self.file_bytes} bytes"',
+                f"serialize;dur={self.serialize_seconds * 1000:.1f}",
+                f"app;dur={total_seconds * 1000:.1f}",
+            ]
+        )
+
+
+# Timings of the request being handled, None outside of requests
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def record_file_io(num_bytes: int, seconds: float) -> None:
+    """
+    Add a file read or write to the timings of the current request.
+
+    Args:
+        num_bytes: Bytes read or written
+        seconds: Time the file operation took
+    """
+    timings = current_timings.get()
+    if timings is not None:
+        timings.file_count += 1
+        timings.file_bytes += num_bytes
+        timings.file_seconds += seconds
+
+
+def mark_endpoint_done() -> None:
+    """Record that the current request's endpoint returned."""
+    timings = current_timings.get()
+    if timings is not None:
+        timings.endpoint_done = time.perf_counter()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_timings.get() is not None:
+        conn.info.setdefault("request_query_starts", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("request_query_starts")
+    timings = current_timings.get()
+    if starts and timings is not None:
+        timings.sql_count += 1
+        timings.sql_seconds += time.perf_counter() - starts.pop()
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    starts = connection.info.get("request_query_starts") if connection else None
+    if starts:
+        starts.pop()
@@ -0,0 +1,133 @@
+"""
+Access token issuance and stateless verification.
+Tokens are signed JWTs carrying the user ID, so verifying one needs no
+database lookup. Tokens that already passed verification are remembered in a
+small LRU cache until they expire, so repeated requests with the same token
+skip the signature check.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from jose import JWTError, jwt
+
+from backend.config.auth_settings import auth_settings
+from backend.schemas.auth import TokenData
+
+
+class VerifiedTokenCache:
+    """Thread-safe LRU cache of verified tokens and their expiry times."""
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of tokens kept; 0 disables the cache
+        """
+        self.max_size = max_size
+        self._tokens: "OrderedDict[str, Tuple[TokenData, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str, now: float) -> Optional[TokenData]:
+        """
+        Get the data of a verified token that has not expired.
+
+        Args:
+            token: The encoded token
+            now: Current time as a POSIX timestamp
+
+        Returns:
+            The token data, or None if the token is not cached or has expired
+        """
+        with self._lock:
+            entry = self._tokens.get(token)
+            if entry is None:
+                return None
+            token_data, expires_at = entry
+            if expires_at <= now:
+                del self._tokens[token]
+                return None
+            self._tokens.move_to_end(token)
+            return token_data
+
+    def put(self, token: str, token_data: TokenData, expires_at: float) -> None:
+        """Remember a verified token until it expires."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._tokens[token] = (token_data, expires_at)
+            self._tokens.move_to_end(token)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every verified token."""
+        with self._lock:
+            self._tokens.clear()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+# Process-wide cache of verified tokens
+verified_tokens = VerifiedTokenCache(auth_settings.token_cache_size)
+
+
+def create_access_token(
+    user_id: int, email: str, expires_delta: Optional[timedelta] = None
+) -> str:
+    """
+    Issue a signed access token for a user.
+
+    Args:
+        user_id: ID of the authenticated user
+        email: Email of the authenticated user
+        expires_delta: Lifetime of the token, defaults to settings
+
+    Returns:
+        The encoded JWT
+    """
+    issued_at = datetime.now(timezone.utc)
+    expires_at = issued_at + (
+        expires_delta or timedelta(minutes=auth_settings.access_token_expire_minutes)
+    )
+    claims = {"sub": str(user_id), "email": email, "iat": issued_at, "exp": expires_at}
+    return jwt.encode(
+        claims, auth_settings.jwt_secret_key, algorithm=auth_settings.jwt_algorithm
+    )
+
+
+def verify_access_token(token: str) -> TokenData:
+    """
+    Verify an access token and return its data.
+
+    Args:
+        token: The encoded JWT
+
+    Returns:
+        The user ID and email the token was issued for
+
+    Raises:
+        ValueError: If the token is malformed, has a bad signature or expired
+    """
+    now = datetime.now(timezone.utc).timestamp()
+    token_data = verified_tokens.get(token, now)
+    if token_data is not None:
+        return token_data
+
+    try:
+        claims = jwt.decode(
+            token,
+            auth_settings.jwt_secret_key,
+            algorithms=[auth_settings.jwt_algorithm],
+        )
+        token_data = TokenData(user_id=int(claims["sub"]), email=claims.get("email"))
+        expires_at = float(claims["exp"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        raise ValueError("Invalid or expired token")
+
+    verified_tokens.put(token, token_data, expires_at)
+    return token_data
@@ -4,29 +4,90 @@ This service implements file handling workflows for clothing item images.
 """
 
 import base64
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.config.sharding import shard_map
 from backend.config.upload_settings import upload_settings
 from backend.models.clothing_item_model import ClothingItemModel
+from backend.repositories.item_repository import ItemRepository, item_repository
 from backend.schemas.clothing_item import ClothingItem
+from backend.services.duplicate_service import (
+    compute_image_hash,
+    duplicate_index,
+    format_image_hash,
+)
+from backend.services.job_service import job_handler
+from backend.services.metrics_service import image_bytes
+from backend.services.timing_service import record_file_io
+
+# Files younger than this may belong to an upload that has not committed yet
+ORPHAN_MIN_AGE_SECONDS = 3600
+
+
+@job_handler("uploads.gc")
+def collect_orphaned_images(db_session: Session, payload: Dict[str, Any]):
+    """
+    Job handler that deletes upload files no clothing item refers to.
+
+    Args:
+        db_session: SQLAlchemy database session
+        payload: Optional {"min_age_seconds": files younger than this are kept}
+
+    Returns:
+        {"removed": number of files deleted}
+    """
+    min_age = payload.get("min_age_seconds", ORPHAN_MIN_AGE_SECONDS)
+    upload_dir = Path(upload_settings.upload_dir)
+    if not upload_dir.is_dir():
+        return {"removed": 0}
+
+    # Items on every shard share the upload directory
+    query = select(ClothingItemModel.image_path).where(
+        ClothingItemModel.image_path.isnot(None)
+    )
+    rows = []
+    if shard_map.enabled:
+        for engine in shard_map.shards:
+            with engine.connect() as connection:
+                rows.extend(connection.execute(query))
+    else:
+        rows.extend(db_session.execute(query))
+    referenced = {Path(image_path).resolve() for (image_path,) in rows}
+
+    removed = 0
+    cutoff = time.time() - min_age
+    for path in upload_dir.iterdir():
+        if (
+            path.is_file()
+            and path.stat().st_mtime < cutoff
+            and path.resolve() not in referenced
+        ):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return {"removed": removed}
 
 
 class UploadService:
     """Service class for handling image uploads and processing."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, items: Optional[ItemRepository] = None):
         """
         Initialize the UploadService with a database session.
 
         Args:
             db_session: SQLAlchemy database session
+            items: Item repository, defaults to the one of the configured
+                storage backend
         """
         self.db_session = db_session
+        self.items = items if items is not None else item_repository(db_session)
         self.upload_dir = Path(upload_settings.upload_dir)
         self.upload_dir.mkdir(exist_ok=True)
 
@@ -47,13 +108,7 @@ class UploadService:
         """
         # Generate a unique filename using UUID to ensure uniqueness
         # Verify the item belongs to the user
-        db_item = (
-            self.db_session.query(ClothingItemModel)
-            .filter(
-                ClothingItemModel.id == item_id, ClothingItemModel.user_id == user_id
-            )
-            .first()
-        )
+        db_item = self.items.get(item_id, user_id)
 
         if db_item is None:
             return None
@@ -78,6 +133,9 @@ class UploadService:
         unique_filename = f"{user_id}_{item_id}_{uuid.uuid4().hex}{file_extension}"
         target_path = self.upload_dir / unique_filename
 
+        # Perceptual hash for duplicate detection, None if the image is unreadable
+        image_hash = compute_image_hash(file_data)
+
         try:
             # If there's an existing image, delete it first
             if db_item.image_path:
@@ -86,26 +144,49 @@ class UploadService:
                     old_file_path.unlink()
 
             # Save the file to the upload directory
+            start = time.perf_counter()
             with open(target_path, "wb") as f:
                 f.write(file_data)
+            record_file_io(len(file_data), time.perf_counter() - start)
+            image_bytes.inc("write", amount=len(file_data))
 
-            # Update the item with the image path
+            # Update the item with the image path and hash
             db_item.image_path = str(target_path)
+            db_item.image_hash = (
+                format_image_hash(image_hash) if image_hash is not None else None
+            )
             db_item.updated_at = datetime.now()
 
             # Commit changes
-            self.db_session.commit()
-            self.db_session.refresh(db_item)
+            self.items.save(db_item)
+
+            # Extract the dominant colors without delaying the response
+            self.items.extract_palette_later(item_id, user_id, file_data)
+
+            # Flag other items whose image looks the same
+            possible_duplicates = []
+            if image_hash is not None:
+                possible_duplicates = duplicate_index.check_and_add(
+                    self.items,
+                    user_id,
+                    item_id,
+                    image_hash,
+                    upload_settings.duplicate_max_distance,
+                )
+            else:
+                duplicate_index.remove(user_id, item_id)
 
             # Convert the file data to base64 string for the response
             image_data = base64.b64encode(file_data).decode("utf-8")
 
             # Return the updated item
-            return ClothingItem.from_model(db_item, image_data)
+            result = ClothingItem.from_model(db_item, image_data)
+            result.possible_duplicates = possible_duplicates
+            return result
 
         except Exception:
             # If there's an error, rollback the transaction and return None
-            self.db_session.rollback()
+            self.items.rollback()
             return None
 
     def get_upload_directory(self) -> str:
@@ -143,13 +224,7 @@ class UploadService:
             True if image was deleted successfully, False otherwise
         """
         # Verify the item belongs to the user
-        db_item = (
-            self.db_session.query(ClothingItemModel)
-            .filter(
-                ClothingItemModel.id == item_id, ClothingItemModel.user_id == user_id
-            )
-            .first()
-        )
+        db_item = self.items.get(item_id, user_id)
 
         if db_item is None or db_item.image_path is None:
             return False
@@ -160,16 +235,18 @@ class UploadService:
             if file_path.exists():
                 file_path.unlink()
 
-            # Clear the image path from the database
+            # Clear the image path, colors and hash from the database
             db_item.image_path = None
+            db_item.color_palette = None
+            db_item.image_hash = None
             db_item.updated_at = datetime.now()
 
             # Commit changes
-            self.db_session.commit()
-            self.db_session.refresh(db_item)
+            self.items.save(db_item)
+            duplicate_index.remove(user_id, item_id)
 
             return True
         except Exception:
             # If there's an error, rollback the transaction and return False
-            self.db_session.rollback()
+            self.items.rollback()
             return False
@@ -5,21 +5,36 @@ from unittest.mock import Mock
 
 import pytest
 from fastapi import FastAPI
-from motor.motor_asyncio import AsyncIOMotorClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from starlette.testclient import TestClient
 
 from backend.api.v1.auth import get_auth_service
 from backend.api.v1.auth import router as auth_router
+from backend.api.v1.collections import get_collection_service
+from backend.api.v1.collections import router as collections_router
 from backend.api.v1.items import get_item_service
 from backend.api.v1.items import router as items_router
+from backend.api.v1.jobs import router as jobs_router
+from backend.api.v1.ops import router as ops_router
+from backend.api.v1.outfits import get_outfit_service
+from backend.api.v1.outfits import router as outfits_router
 from backend.config.database import Base, get_db
+from backend.config.sharding import ShardMap
+from backend.config.upload_settings import upload_settings
+from backend.migrate import migrate
 from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.outfit_model import OutfitItemModel, OutfitModel
 from backend.models.user import User
 from backend.schemas.clothing_item import ClothingItem, ClothingItemCreate
 from backend.services.auth_service import AuthService
+from backend.services.collection_service import CollectionService
+from backend.services.duplicate_service import duplicate_index
 from backend.services.item_service import ItemService
+from backend.services.outfit_service import OutfitService
+from backend.services.password_service import create_password_context, password_hasher
+from backend.services.token_service import create_access_token, verified_tokens
 from backend.services.upload_service import UploadService
 
 # Test database configuration
@@ -29,18 +44,80 @@ TEST_DATABASE_URL = os.getenv(
 )
 TEST_MONGO_URL = os.getenv("TEST_MONGO_URL", "mongodb://localhost:27017/test_closet_db")
 
-# Create test database engine
-test_engine = create_engine(TEST_DATABASE_URL)
+# Create test database engine; the in-memory SQLite database lives in one
+# connection shared with the threads that run sync routes
+if TEST_DATABASE_URL.startswith("sqlite"):
+    test_engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+else:
+    test_engine = create_engine(TEST_DATABASE_URL)
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
-# Create test MongoDB client
-test_mongo_client = AsyncIOMotorClient(TEST_MONGO_URL)
-test_mongo_db = test_mongo_client.test_closet_db
-
 
 test_app = FastAPI()
 test_app.include_router(items_router, prefix="/api/v1/items", tags=["items"])
 test_app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
+test_app.include_router(outfits_router, prefix="/api/v1/outfits", tags=["outfits"])
+test_app.include_router(
+    collections_router, prefix="/api/v1/collections", tags=["collections"]
+)
+test_app.include_router(jobs_router, prefix="/api/v1/jobs", tags=["jobs"])
+test_app.include_router(ops_router, prefix="/api/v1/ops", tags=["ops"])
+
+
+class QueryCounter:
+    """
+    Context manager that records the SQL statements an engine executes.
+
+    Use it to put a budget on the queries of an operation, for example that
+    listing items takes one query no matter how many items there are.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+    @property
+    def count(self):
+        """Number of statements executed so far."""
+        return len(self.statements)
+
+    def assert_at_most(self, limit):
+        """Fail with the executed statements if there were more than limit."""
+        assert (
+            self.count <= limit
+        ), f"Expected at most {limit} queries, got {self.count}:\n" + "\n".join(
+            self.statements
+        )
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch):
+    """Hash passwords at the lowest cost so auth tests stay fast."""
+    monkeypatch.setattr(password_hasher, "context", create_password_context(rounds=1))
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(monkeypatch, tmp_path):
+    """Store uploaded images in a temporary directory, not the repository."""
+    path = tmp_path / "uploads"
+    path.mkdir()
+    monkeypatch.setattr(upload_settings, "upload_dir", str(path))
+    monkeypatch.setenv("UPLOAD_DIR", str(path))
+    return path
 
 
 @pytest.fixture(scope="function")
@@ -56,6 +133,27 @@ def db_session():
 
     Base.metadata.drop_all(bind=test_engine)
 
+    # Item IDs are reused by the next test, so drop the in-memory image index
+    duplicate_index.clear()
+    verified_tokens.clear()
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Fixture that counts the SQL statements run against the test database.
+
+    Usage:
+        with count_queries() as queries:
+            service.get_all_items(user_id)
+        queries.assert_at_most(1)
+    """
+
+    def make_counter():
+        return QueryCounter(test_engine)
+
+    return make_counter
+
 
 @pytest.fixture
 def test_user_a(db_session):
@@ -199,10 +297,63 @@ def test_clothing_item_full_b(db_session, test_user_b):
     return ClothingItem.model_validate(db_item)
 
 
+@pytest.fixture
+def test_outfit_a(db_session, test_user_a, test_clothing_item_partial_a):
+    """
+    Fixture that creates an outfit with a single item in the database for tests.
+    Uses test_user_a
+    """
+
+    db_outfit = OutfitModel(
+        name="Test Outfit",
+        description="A test outfit",
+        user_id=test_user_a.id,
+        items=[
+            OutfitItemModel(
+                clothing_item_id=test_clothing_item_partial_a.id,
+                x=10.0,
+                y=20.0,
+                rotation=45.0,
+                layer=1,
+            )
+        ],
+    )
+    db_session.add(db_outfit)
+    db_session.commit()
+    # The session is often configured to expire/refresh the object
+    db_session.refresh(db_outfit)
+    return db_outfit
+
+
 @pytest.fixture(scope="function")
 def mongo_db():
     """Create a new MongoDB database for each test"""
-    return test_mongo_db
+    # Imported here so that tests which do not use MongoDB never load motor
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(TEST_MONGO_URL)
+    yield client.test_closet_db
+    client.close()
+
+
+@pytest.fixture
+def shards(tmp_path):
+    """
+    Shard map over a directory database and two shards, each a SQLite file.
+    """
+    directory = create_engine(f"sqlite:///{tmp_path / 'directory.db'}")
+    engines = [
+        create_engine(f"sqlite:///{tmp_path / f'shard{shard}.db'}")
+        for shard in range(2)
+    ]
+    migrate(directory)
+    for shard, engine in enumerate(engines):
+        migrate(engine, shard)
+
+    yield ShardMap(directory, engines)
+
+    for engine in [directory, *engines]:
+        engine.dispose()
 
 
 @pytest.fixture
@@ -277,6 +428,80 @@ def override_item_service(client, mock_item_service_instance):
     client.app.dependency_overrides.pop(get_item_service, None)
 
 
+@pytest.fixture
+def mock_outfit_service_instance():
+    """
+    Fixture that provides a mocked instance of OutfitService for modification.
+    """
+    # Create the mock instance with spec=True for safety
+    mock_instance = Mock(spec=OutfitService)
+
+    # Yield the instance so the test can configure it (e.g., set return_value)
+    yield mock_instance
+
+    # Cleanup (optional, but good practice): reset the mock state after the test
+    mock_instance.reset_mock()
+
+
+@pytest.fixture
+def override_outfit_service(client, mock_outfit_service_instance):
+    """
+    Fixture that applies the dependency override for OutfitService.
+    It uses the mock instance provided by mock_outfit_service_instance.
+    """
+
+    def mock_get_outfit_service_callable():
+        return mock_outfit_service_instance
+
+    # Apply the override
+    client.app.dependency_overrides[get_outfit_service] = (
+        mock_get_outfit_service_callable
+    )
+
+    # Yield control back to the test
+    yield
+
+    # Cleanup: Remove the override after the test is complete
+    client.app.dependency_overrides.pop(get_outfit_service, None)
+
+
+@pytest.fixture
+def mock_collection_service_instance():
+    """
+    Fixture that provides a mocked instance of CollectionService for modification.
+    """
+    # Create the mock instance with spec=True for safety
+    mock_instance = Mock(spec=CollectionService)
+
+    # Yield the instance so the test can configure it (e.g., set return_value)
+    yield mock_instance
+
+    # Cleanup (optional, but good practice): reset the mock state after the test
+    mock_instance.reset_mock()
+
+
+@pytest.fixture
+def override_collection_service(client, mock_collection_service_instance):
+    """
+    Fixture that applies the dependency override for CollectionService.
+    It uses the mock instance provided by mock_collection_service_instance.
+    """
+
+    def mock_get_collection_service_callable():
+        return mock_collection_service_instance
+
+    # Apply the override
+    client.app.dependency_overrides[get_collection_service] = (
+        mock_get_collection_service_callable
+    )
+
+    # Yield control back to the test
+    yield
+
+    # Cleanup: Remove the override after the test is complete
+    client.app.dependency_overrides.pop(get_collection_service, None)
+
+
 # @pytest.fixture
 # def mock_upload_service_instance():
 #     """
@@ -335,6 +560,19 @@ def override_get_db(client, db_session):
     client.app.dependency_overrides.pop(get_db, None)
 
 
+@pytest.fixture
+def auth_headers():
+    """
+    Fixture that builds Authorization headers with a real access token for a user.
+    """
+
+    def make_headers(user):
+        token = create_access_token(user.id, user.email)
+        return {"Authorization": f"Bearer {token}"}
+
+    return make_headers
+
+
 @pytest.fixture(scope="function")
 def client():
     """
@@ -0,0 +1,122 @@
+"""
+Tests for the admission control middleware and the database slot limit.
+"""
+
+import threading
+
+from fastapi import Depends, FastAPI
+from starlette.testclient import TestClient
+
+from backend.api.middleware import AdmissionControlMiddleware
+from backend.config import database
+from backend.config.database import get_db
+from backend.services.lifecycle_service import InFlightRequests
+from backend.services.rate_limit_service import TokenBucketLimiter
+
+
+def _make_client(client_burst=100, route_burst=100, requests=None):
+    """Create a client for a small app behind the middleware."""
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"status": "healthy"}
+
+    @app.get("/api/things/{thing_id}")
+    def get_thing(thing_id: int):
+        return {"id": thing_id}
+
+    @app.get("/api/other")
+    def get_other():
+        return {}
+
+    @app.get("/api/db")
+    def use_db(db=Depends(get_db)):
+        return {}
+
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        client_limiter=TokenBucketLimiter(0.001, client_burst, 100),
+        route_limiter=TokenBucketLimiter(0.001, route_burst, 100),
+        enabled=True,
+        requests=requests,
+    )
+    return TestClient(app)
+
+
+def test_route_limit(auth_headers, test_user_a, test_user_b):
+    """Test that a client is limited per route template, not per URL."""
+    client = _make_client(route_burst=2)
+    headers = auth_headers(test_user_a)
+
+    assert client.get("/api/things/1", headers=headers).status_code == 200
+    assert client.get("/api/things/2", headers=headers).status_code == 200
+    response = client.get("/api/things/3", headers=headers)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    # Other routes and other users have their own buckets
+    assert client.get("/api/other", headers=headers).status_code == 200
+    other = auth_headers(test_user_b)
+    assert client.get("/api/things/1", headers=other).status_code == 200
+
+
+def test_client_limit(auth_headers, test_user_a):
+    """Test that a client is limited across all routes."""
+    client = _make_client(client_burst=2)
+    headers = auth_headers(test_user_a)
+
+    assert client.get("/api/things/1", headers=headers).status_code == 200
+    assert client.get("/api/other", headers=headers).status_code == 200
+    assert client.get("/api/things/1", headers=headers).status_code == 429
+
+    # Anonymous requests are limited by IP instead
+    assert client.get("/api/other").status_code == 200
+
+
+def test_health_is_not_limited():
+    """Test that health checks are never rejected."""
+    client = _make_client(client_burst=1, route_burst=1)
+
+    assert all(client.get("/health").status_code == 200 for _ in range(3))
+
+
+def test_database_busy(monkeypatch):
+    """Test that requests fail fast with 503 while every database slot is taken."""
+    client = _make_client()
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(database, "db_slots", slots)
+    monkeypatch.setattr(database.settings, "postgresql_acquire_timeout", 0.01)
+    monkeypatch.setattr(database, "SessionLocal", lambda: _FakeSession())
+
+    assert client.get("/api/db").status_code == 200
+
+    slots.acquire()
+    try:
+        response = client.get("/api/db")
+    finally:
+        slots.release()
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_draining_refuses_requests():
+    """Test that requests are refused with 503 once the process is draining."""
+    requests = InFlightRequests()
+    client = _make_client(requests=requests)
+
+    assert client.get("/health").status_code == 200
+    assert requests.count == 0
+
+    requests.draining = True
+    response = client.get("/health")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.headers["Connection"] == "close"
+
+
+class _FakeSession:
+    """Stands in for a session, since the limit is taken before connecting."""
+
+    def close(self):
+        pass
@@ -9,6 +9,8 @@ from unittest.mock import Mock, patch
 from backend.api.v1.auth import get_auth_service
 from backend.schemas.user import UserCreate, UserResponse
 from backend.services.auth_service import AuthService
+from backend.services.password_service import PasswordHasherBusyError
+from backend.services.token_service import verify_access_token
 
 
 def test_register_user_success(
@@ -117,7 +119,9 @@ def test_login_user_success(
     assert response.status_code == 200
     data = response.json()
     assert data["token_type"] == "bearer"
-    # Note: access_token is a fake token for demo purposes
+    token_data = verify_access_token(data["access_token"])
+    assert token_data.user_id == test_user_a.id
+    assert token_data.email == test_user_a.email
 
 
 def test_login_user_invalid_credentials(
@@ -164,6 +168,25 @@ def test_login_user_nonexistent_user(
     assert "Invalid email or password" in response.json()["detail"]
 
 
+def test_login_user_hasher_busy(
+    override_auth_service, mock_auth_service_instance, override_get_db, client
+):
+    """
+    Test that logins are turned away with 503 while password hashing is saturated.
+    """
+    mock_auth_service_instance.authenticate_user.side_effect = (
+        PasswordHasherBusyError("Too many password checks in progress")
+    )
+
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "busy@example.com", "password": "anypassword"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
 def test_auth_api_structure(
     override_auth_service, mock_auth_service_instance, override_get_db, client
 ):
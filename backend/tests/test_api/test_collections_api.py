@@ -0,0 +1,192 @@
+"""
+Test cases for the Collections API endpoints.
+These tests cover CRUD operations for smart collections and opening their items.
+"""
+
+from datetime import datetime
+
+from backend.schemas.collection import Collection, CollectionCreate, CollectionRule
+
+
+def _collection(user_id):
+    """Build a collection response for the mocked service."""
+    return Collection(
+        id=1,
+        user_id=user_id,
+        name="Cheap coats",
+        rules=[
+            CollectionRule(field="category", op="eq", value="Coats"),
+            CollectionRule(field="price", op="lt", value=100),
+        ],
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+def test_get_collections_success(
+    override_get_db,
+    client,
+    test_user_a,
+    override_collection_service,
+    mock_collection_service_instance,
+    auth_headers,
+):
+    """
+    Test successful retrieval of all collections for a user.
+    """
+    mock_collection_service_instance.get_all_collections.return_value = [
+        _collection(test_user_a.id)
+    ]
+
+    response = client.get("/api/v1/collections", headers=auth_headers(test_user_a))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["rules"][1] == {"field": "price", "op": "lt", "value": 100}
+
+
+def test_get_collection_items_success(
+    override_get_db,
+    client,
+    test_user_a,
+    test_clothing_item_partial_a,
+    override_collection_service,
+    mock_collection_service_instance,
+    auth_headers,
+):
+    """
+    Test opening a collection returns its member items.
+    """
+    mock_collection_service_instance.get_collection_items.return_value = [
+        test_clothing_item_partial_a
+    ]
+
+    response = client.get(
+        "/api/v1/collections/1/items", headers=auth_headers(test_user_a)
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["id"] for item in data] == [test_clothing_item_partial_a.id]
+
+
+def test_get_collection_items_not_found(
+    override_get_db,
+    client,
+    test_user_a,
+    override_collection_service,
+    mock_collection_service_instance,
+    auth_headers,
+):
+    """
+    Test opening a collection that does not exist.
+    """
+    mock_collection_service_instance.get_collection_items.return_value = None
+
+    response = client.get(
+        "/api/v1/collections/99999/items", headers=auth_headers(test_user_a)
+    )
+
+    assert response.status_code == 404
+    assert "Collection not found or not owned by user" in response.json()["detail"]
+
+
+def test_create_collection_success(
+    override_get_db,
+    client,
+    test_user_a,
+    override_collection_service,
+    mock_collection_service_instance,
+    auth_headers,
+):
+    """
+    Test successful creation of a new collection.
+    """
+    collection = _collection(test_user_a.id)
+    mock_collection_service_instance.create_collection.return_value = collection
+
+    collection_data = CollectionCreate(name=collection.name, rules=collection.rules)
+    response = client.post(
+        "/api/v1/collections",
+        headers=auth_headers(test_user_a),
+        json=collection_data.model_dump(),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Cheap coats"
+
+    args, _ = mock_collection_service_instance.create_collection.call_args
+    assert args[0] == collection_data
+    assert args[1] == test_user_a.id
+
+
+def test_create_collection_invalid_rule(
+    override_get_db,
+    client,
+    test_user_a,
+    override_collection_service,
+    mock_collection_service_instance,
+    auth_headers,
+):
+    """
+    Test that invalid rule values are reported as a bad request.
+    """
+    mock_collection_service_instance.create_collection.side_effect = ValueError(
+        "could not convert string to float: 'cheap'"
+    )
+
+    response = client.post(
+        "/api/v1/collections",
+        headers=auth_headers(test_user_a),
+        json={
+            "name": "Broken",
+            "rules": [{"field": "price", "op": "lt", "value": "cheap"}],
+        },
+    )
+
+    assert response.status_code == 400
+
+
+def test_create_collection_unknown_field(
+    override_get_db,
+    client,
+    test_user_a,
+    override_collection_service,
+    mock_collection_service_instance,
+    auth_headers,
+):
+    """
+    Test that rules may only reference supported clothing item fields.
+    """
+    response = client.post(
+        "/api/v1/collections",
+        headers=auth_headers(test_user_a),
+        json={
+            "name": "Broken",
+            "rules": [{"field": "image_path", "op": "eq", "value": "x"}],
+        },
+    )
+
+    assert response.status_code == 422
+    mock_collection_service_instance.create_collection.assert_not_called()
+
+
+def test_delete_collection_not_found(
+    override_get_db,
+    client,
+    test_user_a,
+    override_collection_service,
+    mock_collection_service_instance,
+    auth_headers,
+):
+    """
+    Test deleting a collection that does not exist.
+    """
+    mock_collection_service_instance.delete_collection.return_value = False
+
+    response = client.delete(
+        "/api/v1/collections/99999", headers=auth_headers(test_user_a)
+    )
+
+    assert response.status_code == 404
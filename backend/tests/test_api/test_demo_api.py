@@ -0,0 +1,53 @@
+"""
+Tests for the ephemeral demo mode, which keeps users and items in memory.
+"""
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.config.settings import settings
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.user import User
+from backend.repositories import item_repository, user_repository
+from backend.repositories.item_repository import InMemoryItemRepository
+from backend.repositories.user_repository import InMemoryUserRepository
+
+
+@pytest.fixture
+def demo_mode(monkeypatch):
+    """Keep users and items in fresh in-memory repositories."""
+    monkeypatch.setattr(settings, "storage_backend", "memory")
+    monkeypatch.setattr(item_repository, "memory_items", InMemoryItemRepository())
+    monkeypatch.setattr(user_repository, "memory_users", InMemoryUserRepository())
+
+
+def test_demo_mode_keeps_closet_in_memory(demo_mode, client, db_session):
+    """Test that a user can sign up and manage items without the database."""
+    credentials = {"email": "demo@example.com", "password": "secret"}
+    response = client.post(
+        "/api/v1/auth/register", json={**credentials, "full_name": "Demo User"}
+    )
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+
+    response = client.post("/api/v1/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = client.post(
+        "/api/v1/items/",
+        headers=headers,
+        json={"name": "Shirt", "category": "Tops", "user_id": user_id},
+    )
+    assert response.status_code == 200
+    item_id = response.json()["id"]
+
+    response = client.get("/api/v1/items/", headers=headers)
+    assert [item["id"] for item in response.json()] == [item_id]
+
+    response = client.delete(f"/api/v1/items/{item_id}", headers=headers)
+    assert response.status_code == 204
+    assert client.get(f"/api/v1/items/{item_id}", headers=headers).status_code == 404
+
+    for model in (User, ClothingItemModel):
+        count = db_session.scalar(select(func.count()).select_from(model))
+        assert count == 0
@@ -9,8 +9,12 @@ from datetime import datetime
 from io import BytesIO
 from unittest.mock import Mock
 
-from backend.api.v1.items import get_item_service
-from backend.schemas.clothing_item import ClothingItem, ClothingItemCreate
+import pytest
+
+from backend.api.v1.items import get_color_service, get_item_service
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.schemas.clothing_item import ClothingItem, ClothingItemCreate, ColorMatch
+from backend.services.color_service import ColorService
 from backend.services.item_service import ItemService
 
 
@@ -22,6 +26,7 @@ def test_get_items_success(
     test_clothing_item_full_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test successful retrieval of all items for a user.
@@ -33,7 +38,7 @@ def test_get_items_success(
     ]
 
     # Make the request
-    response = client.get("/api/v1/items", params={"user_id": test_user_a.id})
+    response = client.get("/api/v1/items", headers=auth_headers(test_user_a))
 
     # Verify the response
     assert response.status_code == 200
@@ -55,6 +60,7 @@ def test_get_items_empty_list(
     test_user_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test retrieval of items when user has no items.
@@ -63,7 +69,7 @@ def test_get_items_empty_list(
     mock_item_service_instance.get_all_items.return_value = []
 
     # Make the request
-    response = client.get("/api/v1/items", params={"user_id": test_user_a.id})
+    response = client.get("/api/v1/items", headers=auth_headers(test_user_a))
 
     # Verify the response
     assert response.status_code == 201
@@ -77,6 +83,7 @@ def test_get_item_success(
     test_clothing_item_partial_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test successful retrieval of a specific item by ID.
@@ -87,7 +94,7 @@ def test_get_item_success(
     # Make the request
     response = client.get(
         f"/api/v1/items/{test_clothing_item_partial_a.id}",
-        params={"user_id": test_user_a.id},
+        headers=auth_headers(test_user_a),
     )
 
     # Verify the response
@@ -103,6 +110,7 @@ def test_get_item_not_found(
     test_user_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test retrieval of non-existent item.
@@ -111,7 +119,7 @@ def test_get_item_not_found(
     mock_item_service_instance.get_item.return_value = None
 
     # Make the request
-    response = client.get("/api/v1/items/99999", params={"user_id": test_user_a.id})
+    response = client.get("/api/v1/items/99999", headers=auth_headers(test_user_a))
 
     # Verify the response
     assert response.status_code == 404
@@ -125,6 +133,7 @@ def test_create_item_success(
     test_clothing_item_full_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test successful creation of a new item by consolidating all form parts
@@ -149,7 +158,7 @@ def test_create_item_success(
     )
     # Make the request using form data and files
     response = client.post(
-        "/api/v1/items", params={"user_id": test_user_a.id}, json=data.model_dump()
+        "/api/v1/items", headers=auth_headers(test_user_a), json=data.model_dump()
     )
 
     # Verify the response
@@ -171,6 +180,7 @@ def test_update_item_success(
     test_clothing_item_full_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test successful update of an existing item.
@@ -198,7 +208,7 @@ def test_update_item_success(
     # Make the request using form data and files
     response = client.put(
         f"/api/v1/items/{test_clothing_item_full_a.id}",
-        params={"user_id": test_user_a.id},
+        headers=auth_headers(test_user_a),
         json=data.model_dump(),
     )
 
@@ -220,6 +230,7 @@ def test_update_item_not_found(
     test_user_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test update of non-existent item.
@@ -245,7 +256,7 @@ def test_update_item_not_found(
     # Make the request with proper data structure
     response = client.put(
         "/api/v1/items/99999",
-        params={"user_id": test_user_a.id},
+        headers=auth_headers(test_user_a),
         json=data.model_dump(),
     )
 
@@ -254,6 +265,35 @@ def test_update_item_not_found(
     assert "Item not found or not owned by user" in response.json()["detail"]
 
 
+@pytest.mark.parametrize("method", ["post", "put"])
+def test_body_user_id_is_ignored(
+    override_get_db, client, db_session, test_user_a, test_user_b, auth_headers, method
+):
+    """
+    Test that items stay with the requesting user whatever user_id the body names.
+    """
+    db_item = ClothingItemModel(name="Shirt", category="Tops", user_id=test_user_a.id)
+    db_session.add(db_item)
+    db_session.commit()
+
+    url = "/api/v1/items/" if method == "post" else f"/api/v1/items/{db_item.id}"
+    response = getattr(client, method)(
+        url,
+        headers=auth_headers(test_user_a),
+        json={"name": "Stolen", "category": "Tops", "user_id": test_user_b.id},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["user_id"] == test_user_a.id
+    db_session.expire_all()
+    item = db_session.query(ClothingItemModel).filter_by(id=response.json()["id"])
+    assert item.one().user_id == test_user_a.id
+    assert (
+        db_session.query(ClothingItemModel).filter_by(user_id=test_user_b.id).count()
+        == 0
+    )
+
+
 def test_delete_item_success(
     override_get_db,
     client,
@@ -261,6 +301,7 @@ def test_delete_item_success(
     test_clothing_item_partial_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test successful deletion of an item.
@@ -271,7 +312,7 @@ def test_delete_item_success(
     # Make the request
     response = client.delete(
         f"/api/v1/items/{test_clothing_item_partial_a.id}",
-        params={"user_id": test_user_a.id},
+        headers=auth_headers(test_user_a),
     )
 
     # Verify the response
@@ -284,6 +325,7 @@ def test_delete_item_not_found(
     test_user_a,
     override_item_service,
     mock_item_service_instance,
+    auth_headers,
 ):
     """
     Test deletion of non-existent item.
@@ -292,7 +334,7 @@ def test_delete_item_not_found(
     mock_item_service_instance.delete_item.return_value = False
 
     # Make the request
-    response = client.delete("/api/v1/items/99999", params={"user_id": test_user_a.id})
+    response = client.delete("/api/v1/items/99999", headers=auth_headers(test_user_a))
 
     # Verify the response
     assert response.status_code == 404
@@ -301,37 +343,37 @@ def test_delete_item_not_found(
 
 def test_items_api_structure(override_get_db, client):
     """
-    Test that items endpoints exist and are callable.
+    Test that items endpoints exist and require an access token.
     """
     # Test GET /api/v1/items
     response = client.get("/api/v1/items")
-    assert response.status_code in [400, 422]  # Bad request or validation error
+    assert response.status_code == 401  # Access token required
 
     # Test GET /api/v1/items/{id}
     response = client.get("/api/v1/items/1")
-    assert response.status_code in [400, 422]  # Bad request or validation error
+    assert response.status_code == 401  # Access token required
 
     # Test POST /api/v1/items
     response = client.post("/api/v1/items")
-    assert response.status_code in [400, 422]  # Bad request or validation error
+    assert response.status_code == 401  # Access token required
 
     # Test PUT /api/v1/items/{id}
     response = client.put("/api/v1/items/1")
-    assert response.status_code in [400, 422]  # Bad request or validation error
+    assert response.status_code == 401  # Access token required
 
     # Test DELETE /api/v1/items/{id}
     response = client.delete("/api/v1/items/1")
-    assert response.status_code in [400, 422]  # Bad request or validation error
+    assert response.status_code == 401  # Access token required
 
 
-def test_create_item_invalid_data(override_get_db, client, test_user_a):
+def test_create_item_invalid_data(override_get_db, client, test_user_a, auth_headers):
     """
     Test creation of item with invalid data.
     """
     # Make the request with incomplete data
     response = client.post(
         "/api/v1/items",
-        params={"user_id": test_user_a.id},
+        headers=auth_headers(test_user_a),
         json={
             "name": "",  # Invalid: empty name
         },
@@ -340,7 +382,7 @@ def test_create_item_invalid_data(override_get_db, client, test_user_a):
 
 
 def test_update_item_invalid_data(
-    override_get_db, client, test_user_a, test_clothing_item_partial_a
+    override_get_db, client, test_user_a, test_clothing_item_partial_a, auth_headers
 ):
     """
     Test update of item with invalid data.
@@ -348,7 +390,7 @@ def test_update_item_invalid_data(
     # Make the request with invalid data
     response = client.put(
         f"/api/v1/items/{test_clothing_item_partial_a.id}",
-        params={"user_id": test_user_a.id},
+        headers=auth_headers(test_user_a),
         json={
             "name": "",  # Invalid: empty name
         },
@@ -358,26 +400,23 @@ def test_update_item_invalid_data(
     assert response.status_code == 422
 
 
-def test_get_items_invalid_user_id(
+def test_get_items_without_token(
     override_get_db,
     client,
-    test_user_a,
     override_item_service,
     mock_item_service_instance,
 ):
     """
-    Test retrieval of items with invalid user ID.
+    Test that items cannot be listed without an access token.
     """
-    # Configure the mock to return an empty list for invalid user
-    mock_item_service_instance.get_all_items.return_value = []
+    response = client.get("/api/v1/items")
 
-    # Make request with invalid user ID
-    response = client.get("/api/v1/items", params={"user_id": -1})
-    assert response.status_code == 201
-    # TODO in the future in [400, 422]
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    mock_item_service_instance.get_all_items.assert_not_called()
 
 
-def test_get_item_invalid_user_id(
+def test_get_item_invalid_token(
     override_get_db,
     client,
     test_clothing_item_partial_a,
@@ -385,13 +424,112 @@ def test_get_item_invalid_user_id(
     mock_item_service_instance,
 ):
     """
-    Test retrieval of specific item with invalid user ID.
+    Test that an item cannot be read with a forged access token.
     """
-    # Configure the mock to return None for invalid user
-    mock_item_service_instance.get_item.return_value = None
+    response = client.get(
+        f"/api/v1/items/{test_clothing_item_partial_a.id}",
+        headers={"Authorization": "Bearer not-a-real-token"},
+    )
+
+    assert response.status_code == 401
+    mock_item_service_instance.get_item.assert_not_called()
+
+
+def test_get_color_matches_success(
+    override_get_db, client, test_user_a, test_clothing_item_partial_a, auth_headers
+):
+    """
+    Test finding items that go with a color.
+    """
+    mock_color_service = Mock(spec=ColorService)
+    mock_color_service.find_matching_items.return_value = [
+        ColorMatch(item=test_clothing_item_partial_a, delta_e=3.5)
+    ]
+    client.app.dependency_overrides[get_color_service] = lambda: mock_color_service
+
+    response = client.get(
+        "/api/v1/items/matches/color",
+        headers=auth_headers(test_user_a),
+        params={"color": "#1f3a5c", "limit": 5},
+    )
+
+    client.app.dependency_overrides.pop(get_color_service, None)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["item"]["id"] == test_clothing_item_partial_a.id
+    assert data[0]["delta_e"] == 3.5
+    mock_color_service.find_matching_items.assert_called_once_with(
+        test_user_a.id, "#1f3a5c", scheme="similar", limit=5, max_delta_e=None
+    )
+
+
+def test_get_color_matches_invalid_color(
+    override_get_db, client, test_user_a, auth_headers
+):
+    """
+    Test that an invalid color is reported as a bad request.
+    """
+    mock_color_service = Mock(spec=ColorService)
+    mock_color_service.find_matching_items.side_effect = ValueError("bad color")
+    client.app.dependency_overrides[get_color_service] = lambda: mock_color_service
 
     response = client.get(
-        f"/api/v1/items/{test_clothing_item_partial_a.id}", params={"user_id": -1}
+        "/api/v1/items/matches/color",
+        headers=auth_headers(test_user_a),
+        params={"color": "blue"},
+    )
+
+    client.app.dependency_overrides.pop(get_color_service, None)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("item_count", [1, 20])
+def test_get_all_items_query_budget(
+    override_get_db,
+    client,
+    db_session,
+    test_user_a,
+    auth_headers,
+    count_queries,
+    item_count,
+):
+    """
+    Test that listing items runs one query no matter how many items the user has.
+    """
+    headers = auth_headers(test_user_a)
+    db_session.add_all(
+        ClothingItemModel(name=f"Item {i}", category="Tops", user_id=test_user_a.id)
+        for i in range(item_count)
     )
-    # TODO 404 should not be returned, when properly handling validation.
-    assert response.status_code in [400, 422, 404]
+    db_session.commit()
+    db_session.expire_all()
+
+    with count_queries() as queries:
+        response = client.get("/api/v1/items", headers=headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == item_count
+    queries.assert_at_most(1)
+
+
+def test_get_item_query_budget(
+    override_get_db, client, db_session, test_user_a, auth_headers, count_queries
+):
+    """
+    Test that getting one item runs a single query.
+    """
+    headers = auth_headers(test_user_a)
+    db_item = ClothingItemModel(name="Shirt", category="Tops", user_id=test_user_a.id)
+    db_session.add(db_item)
+    db_session.commit()
+    item_id = db_item.id
+    db_session.expire_all()
+
+    with count_queries() as queries:
+        response = client.get(f"/api/v1/items/{item_id}", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == item_id
+    queries.assert_at_most(1)
@@ -0,0 +1,58 @@
+"""
+Test cases for the Jobs API endpoints.
+These tests cover reading the status of background jobs.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+from backend.api.v1.jobs import get_job_service
+from backend.schemas.job import Job
+from backend.services.job_service import JobService
+
+
+def test_get_job_success(override_get_db, client, test_user_a, auth_headers):
+    """
+    Test reading the status of a job.
+    """
+    mock_job_service = Mock(spec=JobService)
+    mock_job_service.get_job.return_value = Job(
+        id=7,
+        kind="image.palette",
+        status="queued",
+        attempts=1,
+        max_attempts=5,
+        run_at=datetime.now(),
+        payload={"item_id": 3, "user_id": test_user_a.id},
+        last_error="OSError: disk full",
+        user_id=test_user_a.id,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+    client.app.dependency_overrides[get_job_service] = lambda: mock_job_service
+
+    response = client.get("/api/v1/jobs/7", headers=auth_headers(test_user_a))
+
+    client.app.dependency_overrides.pop(get_job_service, None)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "queued"
+    assert data["last_error"] == "OSError: disk full"
+    mock_job_service.get_job.assert_called_once_with(7, test_user_a.id)
+
+
+def test_get_job_not_found(override_get_db, client, test_user_a, auth_headers):
+    """
+    Test reading a job that does not exist or belongs to another user.
+    """
+    mock_job_service = Mock(spec=JobService)
+    mock_job_service.get_job.return_value = None
+    client.app.dependency_overrides[get_job_service] = lambda: mock_job_service
+
+    response = client.get("/api/v1/jobs/99999", headers=auth_headers(test_user_a))
+
+    client.app.dependency_overrides.pop(get_job_service, None)
+
+    assert response.status_code == 404
+    assert "Job not found or not owned by user" in response.json()["detail"]
@@ -0,0 +1,55 @@
+"""
+Tests for the metrics middleware.
+"""
+
+from fastapi import FastAPI, HTTPException
+from starlette.testclient import TestClient
+
+from backend.api.middleware import MetricsMiddleware
+from backend.services.metrics_service import (
+    http_request_duration,
+    http_requests,
+    http_requests_in_progress,
+    http_response_size,
+    metrics,
+)
+
+
+def _make_client():
+    """Create a client for a small app behind the metrics middleware."""
+    app = FastAPI()
+
+    @app.get("/api/things/{thing_id}")
+    def get_thing(thing_id: int):
+        if thing_id == 0:
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"id": thing_id}
+
+    app.add_middleware(MetricsMiddleware)
+    return TestClient(app)
+
+
+def test_requests_are_recorded_per_route_template():
+    """Test that counts, latencies and sizes are labelled by route template."""
+    metrics.clear()
+    client = _make_client()
+    route = "/api/things/{thing_id}"
+
+    client.get("/api/things/1")
+    client.get("/api/things/2")
+    client.get("/api/things/0")
+    client.get("/nowhere")
+
+    assert http_requests.value("GET", route, "200") == 2
+    assert http_requests.value("GET", route, "404") == 1
+    assert http_requests.value("GET", "unmatched", "404") == 1
+    assert http_request_duration.count("GET", route) == 3
+    assert http_response_size.count("GET", route) == 3
+    assert http_requests_in_progress.value("GET", route) == 0
+
+    text = metrics.render()
+    assert (
+        'http_requests_total{method="GET",route="/api/things/{thing_id}",status="200"} 2.0'
+        in text
+    )
+    assert "# TYPE http_request_duration_seconds histogram" in text
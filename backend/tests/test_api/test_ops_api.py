@@ -0,0 +1,106 @@
+"""
+Tests for the ops API endpoints.
+"""
+
+import pytest
+
+from backend.config.ops_settings import ops_settings
+from backend.config.pool_metrics import pool_metrics
+from backend.models.job_model import JobModel
+
+
+@pytest.fixture
+def ops_headers(monkeypatch):
+    """Enable the ops endpoints and return headers carrying the ops token."""
+    monkeypatch.setattr(ops_settings, "ops_token", "ops-secret")
+    return {"X-Ops-Token": "ops-secret"}
+
+
+def test_ops_endpoints_disabled_without_token_setting(client, monkeypatch):
+    """Test that ops endpoints are closed unless an ops token is configured."""
+    monkeypatch.setattr(ops_settings, "ops_token", None)
+
+    response = client.get("/api/v1/ops/pool", headers={"X-Ops-Token": ""})
+
+    assert response.status_code == 403
+
+
+def test_ops_endpoints_reject_wrong_token(client, ops_headers):
+    """Test that ops endpoints require the configured token."""
+    assert client.get("/api/v1/ops/pool").status_code == 403
+    response = client.get("/api/v1/ops/pool", headers={"X-Ops-Token": "wrong"})
+    assert response.status_code == 403
+
+
+def test_get_pool_stats(client, ops_headers):
+    """Test that pool settings and recorded metrics are reported."""
+    response = client.get("/api/v1/ops/pool", headers=ops_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pool_pre_ping"] is True
+    assert data["max_overflow"] >= 0
+    assert data["checkouts"] >= 0
+    assert data["wait_seconds_p95"] >= 0
+
+
+def test_reset_pool_stats(client, ops_headers):
+    """Test that resetting clears the recorded metrics."""
+    pool_metrics.checkouts = 5
+
+    response = client.post("/api/v1/ops/pool/reset", headers=ops_headers)
+
+    assert response.status_code == 204
+    assert pool_metrics.checkouts == 0
+
+
+def test_profile(client, ops_headers):
+    """Test that a short profile returns collapsed stacks."""
+    response = client.post(
+        "/api/v1/ops/profile", params={"seconds": 0.05}, headers=ops_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+
+def test_profile_route_filter(client, ops_headers):
+    """Test that a known route is accepted and an unknown one is rejected."""
+    response = client.post(
+        "/api/v1/ops/profile",
+        params={"seconds": 0.05, "route": "GET /api/v1/items/", "output": "pstats"},
+        headers=ops_headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+
+    response = client.post(
+        "/api/v1/ops/profile",
+        params={"seconds": 0.05, "route": "GET /api/v1/nothing"},
+        headers=ops_headers,
+    )
+    assert response.status_code == 400
+
+
+def test_profile_too_long(client, ops_headers):
+    """Test that profiles longer than the configured maximum are rejected."""
+    response = client.post(
+        "/api/v1/ops/profile", params={"seconds": 3600}, headers=ops_headers
+    )
+
+    assert response.status_code == 400
+
+
+def test_collect_orphaned_uploads_queues_job(
+    override_get_db, client, db_session, ops_headers
+):
+    """Test that upload garbage collection is queued as a job."""
+    response = client.post(
+        "/api/v1/ops/uploads/gc", params={"min_age_seconds": 60}, headers=ops_headers
+    )
+
+    assert response.status_code == 202
+    job = db_session.query(JobModel).filter_by(id=response.json()["id"]).one()
+    assert job.kind == "uploads.gc"
+    assert job.payload == {"min_age_seconds": 60}
+    assert job.user_id is None
@@ -0,0 +1,294 @@
+"""
+Test cases for the Outfits API endpoints.
+These tests cover all CRUD operations for outfits, wear tracking and
+recommendations.
+"""
+
+from unittest.mock import Mock
+
+from backend.api.v1.outfits import get_recommendation_service
+from backend.schemas.clothing_item import ClothingItem
+from backend.schemas.outfit import (
+    Outfit,
+    OutfitCreate,
+    OutfitItemCreate,
+    OutfitRecommendation,
+)
+from backend.services.recommendation_service import RecommendationService
+
+
+def test_get_outfits_success(
+    override_get_db,
+    client,
+    test_user_a,
+    test_outfit_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test successful retrieval of all outfits for a user.
+    """
+    mock_outfit_service_instance.get_all_outfits.return_value = [
+        Outfit.model_validate(test_outfit_a)
+    ]
+
+    response = client.get("/api/v1/outfits", headers=auth_headers(test_user_a))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["name"] == "Test Outfit"
+    assert data[0]["items"][0]["position"] == 0
+    assert data[0]["items"][0]["clothing_item"]["name"] == "Test T-Shirt"
+
+
+def test_get_outfit_not_found(
+    override_get_db,
+    client,
+    test_user_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test retrieval of a non-existent outfit.
+    """
+    mock_outfit_service_instance.get_outfit.return_value = None
+
+    response = client.get("/api/v1/outfits/99999", headers=auth_headers(test_user_a))
+
+    assert response.status_code == 404
+    assert "Outfit not found or not owned by user" in response.json()["detail"]
+
+
+def test_create_outfit_success(
+    override_get_db,
+    client,
+    test_user_a,
+    test_outfit_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test successful creation of a new outfit.
+    """
+    mock_outfit_service_instance.create_outfit.return_value = Outfit.model_validate(
+        test_outfit_a
+    )
+
+    outfit_data = OutfitCreate(
+        name="Test Outfit",
+        items=[
+            OutfitItemCreate(
+                clothing_item_id=test_outfit_a.items[0].clothing_item_id,
+                rotation=45.0,
+            )
+        ],
+    )
+
+    response = client.post(
+        "/api/v1/outfits",
+        headers=auth_headers(test_user_a),
+        json=outfit_data.model_dump(),
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Test Outfit"
+    assert data["user_id"] == test_user_a.id
+    assert data["items"][0]["rotation"] == 45.0
+
+    # Verify the service received the parsed request and the user ID
+    args, _ = mock_outfit_service_instance.create_outfit.call_args
+    assert args[0] == outfit_data
+    assert args[1] == test_user_a.id
+
+
+def test_create_outfit_with_unowned_item(
+    override_get_db,
+    client,
+    test_user_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test that creating an outfit with another user's item is rejected.
+    """
+    mock_outfit_service_instance.create_outfit.side_effect = ValueError(
+        "Clothing item not found or not owned by user"
+    )
+
+    outfit_data = OutfitCreate(
+        name="Borrowed",
+        items=[OutfitItemCreate(clothing_item_id=99999)],
+    )
+
+    response = client.post(
+        "/api/v1/outfits",
+        headers=auth_headers(test_user_a),
+        json=outfit_data.model_dump(),
+    )
+
+    assert response.status_code == 400
+    assert "not owned by user" in response.json()["detail"]
+
+
+def test_update_outfit_not_found(
+    override_get_db,
+    client,
+    test_user_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test updating a non-existent outfit.
+    """
+    mock_outfit_service_instance.update_outfit.return_value = None
+
+    response = client.put(
+        "/api/v1/outfits/99999",
+        headers=auth_headers(test_user_a),
+        json=OutfitCreate(name="Nope").model_dump(),
+    )
+
+    assert response.status_code == 404
+
+
+def test_delete_outfit_success(
+    override_get_db,
+    client,
+    test_user_a,
+    test_outfit_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test successful deletion of an outfit.
+    """
+    mock_outfit_service_instance.delete_outfit.return_value = True
+
+    response = client.delete(
+        f"/api/v1/outfits/{test_outfit_a.id}", headers=auth_headers(test_user_a)
+    )
+
+    assert response.status_code == 204
+
+
+def test_delete_outfit_not_found(
+    override_get_db,
+    client,
+    test_user_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test deleting a non-existent outfit.
+    """
+    mock_outfit_service_instance.delete_outfit.return_value = False
+
+    response = client.delete("/api/v1/outfits/99999", headers=auth_headers(test_user_a))
+
+    assert response.status_code == 404
+
+
+def test_wear_outfit_success(
+    override_get_db,
+    client,
+    test_user_a,
+    test_outfit_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test recording that an outfit was worn.
+    """
+    mock_outfit_service_instance.wear_outfit.return_value = Outfit.model_validate(
+        test_outfit_a
+    )
+
+    response = client.post(
+        f"/api/v1/outfits/{test_outfit_a.id}/wear",
+        headers=auth_headers(test_user_a),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == test_outfit_a.id
+    mock_outfit_service_instance.wear_outfit.assert_called_once_with(
+        test_outfit_a.id, test_user_a.id
+    )
+
+
+def test_wear_outfit_not_found(
+    override_get_db,
+    client,
+    test_user_a,
+    override_outfit_service,
+    mock_outfit_service_instance,
+    auth_headers,
+):
+    """
+    Test wearing a non-existent outfit.
+    """
+    mock_outfit_service_instance.wear_outfit.return_value = None
+
+    response = client.post(
+        "/api/v1/outfits/99999/wear", headers=auth_headers(test_user_a)
+    )
+
+    assert response.status_code == 404
+
+
+def test_get_recommendations_success(
+    override_get_db, client, test_user_a, test_clothing_item_partial_a, auth_headers
+):
+    """
+    Test getting outfit recommendations.
+    """
+    mock_recommendation_service = Mock(spec=RecommendationService)
+    mock_recommendation_service.recommend_outfits.return_value = [
+        OutfitRecommendation(
+            items=[ClothingItem.model_validate(test_clothing_item_partial_a)],
+            score=0.75,
+        )
+    ]
+    client.app.dependency_overrides[get_recommendation_service] = (
+        lambda: mock_recommendation_service
+    )
+
+    response = client.get(
+        "/api/v1/outfits/recommendations",
+        headers=auth_headers(test_user_a),
+        params={"season": "winter", "outerwear": True},
+    )
+
+    client.app.dependency_overrides.pop(get_recommendation_service, None)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["score"] == 0.75
+    assert data[0]["items"][0]["id"] == test_clothing_item_partial_a.id
+    mock_recommendation_service.recommend_outfits.assert_called_once_with(
+        test_user_a.id, 10, "winter", True
+    )
+
+
+def test_get_recommendations_invalid_season(
+    override_get_db, client, test_user_a, auth_headers
+):
+    """
+    Test that an unknown season is rejected.
+    """
+    response = client.get(
+        "/api/v1/outfits/recommendations",
+        headers=auth_headers(test_user_a),
+        params={"season": "monsoon"},
+    )
+
+    assert response.status_code == 422
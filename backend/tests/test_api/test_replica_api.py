@@ -0,0 +1,107 @@
+"""
+Tests for read replica routing: GET requests read from a replica, and a client
+that just wrote reads its own writes from the primary.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+
+from backend.config import database
+from backend.config.database import RECENT_WRITE_COOKIE, Base
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.user import User
+from backend.services.token_service import create_access_token
+
+USER_ID = 1
+
+
+@pytest.fixture
+def replicated(monkeypatch, tmp_path):
+    """
+    Point the application at a primary and a replica SQLite file that share a
+    user. Nothing is copied between them, like a replica lagging far behind.
+    """
+    engines = {}
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as session:
+            session.add(
+                User(
+                    id=USER_ID,
+                    email="test@example.com",
+                    full_name="Test User",
+                    hashed_password="UHHH",
+                    salt="Test",
+                )
+            )
+            session.commit()
+        engines[name] = engine
+
+    monkeypatch.setattr(database, "_engine", engines["primary"])
+    monkeypatch.setattr(database, "_replica_engines", [engines["replica"]])
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+def _add_item(engine, name):
+    """Add an item of the user directly to one database."""
+    with Session(engine) as session:
+        session.add(ClothingItemModel(name=name, category="Tops", user_id=USER_ID))
+        session.commit()
+
+
+def _item_names(client, headers):
+    """Get the names of the user's items as the client sees them."""
+    response = client.get("/api/v1/items/", headers=headers)
+    if response.status_code != 200:
+        return []
+    return [item["name"] for item in response.json()]
+
+
+@pytest.fixture
+def headers():
+    """Authorization headers of the user."""
+    token = create_access_token(USER_ID, "test@example.com")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_reads_go_to_replica(replicated, client, headers):
+    """Test that GET requests read from the replica."""
+    _add_item(replicated["replica"], "On replica")
+    _add_item(replicated["primary"], "On primary")
+
+    assert _item_names(client, headers) == ["On replica"]
+
+
+def test_reads_follow_own_writes(replicated, client, headers):
+    """Test that a client reads from the primary right after writing."""
+    writer = client
+    with TestClient(client.app) as other:
+        response = writer.post(
+            "/api/v1/items/",
+            headers=headers,
+            json={"name": "Just bought", "category": "Tops", "user_id": USER_ID},
+        )
+        assert response.status_code == 200
+        assert RECENT_WRITE_COOKIE in response.cookies
+
+        assert _item_names(writer, headers) == ["Just bought"]
+        # A client that did not write still reads the lagging replica
+        assert _item_names(other, headers) == []
+
+
+def test_window_expires(replicated, client, headers, monkeypatch):
+    """Test that reads return to the replica once the window is over."""
+    monkeypatch.setattr(database.settings, "postgresql_read_your_writes_window", 0)
+    _add_item(replicated["replica"], "On replica")
+
+    client.post(
+        "/api/v1/items/",
+        headers=headers,
+        json={"name": "Just bought", "category": "Tops", "user_id": USER_ID},
+    )
+    assert _item_names(client, headers) == ["On replica"]
@@ -0,0 +1,93 @@
+"""
+Tests for the Server-Timing middleware and the per-request timings it reports.
+"""
+
+import logging
+import re
+
+from fastapi import APIRouter, FastAPI
+from sqlalchemy import create_engine, text
+from starlette.testclient import TestClient
+
+from backend.api.middleware import ServerTimingMiddleware, TimedRoute
+from backend.services.timing_service import current_timings, record_file_io
+
+
+def _make_client():
+    """Create a client for a small app whose routes run SQL and file I/O."""
+    engine = create_engine("sqlite://")
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/api/things/{thing_id}")
+    def get_thing(thing_id: int):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        record_file_io(2048, 0.001)
+        return {"id": thing_id, "tags": ["a"] * 1000}
+
+    @router.get("/api/async")
+    async def get_async():
+        return {"timed": current_timings.get() is not None}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(ServerTimingMiddleware)
+    return TestClient(app)
+
+
+def _parse(header):
+    """Parse a Server-Timing header into {name: (duration, description)}."""
+    metrics = {}
+    for part in header.split(", "):
+        name, _, params = part.partition(";")
+        duration = float(re.search(r"dur=([0-9.]+)", params).group(1))
+        description = re.search(r'desc="([^"]*)"', params)
+        metrics[name] = (duration, description.group(1) if description else None)
+    return metrics
+
+
+def test_server_timing_header():
+    """Test that SQL, file, serialization and total time are reported."""
+    client = _make_client()
+
+    response = client.get("/api/things/1")
+
+    assert response.status_code == 200
+    metrics = _parse(response.headers["Server-Timing"])
+    assert metrics["db"][1] == "2 queries"
+    assert metrics["file"] == (1.0, "2048 bytes")
+    assert metrics["serialize"][0] >= 0
+    assert metrics["app"][0] >= metrics["db"][0]
+
+
+def test_timings_reach_async_routes():
+    """Test that async routes see the request's timings too."""
+    client = _make_client()
+
+    response = client.get("/api/async")
+
+    assert response.json() == {"timed": True}
+    assert _parse(response.headers["Server-Timing"])["db"][1] == "0 queries"
+
+
+def test_timings_are_logged(caplog):
+    """Test that every request logs its timings as structured fields."""
+    client = _make_client()
+
+    with caplog.at_level(logging.INFO, logger="backend.api.middleware"):
+        client.get("/api/things/1")
+
+    record = caplog.records[-1]
+    assert record.timings["route"] == "/api/things/{thing_id}"
+    assert record.timings["db_queries"] == 2
+    assert "file_bytes=2048" in record.getMessage()
+
+
+def test_no_timings_outside_requests():
+    """Test that SQL outside a request is not recorded anywhere."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert current_timings.get() is None
@@ -0,0 +1,66 @@
+"""
+Tests for user-keyed sharding through the API: users register and log in
+through the shard map, and their requests run on their own shard.
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.config.sharding import shard_map
+from backend.models.clothing_item_model import ClothingItemModel
+
+
+@pytest.fixture
+def sharded(monkeypatch, shards):
+    """Run the application on the test shards."""
+    monkeypatch.setattr(shard_map, "_directory", shards.directory)
+    monkeypatch.setattr(shard_map, "_shards", shards.shards)
+    return shards
+
+
+def _sign_up(client, shards, shard):
+    """Register and log in a user placed on the shard; return ID and headers."""
+    index = 0
+    while shards.placement(f"user{index}@example.com") != shard:
+        index += 1
+    credentials = {"email": f"user{index}@example.com", "password": "secret"}
+
+    response = client.post(
+        "/api/v1/auth/register", json={**credentials, "full_name": "Test User"}
+    )
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+
+    response = client.post("/api/v1/auth/login", json=credentials)
+    assert response.status_code == 200
+    token = response.json()["access_token"]
+    return user_id, {"Authorization": f"Bearer {token}"}
+
+
+def _item_count(engine, user_id):
+    """Count a user's items on one shard."""
+    with Session(engine) as session:
+        return session.scalar(
+            select(func.count())
+            .select_from(ClothingItemModel)
+            .filter_by(user_id=user_id)
+        )
+
+
+def test_items_live_on_user_shard(sharded, client):
+    """Test that each user's items are written to and read from their shard."""
+    for shard in (0, 1):
+        user_id, headers = _sign_up(client, sharded, shard)
+        response = client.post(
+            "/api/v1/items/",
+            headers=headers,
+            json={"name": f"Shirt {shard}", "category": "Tops", "user_id": user_id},
+        )
+        assert response.status_code == 200
+
+        assert _item_count(sharded.shards[shard], user_id) == 1
+        assert _item_count(sharded.shards[1 - shard], user_id) == 0
+
+        response = client.get("/api/v1/items/", headers=headers)
+        assert [item["name"] for item in response.json()] == [f"Shirt {shard}"]
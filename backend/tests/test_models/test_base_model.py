@@ -91,32 +91,44 @@ class TestDatabaseConfiguration:
         assert hasattr(settings, "postgresql_max_overflow")
 
     def test_postgresql_engine_creation(self):
-        """Test that PostgreSQL engine is created correctly."""
-        # Import engine from config to ensure it exists
-        from backend.config.database import engine
+        """Test that PostgreSQL engine is created on first use and then reused."""
+        from backend.config.database import get_engine
+
+        engine = get_engine()
 
         assert engine is not None
+        assert get_engine() is engine
 
     def test_postgresql_session_factory(self):
-        """Test that PostgreSQL session factory is created correctly."""
-        # Import SessionLocal from config to ensure it exists
-        from backend.config.database import SessionLocal
+        """Test that sessions are bound to the engine when they are made."""
+        from backend.config.database import SessionLocal, get_engine
 
-        assert SessionLocal is not None
+        session = SessionLocal()
+        try:
+            assert session.get_bind() is get_engine()
+        finally:
+            session.close()
 
     def test_mongodb_client_creation(self):
-        """Test that MongoDB client is created correctly."""
-        # Import mongo_client from config to ensure it exists
-        from backend.config.database import mongo_client
+        """Test that MongoDB client is created on first use and can be closed."""
+        from backend.config import database
 
-        assert mongo_client is not None
+        client = database.get_mongo_client()
+        try:
+            assert client is not None
+            assert database.get_mongo_client() is client
+        finally:
+            database.close_mongo_client()
+        assert database._mongo_client is None
 
     def test_mongodb_database(self):
-        """Test that MongoDB database connection is established."""
-        # Import db from config to ensure it exists
-        from backend.config.database import db
+        """Test that the MongoDB database is available."""
+        from backend.config import database
 
-        assert db is not None
+        try:
+            assert database.get_mongo_db() is not None
+        finally:
+            database.close_mongo_client()
 
     def test_get_db_generator(self):
         """Test that get_db is a generator function."""
@@ -0,0 +1,104 @@
+"""
+Tests for hash-partitioning clothing_items by user_id: the PostgreSQL schema
+the migration creates, and the same models on an unpartitioned database.
+"""
+
+import logging
+
+from sqlalchemy import create_engine, create_mock_engine, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from backend.config.database import Base
+from backend.migrate import (
+    create_with_partitioned_items,
+    item_references_trigger_ddl,
+    migrate,
+    partitioned_items_ddl,
+)
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.user import User
+
+
+def _compile(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_mapper_identity_includes_user_id():
+    """Test that the ORM identifies items by ID and user, like the partitions."""
+    primary_key = ClothingItemModel.__mapper__.primary_key
+    assert [column.name for column in primary_key] == ["id", "user_id"]
+
+
+def test_partitioned_items_ddl():
+    """Test the PostgreSQL statements creating the partitioned table."""
+    statements = [_compile(statement) for statement in partitioned_items_ddl(4)]
+
+    table = statements[0]
+    assert "PARTITION BY HASH (user_id)" in table
+    assert "PRIMARY KEY (id, user_id)" in table
+    assert "id SERIAL NOT NULL" in table
+
+    indexes = [statement for statement in statements if "CREATE INDEX" in statement]
+    assert any("(user_id)" in index for index in indexes)
+
+    partitions = [statement for statement in statements if "PARTITION OF" in statement]
+    assert len(partitions) == 4
+    assert all("MODULUS 4" in partition for partition in partitions)
+    assert "REMAINDER 3" in partitions[-1]
+
+    # The application schema itself is left unpartitioned
+    table_options = ClothingItemModel.__table__.dialect_options["postgresql"]
+    assert table_options["partition_by"] is None
+
+
+def test_item_references_trigger_ddl():
+    """Test that the trigger deletes the outfit and collection entries."""
+    function, trigger = [_compile(s) for s in item_references_trigger_ddl()]
+    assert "DELETE FROM outfit_items WHERE clothing_item_id = OLD.id" in function
+    assert "DELETE FROM collection_items WHERE clothing_item_id = OLD.id" in function
+    assert "AFTER DELETE ON clothing_items" in trigger
+
+
+def test_create_with_partitioned_items_drops_item_foreign_keys():
+    """Test that no table refers to the partitioned table by a foreign key."""
+    statements = []
+    engine = create_mock_engine(
+        "postgresql://", lambda statement, *args, **kw: statements.append(statement)
+    )
+    create_with_partitioned_items(engine, Base.metadata.sorted_tables, 2)
+
+    ddl = [_compile(statement) for statement in statements]
+    outfit_items = next(s for s in ddl if s.startswith("\nCREATE TABLE outfit_items"))
+    assert "REFERENCES clothing_items" not in outfit_items
+    assert "REFERENCES outfits" in outfit_items
+    assert any("CREATE TRIGGER" in statement for statement in ddl)
+
+
+def test_migrate_partitions_need_postgresql(tmp_path, caplog):
+    """Test that other databases get the unpartitioned table and a warning."""
+    engine = create_engine(f"sqlite:///{tmp_path}/partitions.db")
+    with caplog.at_level(logging.WARNING, logger="backend.migrate"):
+        created = migrate(engine, item_partitions=4)
+
+    assert "clothing_items" in created
+    assert "Partitioning needs PostgreSQL" in caplog.text
+    assert inspect(engine).get_pk_constraint("clothing_items")[
+        "constrained_columns"
+    ] == ["id"]
+
+    # Items are still found by their ID and user
+    with Session(engine) as session:
+        session.add(
+            User(
+                id=1,
+                email="a@example.com",
+                full_name="A",
+                hashed_password="x",
+                salt="y",
+            )
+        )
+        session.add(ClothingItemModel(id=7, name="Shirt", user_id=1))
+        session.commit()
+        assert session.get(ClothingItemModel, (7, 1)).name == "Shirt"
+    engine.dispose()
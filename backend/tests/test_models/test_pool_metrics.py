@@ -0,0 +1,80 @@
+"""
+Tests for the connection pool instrumentation.
+"""
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from backend.config.pool_metrics import PoolMetrics, TimedQueuePool, pool_metrics
+
+
+@pytest.fixture
+def timed_engine(tmp_path):
+    """Create a file SQLite engine with an instrumented one-connection pool."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    pool_metrics.reset()
+    pool_metrics.attach(engine)
+    yield engine
+    engine.dispose()
+    pool_metrics.reset()
+
+
+class TestPoolMetrics:
+    """Tests for PoolMetrics and TimedQueuePool."""
+
+    def test_records_checkouts_and_usage(self, timed_engine):
+        """Test that checkouts, connects, overflow and waits are recorded."""
+        first = timed_engine.connect()
+        second = timed_engine.connect()
+        stats = pool_metrics.snapshot(timed_engine.pool)
+        assert stats["checked_out"] == 2
+        assert stats["overflow"] == 1
+        first.close()
+        second.close()
+
+        with timed_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        stats = pool_metrics.snapshot(timed_engine.pool)
+        assert stats["checkouts"] == 3
+        assert stats["connects"] == 2
+        assert stats["peak_checked_out"] == 2
+        assert stats["peak_overflow"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["wait_seconds_max"] >= stats["wait_seconds_p50"] >= 0
+        assert stats["connection_age_seconds_max"] > 0
+
+    def test_records_timeouts(self, timed_engine):
+        """Test that checkouts that give up waiting are counted."""
+        held = [timed_engine.connect(), timed_engine.connect()]
+        try:
+            with pytest.raises(exc.TimeoutError):
+                timed_engine.connect()
+        finally:
+            for connection in held:
+                connection.close()
+
+        stats = pool_metrics.snapshot(timed_engine.pool)
+        assert stats["timeouts"] == 1
+        assert stats["wait_seconds_max"] >= 0.05
+
+    def test_records_invalidations(self, timed_engine):
+        """Test that invalidated connections are counted."""
+        with timed_engine.connect() as connection:
+            connection.invalidate()
+
+        assert pool_metrics.snapshot()["invalidations"] == 1
+
+    def test_empty_snapshot(self):
+        """Test that metrics without activity are all zero."""
+        stats = PoolMetrics().snapshot()
+
+        assert stats["checkouts"] == 0
+        assert stats["wait_seconds_p95"] == 0.0
+        assert "checked_out" not in stats
@@ -0,0 +1,148 @@
+"""
+Tests for running the application on a SQLite file in WAL mode: connection
+pragmas, the single writer with its read-only readers, and lock timeouts.
+"""
+
+import sqlite3
+
+import pytest
+from fastapi import Request, Response
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+
+from backend.config import database
+from backend.config.database import (
+    DatabaseBusyError,
+    SessionLocal,
+    dispose_engine,
+    get_db,
+    get_engine,
+    get_read_engine,
+)
+from backend.config.settings import settings
+from backend.migrate import migrate
+from backend.models.user import User
+
+
+@pytest.fixture
+def sqlite_database(tmp_path, monkeypatch):
+    """Point the application at a fresh SQLite file and return its path."""
+    path = tmp_path / "closet.db"
+    monkeypatch.setattr(settings, "postgresql_url", f"sqlite:///{path}")
+    monkeypatch.setattr(settings, "sqlite_busy_timeout", 0.1)
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_sqlite_reader_engine", None)
+    migrate(get_engine())
+    yield path
+    dispose_engine()
+
+
+def _pragma(engine, name):
+    with engine.connect() as connection:
+        return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def _add_user(session, email="a@example.com"):
+    session.add(User(email=email, full_name="A", hashed_password="x", salt="y"))
+
+
+def _user_count(engine):
+    with engine.connect() as connection:
+        return connection.scalar(select(func.count()).select_from(User))
+
+
+def test_pragmas(sqlite_database):
+    """Test that the writer and the readers are tuned on connect."""
+    writer, reader = get_engine(), get_read_engine()
+    assert writer is not reader
+    assert writer.pool.size() == 1
+    assert reader.pool.size() == settings.sqlite_readers
+
+    for engine in (writer, reader):
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1
+        assert _pragma(engine, "cache_size") == -settings.sqlite_cache_size
+        assert _pragma(engine, "foreign_keys") == 1
+    assert _pragma(writer, "query_only") == 0
+    assert _pragma(reader, "query_only") == 1
+
+
+def test_readers_do_not_write(sqlite_database):
+    """Test that the reader connections are read-only."""
+    with pytest.raises(OperationalError, match="readonly"):
+        with get_read_engine().begin() as connection:
+            connection.execute(text("DELETE FROM users"))
+
+
+def test_readers_do_not_wait_for_writer(sqlite_database):
+    """Test that readers see committed rows while a write is in progress."""
+    with SessionLocal() as session:
+        _add_user(session)
+        session.commit()
+
+        _add_user(session, "b@example.com")
+        session.flush()
+        assert _user_count(get_read_engine()) == 1
+
+        session.commit()
+        assert _user_count(get_read_engine()) == 2
+
+
+def test_locked_database_is_busy(sqlite_database):
+    """Test that a write blocked by another process fails as busy."""
+    other = sqlite3.connect(sqlite_database)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        with SessionLocal() as session:
+            _add_user(session)
+            with pytest.raises(DatabaseBusyError):
+                session.commit()
+    finally:
+        other.rollback()
+        other.close()
+
+
+def test_waiting_for_writer_is_busy(sqlite_database):
+    """Test that a write waiting too long for the writer connection is busy."""
+    with SessionLocal() as first, SessionLocal() as second:
+        _add_user(first)
+        first.flush()
+
+        _add_user(second, "b@example.com")
+        with pytest.raises(DatabaseBusyError):
+            second.flush()
+
+
+def test_sessions_read_from_readers_until_they_write(sqlite_database):
+    """Test that sessions hold the writer only from their first write."""
+    with SessionLocal() as reading, SessionLocal() as writing:
+        assert reading.scalar(select(func.count()).select_from(User)) == 0
+
+        # The reading session does not keep the writer from others
+        _add_user(writing)
+        writing.commit()
+        assert get_engine().pool.checkedout() == 0
+
+        # Once it writes, it reads its own changes from the writer
+        _add_user(reading, "b@example.com")
+        reading.flush()
+        assert reading.scalar(select(func.count()).select_from(User)) == 2
+        reading.commit()
+        assert get_engine().pool.checkedout() == 0
+
+        # After the commit it reads from the readers again
+        assert reading.scalar(select(func.count()).select_from(User)) == 2
+        assert get_engine().pool.checkedout() == 0
+
+
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_get_db_reads_from_readers(sqlite_database, method):
+    """Test that reads use the readers and writes the writer."""
+    request = Request({"type": "http", "method": method, "headers": []})
+    dependency = get_db(request, Response())
+    session = next(dependency)
+    try:
+        expected = get_read_engine() if method == "GET" else get_engine()
+        assert session.get_bind() is expected
+    finally:
+        dependency.close()
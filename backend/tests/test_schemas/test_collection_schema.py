@@ -0,0 +1,53 @@
+"""
+Tests for Collection schema definitions and validation.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.schemas.collection import CollectionCreate, CollectionRule
+
+
+class TestCollectionRuleSchema:
+    """Tests for CollectionRule validation."""
+
+    @pytest.mark.parametrize(
+        "field, op, value",
+        [
+            ("description", "contains", "winter"),
+            ("price", "lt", 100),
+            ("purchase_date", "gte", "2024-01-01"),
+            ("color", "eq", "Blue"),
+            ("size", "in", ["S", "M"]),
+        ],
+    )
+    def test_operator_fits_field(self, field, op, value):
+        """Test that operators are accepted on fields of their type."""
+        rule = CollectionRule(field=field, op=op, value=value)
+
+        assert rule.op == op
+
+    @pytest.mark.parametrize(
+        "field, op",
+        [
+            ("price", "contains"),
+            ("purchase_date", "contains"),
+            ("name", "lt"),
+            ("color", "gte"),
+        ],
+    )
+    def test_operator_does_not_fit_field(self, field, op):
+        """Test that substring and ordering operators are limited by field type."""
+        with pytest.raises(ValidationError):
+            CollectionRule(field=field, op=op, value="1")
+
+    def test_collection_create_validates_rules(self):
+        """Test that a collection is rejected when any of its rules is."""
+        with pytest.raises(ValidationError):
+            CollectionCreate(
+                name="Cheap",
+                rules=[
+                    {"field": "price", "op": "lt", "value": 20},
+                    {"field": "price", "op": "contains", "value": "9"},
+                ],
+            )
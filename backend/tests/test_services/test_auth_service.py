@@ -3,13 +3,21 @@ Tests for the AuthService implementation.
 These tests follow the same patterns as the item service tests.
 """
 
+import hashlib
+from unittest.mock import Mock
+
 import pytest
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from backend.models.user import User as UserModel
 from backend.schemas.user import UserCreate, UserLogin
-from backend.services.auth_service import AuthService
+from backend.services.auth_service import EMBEDDED_SALT, AuthService
+from backend.services.password_service import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    create_password_context,
+)
 
 
 class TestAuthServiceRegistration:
@@ -73,11 +81,10 @@ class TestAuthServiceRegistration:
         # Access the underlying model directly from the database
         db_model = db_session.query(UserModel).filter(UserModel.id == result.id).one()
 
-        # Assert cryptographic fields are populated
-        assert db_model.hashed_password is not None
-        assert len(db_model.hashed_password) > 10  # SHA256 is 64 hex chars
-        assert db_model.salt is not None
-        assert len(db_model.salt) > 10  # secrets.token_hex(16) is 32 hex chars
+        # Assert the hash is a passlib hash that embeds its own salt
+        assert db_model.hashed_password.startswith("$scrypt$")
+        assert "pwd" not in db_model.hashed_password
+        assert db_model.salt == EMBEDDED_SALT
 
 
 class TestAuthServiceAuthentication:
@@ -129,6 +136,89 @@ class TestAuthServiceAuthentication:
 
         assert result is None
 
+    def test_authenticate_legacy_user_rehashes_password(self, db_session: Session):
+        """Test that a legacy SHA-256 hash is replaced on a successful login."""
+        salt = "legacy-salt"
+        db_session.add(
+            UserModel(
+                email="legacy@example.com",
+                full_name="Legacy User",
+                hashed_password=hashlib.sha256(
+                    b"password123" + salt.encode()
+                ).hexdigest(),
+                salt=salt,
+            )
+        )
+        db_session.commit()
+        auth_service = AuthService(db_session)
+
+        wrong = UserLogin(email="legacy@example.com", password="wrongpassword")
+        assert auth_service.authenticate_user(wrong) is None
+        db_model = db_session.query(UserModel).one()
+        assert db_model.salt == salt
+
+        login_data = UserLogin(email="legacy@example.com", password="password123")
+        assert auth_service.authenticate_user(login_data) is not None
+        db_model = db_session.query(UserModel).one()
+        assert db_model.hashed_password.startswith("$scrypt$")
+        assert db_model.salt == EMBEDDED_SALT
+
+        # The new hash keeps working
+        assert auth_service.authenticate_user(login_data) is not None
+
+    def test_authenticate_user_rehashes_outdated_cost(self, db_session: Session):
+        """Test that hashes with an outdated cost factor are upgraded on login."""
+        cheap = PasswordHasher(create_password_context("scrypt", rounds=1), 1, 0)
+        user_data = UserCreate(
+            email="cost@example.com", password="password123", full_name="Cost User"
+        )
+        AuthService(db_session, cheap).register_user(user_data)
+        old_hash = db_session.query(UserModel).one().hashed_password
+
+        stronger = PasswordHasher(create_password_context("scrypt", rounds=2), 1, 0)
+        login_data = UserLogin(email=user_data.email, password=user_data.password)
+        assert AuthService(db_session, stronger).authenticate_user(login_data)
+
+        new_hash = db_session.query(UserModel).one().hashed_password
+        assert new_hash != old_hash
+        assert new_hash.startswith("$scrypt$ln=2,")
+
+    def test_authenticate_user_rehashes_old_scheme(self, db_session: Session):
+        """Test that hashes of a previously configured scheme still log in."""
+        bcrypt = PasswordHasher(create_password_context("bcrypt", rounds=4), 1, 0)
+        user_data = UserCreate(
+            email="scheme@example.com", password="password123", full_name="Scheme"
+        )
+        AuthService(db_session, bcrypt).register_user(user_data)
+        old_hash = db_session.query(UserModel).one().hashed_password
+        assert old_hash.startswith("$2b$")
+
+        scrypt = PasswordHasher(create_password_context("scrypt", rounds=1), 1, 0)
+        login_data = UserLogin(email=user_data.email, password=user_data.password)
+        assert AuthService(db_session, scrypt).authenticate_user(login_data)
+
+        new_hash = db_session.query(UserModel).one().hashed_password
+        assert new_hash.startswith("$scrypt$")
+        assert AuthService(db_session, scrypt).authenticate_user(login_data)
+
+        wrong = UserLogin(email=user_data.email, password="wrong")
+        assert AuthService(db_session, bcrypt).authenticate_user(wrong) is None
+
+    def test_authenticate_user_hasher_busy(self, db_session: Session):
+        """Test that a full hashing queue is reported instead of waited on."""
+        auth_service = AuthService(db_session)
+        user_data = UserCreate(
+            email="busy@example.com", password="password123", full_name="Busy User"
+        )
+        auth_service.register_user(user_data)
+
+        busy = Mock(spec=PasswordHasher)
+        busy.verify_and_update.side_effect = PasswordHasherBusyError("busy")
+        login_data = UserLogin(email=user_data.email, password=user_data.password)
+
+        with pytest.raises(PasswordHasherBusyError):
+            AuthService(db_session, busy).authenticate_user(login_data)
+
 
 class TestAuthServiceTokenManagement:
     """Tests for token management functionality."""
@@ -0,0 +1,242 @@
+"""
+Tests for CollectionService and incremental smart collection membership.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.collection_model import CollectionItemModel
+from backend.schemas.clothing_item import ClothingItemCreate
+from backend.schemas.collection import CollectionCreate, CollectionRule
+from backend.services.collection_membership import compile_rules, item_matches_rules
+from backend.services.collection_service import CollectionService
+from backend.services.item_service import ItemService
+
+WINTER_COATS_UNDER_100 = [
+    CollectionRule(field="category", op="eq", value="Coats"),
+    CollectionRule(field="description", op="contains", value="winter"),
+    CollectionRule(field="price", op="lt", value=100),
+]
+
+
+def _add_item(db_session, user_id, **fields):
+    """Insert a clothing item directly and return it."""
+    db_item = ClothingItemModel(user_id=user_id, **fields)
+    db_session.add(db_item)
+    db_session.commit()
+    db_session.refresh(db_item)
+    return db_item
+
+
+def _member_ids(db_session, collection_id):
+    """Return the stored member item IDs of a collection."""
+    return {
+        item_id
+        for (item_id,) in db_session.query(CollectionItemModel.clothing_item_id).filter(
+            CollectionItemModel.collection_id == collection_id
+        )
+    }
+
+
+class TestCollectionRules:
+    """Tests that SQL and in-memory rule evaluation agree."""
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            {"field": "category", "op": "eq", "value": "Coats"},
+            {"field": "category", "op": "ne", "value": "Coats"},
+            {"field": "price", "op": "lt", "value": 100},
+            {"field": "price", "op": "gte", "value": "50"},
+            {"field": "size", "op": "in", "value": ["M", "L"]},
+            {"field": "description", "op": "contains", "value": "WINTER"},
+            {"field": "purchase_date", "op": "gt", "value": "2024-01-01T00:00:00"},
+        ],
+    )
+    def test_sql_and_python_evaluation_agree(self, db_session, test_user_a, rule):
+        """Test that compiled SQL selects exactly the items the Python check accepts."""
+        items = [
+            _add_item(
+                db_session,
+                test_user_a.id,
+                name="Parka",
+                category="Coats",
+                description="Warm winter parka",
+                price=80.0,
+                size="L",
+                purchase_date=datetime(2024, 6, 1),
+            ),
+            _add_item(
+                db_session,
+                test_user_a.id,
+                name="Tee",
+                category="Tops",
+                description="Summer tee",
+                price=20.0,
+                size="S",
+                purchase_date=datetime(2023, 6, 1),
+            ),
+            _add_item(db_session, test_user_a.id, name="Mystery"),
+        ]
+
+        sql_ids = {
+            item_id
+            for (item_id,) in db_session.query(ClothingItemModel.id).filter(
+                compile_rules([rule])
+            )
+        }
+        python_ids = {item.id for item in items if item_matches_rules([rule], item)}
+
+        assert sql_ids == python_ids
+
+    def test_invalid_rule_value(self):
+        """Test that a value that does not fit the field is rejected."""
+        with pytest.raises(ValueError):
+            compile_rules([{"field": "price", "op": "lt", "value": "cheap"}])
+
+
+class TestCollectionServiceOperations:
+    """Tests for CollectionService CRUD and materialized membership."""
+
+    def test_create_collection_materializes_existing_items(
+        self, db_session, test_user_a, test_user_b
+    ):
+        """Test that existing matching items are members after creation."""
+        coat = _add_item(
+            db_session,
+            test_user_a.id,
+            name="Parka",
+            category="Coats",
+            description="Warm winter parka",
+            price=80.0,
+        )
+        _add_item(
+            db_session,
+            test_user_a.id,
+            name="Wool Coat",
+            category="Coats",
+            description="Winter wool coat",
+            price=250.0,
+        )
+        _add_item(
+            db_session,
+            test_user_b.id,
+            name="Other Parka",
+            category="Coats",
+            description="Warm winter parka",
+            price=80.0,
+        )
+
+        service = CollectionService(db_session)
+        collection = service.create_collection(
+            CollectionCreate(name="Cheap winter coats", rules=WINTER_COATS_UNDER_100),
+            user_id=test_user_a.id,
+        )
+
+        assert collection.user_id == test_user_a.id
+        assert collection.rules == WINTER_COATS_UNDER_100
+        assert _member_ids(db_session, collection.id) == {coat.id}
+
+        items = service.get_collection_items(collection.id, test_user_a.id)
+        assert [item.name for item in items] == ["Parka"]
+
+    def test_create_collection_invalid_rule(self, db_session, test_user_a):
+        """Test that a collection with an invalid rule value is rejected."""
+        service = CollectionService(db_session)
+
+        with pytest.raises(ValueError):
+            service.create_collection(
+                CollectionCreate(
+                    name="Broken",
+                    rules=[CollectionRule(field="price", op="lt", value="cheap")],
+                ),
+                user_id=test_user_a.id,
+            )
+
+        assert service.get_all_collections(test_user_a.id) == []
+
+    def test_item_changes_update_membership(self, db_session, test_user_a):
+        """Test that creating, updating and deleting an item refreshes membership."""
+        collection_service = CollectionService(db_session)
+        collection = collection_service.create_collection(
+            CollectionCreate(name="Cheap winter coats", rules=WINTER_COATS_UNDER_100),
+            user_id=test_user_a.id,
+        )
+        item_service = ItemService(db_session)
+
+        # Create a matching item
+        item_data = ClothingItemCreate(  # type: ignore[reportCallIssue]
+            name="Parka",
+            user_id=test_user_a.id,
+            category="Coats",
+            description="Warm winter parka",
+            price=80.0,
+        )
+        created = item_service.create_item(item_data, user_id=test_user_a.id)
+        assert _member_ids(db_session, collection.id) == {created.id}
+
+        # Update it so it no longer matches
+        item_data.price = 150.0
+        item_service.update_item(created.id, item_data, user_id=test_user_a.id)
+        assert _member_ids(db_session, collection.id) == set()
+
+        # Update it so it matches again
+        item_data.price = 90.0
+        item_service.update_item(created.id, item_data, user_id=test_user_a.id)
+        assert _member_ids(db_session, collection.id) == {created.id}
+
+        # Delete it
+        item_service.delete_item(created.id, user_id=test_user_a.id)
+        assert _member_ids(db_session, collection.id) == set()
+
+    def test_update_collection_rebuilds_membership(self, db_session, test_user_a):
+        """Test that changing the rules rebuilds the stored membership."""
+        coat = _add_item(db_session, test_user_a.id, name="Coat", category="Coats")
+        tee = _add_item(db_session, test_user_a.id, name="Tee", category="Tops")
+
+        service = CollectionService(db_session)
+        collection = service.create_collection(
+            CollectionCreate(
+                name="Coats",
+                rules=[CollectionRule(field="category", op="eq", value="Coats")],
+            ),
+            user_id=test_user_a.id,
+        )
+        assert _member_ids(db_session, collection.id) == {coat.id}
+
+        updated = service.update_collection(
+            collection.id,
+            CollectionCreate(
+                name="Tops",
+                rules=[CollectionRule(field="category", op="eq", value="Tops")],
+            ),
+            test_user_a.id,
+        )
+        assert updated.name == "Tops"
+        assert _member_ids(db_session, collection.id) == {tee.id}
+
+    def test_collection_other_user(self, db_session, test_user_a, test_user_b):
+        """Test that users cannot access or delete other users' collections."""
+        service = CollectionService(db_session)
+        collection = service.create_collection(
+            CollectionCreate(name="Everything"), user_id=test_user_a.id
+        )
+
+        assert service.get_collection(collection.id, test_user_b.id) is None
+        assert service.get_collection_items(collection.id, test_user_b.id) is None
+        assert service.delete_collection(collection.id, test_user_b.id) is False
+
+    def test_delete_collection(self, db_session, test_user_a):
+        """Test that deleting a collection removes its stored membership."""
+        _add_item(db_session, test_user_a.id, name="Coat")
+        service = CollectionService(db_session)
+        collection = service.create_collection(
+            CollectionCreate(name="Everything"), user_id=test_user_a.id
+        )
+        assert len(_member_ids(db_session, collection.id)) == 1
+
+        assert service.delete_collection(collection.id, test_user_a.id) is True
+        assert service.get_collection(collection.id, test_user_a.id) is None
+        assert _member_ids(db_session, collection.id) == set()
@@ -0,0 +1,195 @@
+"""
+Tests for color palette extraction, CIEDE2000 scoring and color matching.
+"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.job_model import JobModel
+from backend.services.color_service import (
+    PALETTE_SIZE,
+    ColorService,
+    ciede2000,
+    decode_palettes,
+    encode_palette,
+    extract_item_palette,
+    extract_palette,
+    hex_to_lab,
+)
+from backend.services.upload_service import UploadService
+
+
+def _image_bytes(*colors):
+    """Build a PNG made of equal vertical stripes of the given RGB colors."""
+    image = Image.new("RGB", (20 * len(colors), 20))
+    for index, color in enumerate(colors):
+        image.paste(color, (20 * index, 0, 20 * (index + 1), 20))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _add_item(db_session, user_id, name):
+    """Insert a clothing item directly and return it."""
+    db_item = ClothingItemModel(name=name, user_id=user_id)
+    db_session.add(db_item)
+    db_session.commit()
+    db_session.refresh(db_item)
+    return db_item
+
+
+def _store_palette(db_session, db_item, file_data):
+    """Store the palette of an image on an item."""
+    db_item.color_palette = encode_palette(extract_palette(file_data))
+    db_session.commit()
+
+
+class TestColorMath:
+    """Tests for the color conversion and difference functions."""
+
+    @pytest.mark.parametrize(
+        "lab1, lab2, expected",
+        [
+            # Reference pairs from Sharma, Wu and Dalal (2005)
+            ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+            ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+            ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+            ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+            ((22.7233, 20.0904, -46.694), (23.0331, 14.973, -42.5619), 2.0373),
+        ],
+    )
+    def test_ciede2000_reference_values(self, lab1, lab2, expected):
+        """Test CIEDE2000 against published reference values."""
+        assert ciede2000(np.array(lab1), np.array(lab2)) == pytest.approx(
+            expected, abs=1e-4
+        )
+
+    def test_ciede2000_broadcasts(self):
+        """Test that one color can be scored against many in one call."""
+        many = np.array([[50.0, 0.0, 0.0], [50.0, -1.0, 2.0], [73.0, 25.0, -18.0]])
+        result = ciede2000(many, np.array([50.0, 0.0, 0.0]))
+        assert result.shape == (3,)
+        assert result[0] == pytest.approx(0.0)
+
+    def test_hex_to_lab(self):
+        """Test hex parsing against known Lab values."""
+        assert hex_to_lab("#ffffff") == pytest.approx([100.0, 0.0, 0.0], abs=0.01)
+        assert hex_to_lab("ff0000") == pytest.approx([53.24, 80.09, 67.20], abs=0.01)
+
+    def test_hex_to_lab_invalid(self):
+        """Test that malformed colors are rejected."""
+        with pytest.raises(ValueError):
+            hex_to_lab("#fff")
+        with pytest.raises(ValueError):
+            hex_to_lab("#zzzzzz")
+
+
+class TestPaletteExtraction:
+    """Tests for extracting and packing palettes."""
+
+    def test_extract_palette_finds_dominant_colors(self):
+        """Test that the dominant colors and their coverage are found."""
+        palette = extract_palette(_image_bytes((255, 0, 0), (255, 0, 0), (0, 0, 255)))
+
+        assert palette.shape[1] == 4
+        assert ciede2000(palette[0, :3], hex_to_lab("#ff0000")) < 1
+        assert palette[0, 3] == pytest.approx(2 / 3, abs=0.01)
+        assert ciede2000(palette[1, :3], hex_to_lab("#0000ff")) < 1
+
+    def test_extract_palette_rejects_non_images(self):
+        """Test that non-image bytes raise instead of producing a palette."""
+        with pytest.raises(Exception):
+            extract_palette(b"not an image")
+
+    def test_encode_decode_round_trip(self):
+        """Test that packed palettes are compact and decode close to the input."""
+        palette = extract_palette(_image_bytes((200, 30, 40), (20, 120, 60)))
+        blob = encode_palette(palette)
+
+        assert len(blob) == PALETTE_SIZE * 4
+
+        decoded = decode_palettes([blob, blob])
+        assert decoded.shape == (2, PALETTE_SIZE, 4)
+        count = len(palette)
+        assert decoded[0, :count, :3] == pytest.approx(palette[:, :3], abs=0.6)
+        assert decoded[0, count:, 3] == pytest.approx(0.0)
+
+
+class TestColorService:
+    """Tests for storing palettes and matching items by color."""
+
+    def test_upload_image_queues_palette_job(self, db_session, test_user_a):
+        """Test that uploading an image queues the job that stores its palette."""
+        db_item = _add_item(db_session, test_user_a.id, "Red Shirt")
+
+        result = UploadService(db_session).upload_image(
+            _image_bytes((255, 0, 0)), "shirt.png", db_item.id, test_user_a.id
+        )
+
+        assert result is not None
+        job = db_session.query(JobModel).one()
+        assert job.kind == "image.palette"
+        assert job.user_id == test_user_a.id
+        assert job.payload == {"item_id": db_item.id, "user_id": test_user_a.id}
+
+        extract_item_palette(db_session, job.payload)
+        db_session.refresh(db_item)
+        assert db_item.color_palette is not None
+        palette = decode_palettes([db_item.color_palette])[0]
+        assert ciede2000(palette[0, :3], hex_to_lab("#ff0000")) < 1
+
+    def test_find_matching_items_orders_by_distance(self, db_session, test_user_a):
+        """Test that items are ranked by their closest palette color."""
+        red = _add_item(db_session, test_user_a.id, "Red")
+        navy = _add_item(db_session, test_user_a.id, "Navy")
+        maroon = _add_item(db_session, test_user_a.id, "Maroon")
+        _add_item(db_session, test_user_a.id, "No Image")
+        _store_palette(db_session, red, _image_bytes((250, 10, 10)))
+        _store_palette(db_session, navy, _image_bytes((10, 20, 90)))
+        _store_palette(db_session, maroon, _image_bytes((120, 10, 20)))
+
+        matches = ColorService(db_session).find_matching_items(
+            test_user_a.id, "#ff0000"
+        )
+
+        assert [match.item.name for match in matches] == ["Red", "Maroon", "Navy"]
+        assert matches[0].delta_e < matches[1].delta_e < matches[2].delta_e
+
+    def test_find_matching_items_limit_and_cutoff(self, db_session, test_user_a):
+        """Test the result limit and the maximum distance cutoff."""
+        red = _add_item(db_session, test_user_a.id, "Red")
+        navy = _add_item(db_session, test_user_a.id, "Navy")
+        _store_palette(db_session, red, _image_bytes((250, 10, 10)))
+        _store_palette(db_session, navy, _image_bytes((10, 20, 90)))
+        service = ColorService(db_session)
+
+        assert len(service.find_matching_items(test_user_a.id, "#ff0000", limit=1)) == 1
+        close = service.find_matching_items(test_user_a.id, "#ff0000", max_delta_e=10)
+        assert [match.item.name for match in close] == ["Red"]
+
+    def test_find_matching_items_complementary(self, db_session, test_user_a):
+        """Test that the complementary scheme prefers opposite hues."""
+        red = _add_item(db_session, test_user_a.id, "Red")
+        teal = _add_item(db_session, test_user_a.id, "Teal")
+        _store_palette(db_session, red, _image_bytes((220, 40, 40)))
+        _store_palette(db_session, teal, _image_bytes((0, 150, 150)))
+
+        matches = ColorService(db_session).find_matching_items(
+            test_user_a.id, "#dc2828", scheme="complementary"
+        )
+
+        assert matches[0].item.name == "Teal"
+
+    def test_find_matching_items_other_user(self, db_session, test_user_a, test_user_b):
+        """Test that only the requesting user's items are matched."""
+        db_item = _add_item(db_session, test_user_b.id, "Red")
+        _store_palette(db_session, db_item, _image_bytes((255, 0, 0)))
+
+        matches = ColorService(db_session).find_matching_items(
+            test_user_a.id, "#f00000"
+        )
+        assert matches == []
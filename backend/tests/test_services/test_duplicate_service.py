@@ -0,0 +1,257 @@
+"""
+Tests for perceptual image hashing and near-duplicate detection.
+"""
+
+import io
+import random
+import threading
+
+import numpy as np
+from PIL import Image
+
+from backend.config.upload_settings import upload_settings
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.repositories.item_repository import SQLAlchemyItemRepository
+from backend.services.duplicate_service import (
+    BKTree,
+    DuplicateIndex,
+    DuplicateService,
+    compute_image_hash,
+    dhash,
+    hamming_distance,
+)
+from backend.services.item_service import ItemService
+from backend.services.upload_service import UploadService
+
+
+def _photo(seed, size=256, image_format="PNG", quality=95):
+    """Build a smooth pseudo-photo that is stable for a given seed."""
+    rng = np.random.default_rng(seed)
+    small = Image.fromarray(rng.integers(0, 256, (8, 8, 3), dtype=np.uint8))
+    image = small.resize((size, size), Image.Resampling.BICUBIC)
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, quality=quality)
+    return buffer.getvalue()
+
+
+class _StoredHashes:
+    """Item repository stand-in that only serves image hashes."""
+
+    def __init__(self, hashes_by_user, blocked_user=None):
+        self.hashes_by_user = hashes_by_user
+        self.blocked_user = blocked_user
+        self.querying = threading.Event()
+        self.release = threading.Event()
+
+    def image_hashes(self, user_id):
+        if user_id == self.blocked_user:
+            self.querying.set()
+            self.release.wait(5)
+        return self.hashes_by_user.get(user_id, [])
+
+
+def _add_item(db_session, user_id, name):
+    """Insert a clothing item directly and return it."""
+    db_item = ClothingItemModel(name=name, user_id=user_id)
+    db_session.add(db_item)
+    db_session.commit()
+    db_session.refresh(db_item)
+    return db_item
+
+
+class TestImageHash:
+    """Tests for the difference hash."""
+
+    def test_dhash_is_stable_across_resize_and_recompression(self):
+        """Test that a resized JPEG copy hashes close to the original."""
+        original = dhash(_photo(1))
+        copy = dhash(_photo(1, size=180, image_format="JPEG", quality=70))
+
+        assert (
+            hamming_distance(original, copy) <= upload_settings.duplicate_max_distance
+        )
+
+    def test_dhash_differs_for_different_images(self):
+        """Test that unrelated images are far apart."""
+        distance = hamming_distance(dhash(_photo(1)), dhash(_photo(2)))
+        assert distance > upload_settings.duplicate_max_distance
+
+    def test_compute_image_hash_unreadable(self):
+        """Test that non-image bytes produce no hash."""
+        assert compute_image_hash(b"not an image") is None
+
+
+class TestBKTree:
+    """Tests for the BK-tree index."""
+
+    def test_search_matches_brute_force(self):
+        """Test that tree search finds exactly the hashes a full scan finds."""
+        rng = random.Random(7)
+        hashes = {item_id: rng.getrandbits(64) for item_id in range(500)}
+        # Add some near-copies so there is something to find
+        for item_id in range(500, 550):
+            hashes[item_id] = hashes[item_id - 500] ^ (1 << rng.randrange(64))
+
+        tree = BKTree()
+        for item_id, image_hash in hashes.items():
+            tree.add(image_hash, item_id)
+
+        for query_id in range(0, 550, 25):
+            query = hashes[query_id]
+            expected = {
+                (item_id, hamming_distance(query, image_hash))
+                for item_id, image_hash in hashes.items()
+                if hamming_distance(query, image_hash) <= 4
+            }
+            assert set(tree.search(query, 4)) == expected
+
+    def test_remove(self):
+        """Test that removed items are no longer found."""
+        tree = BKTree()
+        tree.add(0b1010, 1)
+        tree.add(0b1010, 2)
+        tree.add(0b1011, 3)
+
+        tree.remove(0b1010, 1)
+
+        assert sorted(tree.search(0b1010, 1)) == [(2, 0), (3, 1)]
+
+
+class TestDuplicateDetection:
+    """Tests for flagging duplicates on upload and finding duplicate groups."""
+
+    def test_upload_flags_near_duplicate(self, db_session, test_user_a, upload_dir):
+        """Test that uploading a re-shot of an existing photo is flagged."""
+        first = _add_item(db_session, test_user_a.id, "Shirt")
+        second = _add_item(db_session, test_user_a.id, "Shirt again")
+        other = _add_item(db_session, test_user_a.id, "Pants")
+        service = UploadService(db_session)
+
+        result = service.upload_image(_photo(1), "a.png", first.id, test_user_a.id)
+        assert result.possible_duplicates == []
+
+        result = service.upload_image(_photo(2), "c.png", other.id, test_user_a.id)
+        assert result.possible_duplicates == []
+
+        result = service.upload_image(
+            _photo(1, size=180, image_format="JPEG", quality=70),
+            "b.jpg",
+            second.id,
+            test_user_a.id,
+        )
+        assert result.possible_duplicates == [first.id]
+
+    def test_upload_ignores_other_users(
+        self, db_session, test_user_a, test_user_b, upload_dir
+    ):
+        """Test that items of other users are never flagged."""
+        mine = _add_item(db_session, test_user_a.id, "Mine")
+        theirs = _add_item(db_session, test_user_b.id, "Theirs")
+        service = UploadService(db_session)
+
+        service.upload_image(_photo(1), "a.png", theirs.id, test_user_b.id)
+        result = service.upload_image(_photo(1), "a.png", mine.id, test_user_a.id)
+
+        assert result.possible_duplicates == []
+
+    def test_find_duplicates_groups_items(self, db_session, test_user_a, upload_dir):
+        """Test that near-duplicate items are grouped together."""
+        items = [_add_item(db_session, test_user_a.id, f"Item {i}") for i in range(4)]
+        service = UploadService(db_session)
+        service.upload_image(_photo(1), "a.png", items[0].id, test_user_a.id)
+        service.upload_image(_photo(2), "b.png", items[1].id, test_user_a.id)
+        service.upload_image(
+            _photo(1, size=200, image_format="JPEG"),
+            "c.jpg",
+            items[2].id,
+            test_user_a.id,
+        )
+        service.upload_image(_photo(2), "d.png", items[3].id, test_user_a.id)
+
+        groups = DuplicateService(db_session).find_duplicates(test_user_a.id)
+
+        assert [group.item_ids for group in groups] == [
+            [items[0].id, items[2].id],
+            [items[1].id, items[3].id],
+        ]
+
+    def test_find_duplicates_loads_stored_hashes(self, db_session, test_user_a):
+        """Test that groups are found from hashes stored before this process started."""
+        image_hash = format(dhash(_photo(3)), "016x")
+        for name in ("One", "Two"):
+            db_session.add(
+                ClothingItemModel(
+                    name=name, user_id=test_user_a.id, image_hash=image_hash
+                )
+            )
+        db_session.commit()
+
+        groups = DuplicateService(db_session).find_duplicates(test_user_a.id)
+
+        assert len(groups) == 1
+        assert len(groups[0].item_ids) == 2
+
+    def test_index_is_rebuilt_after_ttl(self, db_session, test_user_a):
+        """Test that hashes stored by another process are seen once the tree expires."""
+        image_hash = format(dhash(_photo(3)), "016x")
+        items = SQLAlchemyItemRepository(db_session)
+        index = DuplicateIndex(ttl=60)
+        db_session.add(
+            ClothingItemModel(name="One", user_id=test_user_a.id, image_hash=image_hash)
+        )
+        db_session.commit()
+        assert index.find_groups(items, test_user_a.id, 8) == []
+
+        # Stored without going through this index
+        db_session.add(
+            ClothingItemModel(name="Two", user_id=test_user_a.id, image_hash=image_hash)
+        )
+        db_session.commit()
+        assert index.find_groups(items, test_user_a.id, 8) == []
+
+        # A minute later the tree is built again
+        index._users[test_user_a.id].loaded_at -= 60
+        assert len(index.find_groups(items, test_user_a.id, 8)) == 1
+
+    def test_expired_trees_are_dropped(self):
+        """Test that building a tree forgets the trees that outlived the TTL."""
+        items = _StoredHashes({1: [(10, "00ff")], 2: [(20, "00ff")]})
+        index = DuplicateIndex(ttl=60)
+        index.find_groups(items, 1, 8)
+        index._users[1].loaded_at -= 60
+
+        index.find_groups(items, 2, 8)
+
+        assert list(index._users) == [2]
+
+    def test_building_a_tree_does_not_block_other_users(self):
+        """Test that the stored hashes are read without holding up other users."""
+        items = _StoredHashes({2: [(20, "00ff"), (21, "00ff")]}, blocked_user=1)
+        index = DuplicateIndex(ttl=60)
+        loading = threading.Thread(target=index.find_groups, args=(items, 1, 8))
+        loading.start()
+        groups = []
+        other = threading.Thread(
+            target=lambda: groups.append(index.find_groups(items, 2, 8))
+        )
+        try:
+            assert items.querying.wait(5)
+            other.start()
+            other.join(1)
+            assert groups == [[[20, 21]]]
+        finally:
+            items.release.set()
+            loading.join()
+            other.join()
+
+    def test_deleted_item_is_not_flagged(self, db_session, test_user_a, upload_dir):
+        """Test that deleting an item removes it from the duplicate index."""
+        first = _add_item(db_session, test_user_a.id, "Shirt")
+        second = _add_item(db_session, test_user_a.id, "Shirt again")
+        service = UploadService(db_session)
+        service.upload_image(_photo(1), "a.png", first.id, test_user_a.id)
+
+        ItemService(db_session).delete_item(first.id, test_user_a.id)
+        result = service.upload_image(_photo(1), "b.png", second.id, test_user_a.id)
+
+        assert result.possible_duplicates == []
@@ -9,8 +9,10 @@ from datetime import datetime, timezone
 import pytest
 from pydantic import ValidationError
 
+from backend.config.upload_settings import upload_settings
 from backend.schemas.clothing_item import ClothingItem, ClothingItemCreate
 from backend.services.item_service import ItemService
+from backend.services.metrics_service import image_bytes
 
 
 class TestItemServiceCRUDOperations:
@@ -442,6 +444,98 @@ class TestItemServiceDatabaseConnection:
         assert callable(getattr(service, "delete_item"))
 
 
+class TestItemServiceQueryBudget:
+    """Tests for the number of SQL statements ItemService operations run."""
+
+    def _create_items(self, service, user_id, count):
+        """Create count items through the service and return their IDs."""
+        return [
+            service.create_item(
+                ClothingItemCreate(name=f"Item {i}", category="Tops", user_id=user_id),
+                user_id=user_id,
+            ).id
+            for i in range(count)
+        ]
+
+    @pytest.mark.parametrize("item_count", [1, 20])
+    def test_get_all_items_is_one_query(
+        self, db_session, test_user_a, count_queries, item_count
+    ):
+        """Test that listing items takes one query no matter how many items exist."""
+        user_id = test_user_a.id
+        service = ItemService(db_session)
+        self._create_items(service, user_id, item_count)
+        db_session.expire_all()
+
+        with count_queries() as queries:
+            results = service.get_all_items(user_id)
+
+        assert len(results) == item_count
+        queries.assert_at_most(1)
+
+    def test_get_item_is_one_query(self, db_session, test_user_a, count_queries):
+        """Test that getting one item takes a single query."""
+        user_id = test_user_a.id
+        service = ItemService(db_session)
+        (item_id,) = self._create_items(service, user_id, 1)
+        db_session.expire_all()
+
+        with count_queries() as queries:
+            result = service.get_item(item_id, user_id)
+
+        assert result.id == item_id
+        queries.assert_at_most(1)
+
+    def test_write_query_budgets(self, db_session, test_user_a, count_queries):
+        """Test the statement budgets of creating, updating and deleting an item."""
+        user_id = test_user_a.id
+        service = ItemService(db_session)
+        item_data = ClothingItemCreate(name="Shirt", category="Tops", user_id=user_id)
+
+        # Insert, collection lookup and reload
+        with count_queries() as queries:
+            item_id = service.create_item(item_data, user_id).id
+        queries.assert_at_most(3)
+
+        # Item lookup, collection lookup, update and reload
+        item_data.name = "Renamed Shirt"
+        with count_queries() as queries:
+            service.update_item(item_id, item_data, user_id)
+        queries.assert_at_most(4)
+
+        # Item lookup, collection memberships, outfit placements and the item
+        with count_queries() as queries:
+            assert service.delete_item(item_id, user_id) is True
+        queries.assert_at_most(4)
+
+    def test_item_statements_filter_by_user(
+        self, db_session, test_user_a, count_queries
+    ):
+        """Test that every statement on items names the user, so PostgreSQL
+        only scans the user's partition of a partitioned table."""
+        user_id = test_user_a.id
+        service = ItemService(db_session)
+        item_data = ClothingItemCreate(name="Shirt", category="Tops", user_id=user_id)
+
+        with count_queries() as queries:
+            item_id = service.create_item(item_data, user_id).id
+            service.get_all_items(user_id)
+            service.get_item(item_id, user_id)
+            item_data.name = "Renamed Shirt"
+            service.update_item(item_id, item_data, user_id)
+            service.delete_item(item_id, user_id)
+
+        item_statements = [
+            statement
+            for statement in queries.statements
+            if "clothing_items" in statement and "WHERE" in statement
+        ]
+        assert any(s.startswith("UPDATE") for s in item_statements)
+        assert any(s.startswith("DELETE") for s in item_statements)
+        for statement in item_statements:
+            assert "clothing_items.user_id = ?" in statement.split("WHERE", 1)[1]
+
+
 class TestItemServiceErrorConditions:
     """Tests for error conditions in ItemService."""
 
@@ -609,3 +703,24 @@ class TestItemServiceImageUploadIntegration:
         assert result.name == "Test T-Shirt"
         # Verify update succeeded
         assert result.id == initial_item.id
+
+    def test_image_bytes_are_counted(
+        self, db_session, test_user_a, tmp_path, monkeypatch
+    ):
+        """Test that image bytes written and read are added to the metrics."""
+        monkeypatch.setattr(upload_settings, "upload_dir", str(tmp_path))
+        service = ItemService(db_session)
+        item_data = ClothingItemCreate(
+            name="Test T-Shirt",
+            user_id=test_user_a.id,
+            image_data=base64.b64encode(b"0123456789").decode("utf-8"),
+            image_name="test.jpg",
+        )
+        written = image_bytes.value("write")
+        read = image_bytes.value("read")
+
+        created = service.create_item(item_data, test_user_a.id)
+        service.get_item(created.id, test_user_a.id)
+
+        assert image_bytes.value("write") == written + 10
+        assert image_bytes.value("read") == read + 10
@@ -0,0 +1,277 @@
+"""
+Tests for the background job queue, its worker and the built-in job handlers.
+"""
+
+import io
+import os
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from PIL import Image
+from sqlalchemy.orm import sessionmaker
+
+from backend.config.job_settings import job_settings
+from backend.config.upload_settings import upload_settings
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.job_model import JobModel
+from backend.services import job_service
+from backend.services.color_service import decode_palettes
+from backend.services.job_service import (
+    JobService,
+    job_handlers,
+    retry_delay,
+    run_job_handler,
+    utcnow,
+)
+from backend.services.upload_service import collect_orphaned_images
+from backend.worker import Worker
+
+
+@pytest.fixture
+def test_handlers(monkeypatch):
+    """Register handlers that echo their payload or always fail."""
+
+    def echo(db_session, payload):
+        return payload
+
+    def fail(db_session, payload):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(job_handlers, "test.echo", echo)
+    monkeypatch.setitem(job_handlers, "test.fail", fail)
+
+
+def _job(db_session, job_id):
+    """Load the current state of a job."""
+    db_session.expire_all()
+    return db_session.get(JobModel, job_id)
+
+
+class TestJobService:
+    """Tests for enqueuing, claiming and finishing jobs."""
+
+    def test_enqueue_unknown_kind(self, db_session):
+        """Test that jobs without a handler are rejected."""
+        with pytest.raises(ValueError):
+            JobService(db_session).enqueue("test.unknown")
+
+    def test_claim_due_jobs_in_order(self, db_session, test_handlers):
+        """Test that claims take due jobs oldest first, up to the limit."""
+        service = JobService(db_session)
+        first = service.enqueue("test.echo", {"n": 1})
+        second = service.enqueue("test.echo", {"n": 2})
+        service.enqueue("test.echo", {"n": 3})
+        service.enqueue("test.echo", {"n": 4}, delay=3600)
+
+        claimed = service.claim_jobs("worker-a", limit=2)
+
+        assert [job.id for job in claimed] == [first.id, second.id]
+        assert all(job.status == "running" and job.attempts == 1 for job in claimed)
+        assert _job(db_session, first.id).locked_by == "worker-a"
+
+        # The delayed job is not due yet
+        assert len(service.claim_jobs("worker-b", limit=10)) == 1
+        assert service.claim_jobs("worker-b", limit=10) == []
+
+    def test_expired_lease_is_claimed_again(self, db_session, test_handlers):
+        """Test that jobs of a dead worker are picked up after their lease."""
+        service = JobService(db_session)
+        job = service.enqueue("test.echo")
+        service.claim_jobs("worker-a", limit=1)
+        assert service.claim_jobs("worker-b", limit=1) == []
+
+        _job(db_session, job.id).locked_until = utcnow() - timedelta(seconds=1)
+        db_session.commit()
+
+        reclaimed = service.claim_jobs("worker-b", limit=1)
+        assert [j.attempts for j in reclaimed] == [2]
+        # The first worker lost the job, so its result is not recorded
+        assert service.complete_job(job.id, "worker-a", "late") is False
+        assert service.complete_job(job.id, "worker-b", "done") is True
+        assert _job(db_session, job.id).result == "done"
+
+    def test_expired_lease_on_last_attempt_fails(self, db_session, test_handlers):
+        """Test that a job is not restarted once all its attempts were used."""
+        service = JobService(db_session)
+        job = service.enqueue("test.echo", max_attempts=1)
+        service.claim_jobs("worker-a", limit=1)
+        _job(db_session, job.id).locked_until = utcnow() - timedelta(seconds=1)
+        db_session.commit()
+
+        assert service.claim_jobs("worker-b", limit=1) == []
+        db_job = _job(db_session, job.id)
+        assert db_job.status == "failed"
+        assert db_job.last_error == "Worker lease expired"
+
+    def test_renew_leases(self, db_session, test_handlers):
+        """Test that only the worker still holding a job renews its lease."""
+        service = JobService(db_session)
+        job = service.enqueue("test.echo")
+        service.claim_jobs("worker-a", limit=1)
+        _job(db_session, job.id).locked_until = utcnow() + timedelta(seconds=1)
+        db_session.commit()
+
+        assert service.renew_leases("worker-b", [job.id]) == 0
+        assert service.renew_leases("worker-a", [job.id]) == 1
+        locked_until = _job(db_session, job.id).locked_until
+        assert locked_until > utcnow() + timedelta(
+            seconds=job_settings.lease_seconds - 5
+        )
+        assert service.renew_leases("worker-a", []) == 0
+
+    def test_failed_job_retries_with_backoff(self, db_session, test_handlers):
+        """Test that failures are retried later until attempts run out."""
+        service = JobService(db_session)
+        job = service.enqueue("test.fail", max_attempts=2)
+
+        service.claim_jobs("worker-a", limit=1)
+        before = utcnow()
+        assert service.fail_job(job.id, "worker-a", RuntimeError("boom")) is True
+        db_job = _job(db_session, job.id)
+        assert db_job.status == "queued"
+        assert db_job.run_at > before
+        assert db_job.last_error == "RuntimeError: boom"
+
+        db_job.run_at = utcnow()
+        db_session.commit()
+        service.claim_jobs("worker-a", limit=1)
+        service.fail_job(job.id, "worker-a", RuntimeError("boom"))
+        assert _job(db_session, job.id).status == "failed"
+
+    def test_retry_delay_grows_to_maximum(self, monkeypatch):
+        """Test that retry delays double per attempt and are capped."""
+        monkeypatch.setattr(job_settings, "retry_base_delay", 2.0)
+        monkeypatch.setattr(job_settings, "retry_max_delay", 10.0)
+        monkeypatch.setattr(job_service.random, "uniform", lambda low, high: high)
+
+        assert [retry_delay(n) for n in range(1, 6)] == [2.0, 4.0, 8.0, 10.0, 10.0]
+
+    def test_get_job_other_user(self, db_session, test_user_a, test_user_b):
+        """Test that users only see their own jobs."""
+        job = JobService(db_session).enqueue("uploads.gc", user_id=test_user_a.id)
+
+        service = JobService(db_session)
+        assert service.get_job(job.id, test_user_a.id).kind == "uploads.gc"
+        assert service.get_job(job.id, test_user_b.id) is None
+
+
+class TestWorker:
+    """Tests for running claimed jobs in a pool."""
+
+    def test_worker_runs_and_records_jobs(self, db_session, test_handlers):
+        """Test that a thread pool worker runs jobs and records the outcomes."""
+        service = JobService(db_session)
+        echo = service.enqueue("test.echo", {"value": 42})
+        fail = service.enqueue("test.fail", max_attempts=1)
+
+        worker = Worker(
+            session_factory=sessionmaker(bind=db_session.get_bind()),
+            pool="thread",
+            concurrency=1,
+            worker_id="test-worker",
+        )
+        try:
+            assert worker.run_once() == 1
+            while worker.running:
+                worker.collect(None)
+            assert worker.run_once() == 1
+            while worker.running:
+                worker.collect(None)
+        finally:
+            worker.stop()
+            worker.run()
+
+        assert _job(db_session, echo.id).status == "succeeded"
+        assert _job(db_session, echo.id).result == {"value": 42}
+        assert _job(db_session, fail.id).status == "failed"
+        assert _job(db_session, fail.id).last_error == "RuntimeError: boom"
+
+    def test_worker_renews_leases_of_long_jobs(
+        self, db_session, test_handlers, monkeypatch
+    ):
+        """Test that a job running past its lease is not claimed again."""
+        release = threading.Event()
+        monkeypatch.setitem(
+            job_handlers, "test.slow", lambda db_session, payload: release.wait(5)
+        )
+        job = JobService(db_session).enqueue("test.slow")
+
+        worker = Worker(
+            session_factory=sessionmaker(bind=db_session.get_bind()),
+            pool="thread",
+            concurrency=2,
+            worker_id="test-worker",
+        )
+        try:
+            assert worker.run_once() == 1
+            # The lease is about to run out when the next renewal is due
+            _job(db_session, job.id).locked_until = utcnow()
+            db_session.commit()
+            worker._renewed_at -= job_settings.lease_seconds
+
+            worker.run_once()
+            assert JobService(db_session).claim_jobs("other-worker", 1) == []
+        finally:
+            release.set()
+            worker.stop()
+            worker.run()
+
+        assert _job(db_session, job.id).status == "succeeded"
+
+    def test_run_job_handler_unknown_kind(self, db_session):
+        """Test that running a job without a handler raises."""
+        with pytest.raises(ValueError):
+            run_job_handler("test.unknown", {}, sessionmaker())
+
+
+class TestJobHandlers:
+    """Tests for the built-in job handlers."""
+
+    def test_extract_item_palette(self, db_session, test_user_a, tmp_path):
+        """Test that the palette job stores the palette of a stored image."""
+        image_path = tmp_path / "red.png"
+        buffer = io.BytesIO()
+        Image.new("RGB", (10, 10), (255, 0, 0)).save(buffer, format="PNG")
+        image_path.write_bytes(buffer.getvalue())
+        db_item = ClothingItemModel(
+            name="Red", user_id=test_user_a.id, image_path=str(image_path)
+        )
+        db_session.add(db_item)
+        db_session.commit()
+
+        payload = {"item_id": db_item.id, "user_id": test_user_a.id}
+        result = job_handlers["image.palette"](db_session, payload)
+
+        assert result == {"colors": 1}
+        palette = decode_palettes([db_item.color_palette])[0]
+        assert palette[0, 1] > 50  # Strongly red
+
+        # The item is looked up under the owner named in the payload
+        other = {"item_id": db_item.id, "user_id": test_user_a.id + 1}
+        assert job_handlers["image.palette"](db_session, other) is None
+
+    def test_collect_orphaned_images(
+        self, db_session, test_user_a, tmp_path, monkeypatch
+    ):
+        """Test that only old files without an item are deleted."""
+        monkeypatch.setattr(upload_settings, "upload_dir", str(tmp_path))
+        kept = tmp_path / "kept.png"
+        orphan = tmp_path / "orphan.png"
+        recent = tmp_path / "recent.png"
+        for path in (kept, orphan, recent):
+            path.write_bytes(b"image")
+        an_hour_ago = time.time() - 7200
+        os.utime(kept, (an_hour_ago, an_hour_ago))
+        os.utime(orphan, (an_hour_ago, an_hour_ago))
+        db_session.add(
+            ClothingItemModel(name="Kept", user_id=test_user_a.id, image_path=str(kept))
+        )
+        db_session.commit()
+
+        result = collect_orphaned_images(db_session, {})
+
+        assert result == {"removed": 1}
+        assert kept.exists() and recent.exists()
+        assert not orphan.exists()
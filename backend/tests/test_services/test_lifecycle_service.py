@@ -0,0 +1,113 @@
+"""
+Tests for warm-up and graceful shutdown.
+"""
+
+import asyncio
+import signal
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from backend.services import lifecycle_service
+from backend.services.lifecycle_service import (
+    InFlightRequests,
+    drain_on_sigterm,
+    prime_caches,
+    warm_up_pool,
+)
+
+
+class TestInFlightRequests:
+    """Tests for InFlightRequests."""
+
+    def test_counts_requests(self):
+        """Test that started requests are counted until they finish."""
+        requests = InFlightRequests()
+        assert requests.start() is True
+        assert requests.start() is True
+        assert requests.count == 2
+        requests.finish()
+        assert requests.count == 1
+
+    def test_refuses_while_draining(self):
+        """Test that no request starts once draining."""
+        requests = InFlightRequests()
+        requests.draining = True
+        assert requests.start() is False
+        assert requests.count == 0
+
+    def test_wait_idle(self):
+        """Test that waiting returns once the last request finishes."""
+
+        async def run():
+            requests = InFlightRequests()
+            requests.start()
+            asyncio.get_running_loop().call_later(0.02, requests.finish)
+            return await requests.wait_idle(1.0)
+
+        assert asyncio.run(run()) is True
+
+    def test_wait_idle_times_out(self):
+        """Test that waiting gives up at the timeout."""
+        requests = InFlightRequests()
+        requests.start()
+        assert asyncio.run(requests.wait_idle(0.02)) is False
+
+    def test_sigterm_drains_before_server_stops(self, monkeypatch):
+        """Test that SIGTERM refuses requests at once and stops the server later."""
+        requests = InFlightRequests()
+        monkeypatch.setattr(lifecycle_service, "in_flight", requests)
+        stopped = []
+        server_handler = signal.signal(
+            signal.SIGTERM, lambda signum, frame: stopped.append(signum)
+        )
+
+        async def run():
+            assert drain_on_sigterm(delay=0.05)
+            signal.raise_signal(signal.SIGTERM)
+            await asyncio.sleep(0)
+            assert requests.draining and stopped == []
+            await asyncio.sleep(0.1)
+            assert stopped == [signal.SIGTERM]
+
+            # Another SIGTERM is passed on right away
+            signal.raise_signal(signal.SIGTERM)
+            assert stopped == [signal.SIGTERM, signal.SIGTERM]
+
+        try:
+            asyncio.run(run())
+        finally:
+            signal.signal(signal.SIGTERM, server_handler)
+
+
+class TestWarmUp:
+    """Tests for pool and cache warm-up."""
+
+    def test_warm_up_pool_fills_pool(self, tmp_path):
+        """Test that opened connections are left idle in the pool."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'warm.db'}", poolclass=QueuePool, pool_size=3
+        )
+        try:
+            assert warm_up_pool(engine, 2) == 2
+            assert engine.pool.checkedin() == 2
+        finally:
+            engine.dispose()
+
+    def test_warm_up_pool_capped_at_pool_size(self, tmp_path):
+        """Test that no more connections than the pool keeps are opened."""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'warm.db'}", poolclass=QueuePool, pool_size=2
+        )
+        try:
+            assert warm_up_pool(engine, 10) == 2
+            assert engine.pool.checkedin() == 2
+        finally:
+            engine.dispose()
+
+    def test_prime_caches(self, db_session, count_queries):
+        """Test that the hot queries run once each."""
+        with count_queries() as counter:
+            prime_caches(sessionmaker(bind=db_session.get_bind()))
+        assert counter.count == 2
@@ -0,0 +1,84 @@
+"""
+Tests for the event loop lag monitor.
+"""
+
+import asyncio
+import time
+
+from backend.services.loop_monitor_service import (
+    EventLoopMonitor,
+    event_loop_lag,
+    event_loop_stalls,
+)
+
+
+def _block_the_loop(seconds):
+    """Stand-in for a sync call made from an async route."""
+    time.sleep(seconds)
+
+
+class TestEventLoopMonitor:
+    """Tests for EventLoopMonitor."""
+
+    def test_measures_lag(self):
+        """Test that the monitor records how late the loop woke it."""
+
+        async def run():
+            monitor = EventLoopMonitor(interval=0.01, threshold=10)
+            monitor.start()
+            count = event_loop_lag.count()
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+            return event_loop_lag.count() - count
+
+        assert asyncio.run(run()) >= 2
+
+    def test_stall_names_route_and_stack(self):
+        """Test that a stall is reported once, with the blocking stack and route."""
+        reports = []
+
+        async def handle_request(monitor):
+            monitor.active_routes[asyncio.current_task()] = "GET /api/v1/items/"
+            try:
+                _block_the_loop(0.3)
+            finally:
+                monitor.active_routes.pop(asyncio.current_task(), None)
+
+        async def run():
+            monitor = EventLoopMonitor(interval=0.02, threshold=0.05)
+            # Check from the test rather than the watchdog thread
+            monitor._watch = lambda: None
+            monitor.start()
+            await asyncio.sleep(0.05)
+
+            # Check while the request below is still blocking the loop
+            checker = asyncio.get_running_loop().run_in_executor(
+                None, lambda: [time.sleep(0.15), reports.append(monitor.check())]
+            )
+            await handle_request(monitor)
+            await checker
+            reports.append(monitor.check())
+            await monitor.stop()
+
+        stalls = event_loop_stalls.value("GET /api/v1/items/")
+        asyncio.run(run())
+
+        stall, repeated = reports
+        assert stall["route"] == "GET /api/v1/items/"
+        assert "_block_the_loop" in stall["stack"]
+        assert repeated is None
+        assert event_loop_stalls.value("GET /api/v1/items/") == stalls + 1
+
+    def test_no_stall_without_blocking(self):
+        """Test that a responsive loop is never reported."""
+
+        async def run():
+            monitor = EventLoopMonitor(interval=0.01, threshold=0.2)
+            monitor._watch = lambda: None
+            monitor.start()
+            await asyncio.sleep(0.05)
+            report = monitor.check()
+            await monitor.stop()
+            return report
+
+        assert asyncio.run(run()) is None
@@ -0,0 +1,76 @@
+"""
+Tests for the in-process metrics and their Prometheus text format.
+"""
+
+import pytest
+
+from backend.services.metrics_service import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    """Create an empty metrics registry."""
+    return MetricsRegistry()
+
+
+class TestMetrics:
+    """Tests for counters, gauges and histograms."""
+
+    def test_counter(self, registry):
+        """Test that counters add up per label set and render with help text."""
+        counter = registry.counter("requests_total", "Requests.", ("route",))
+        counter.inc("/a")
+        counter.inc("/a", amount=2)
+        counter.inc('/b"c')
+
+        assert counter.value("/a") == 3
+        assert registry.render().splitlines() == [
+            "# HELP requests_total Requests.",
+            "# TYPE requests_total counter",
+            'requests_total{route="/a"} 3.0',
+            'requests_total{route="/b\\"c"} 1.0',
+        ]
+
+    def test_counter_rejects_decrease_and_wrong_labels(self, registry):
+        """Test that counters only go up and need every label."""
+        counter = registry.counter("requests_total", "Requests.", ("route",))
+
+        with pytest.raises(ValueError):
+            counter.inc("/a", amount=-1)
+        with pytest.raises(ValueError):
+            counter.inc()
+
+    def test_gauge(self, registry):
+        """Test that gauges go up and down."""
+        gauge = registry.gauge("in_progress", "In progress.")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert gauge.value() == 1
+        assert "in_progress 1.0" in registry.render()
+
+    def test_histogram(self, registry):
+        """Test that histograms render cumulative buckets, sum and count."""
+        histogram = registry.histogram(
+            "latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe("/a", value=value)
+
+        assert histogram.count("/a") == 4
+        lines = registry.render().splitlines()
+        assert lines[2:] == [
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="1.0"} 3',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+            'latency_seconds_sum{route="/a"} 3.65',
+            'latency_seconds_count{route="/a"} 4',
+        ]
+
+    def test_duplicate_names_are_rejected(self, registry):
+        """Test that a metric name can only be registered once."""
+        registry.counter("requests_total", "Requests.")
+
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests.")
@@ -0,0 +1,203 @@
+"""
+Tests for OutfitService CRUD operations, wear tracking and batched loading of
+outfit items.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.outfit_model import OutfitItemModel
+from backend.schemas.outfit import Outfit, OutfitCreate, OutfitItemCreate
+from backend.services.item_service import ItemService
+from backend.services.outfit_service import OutfitService
+
+
+def _create_items(db_session, user_id, count):
+    """Create count clothing items for a user and return their IDs."""
+    db_items = [
+        ClothingItemModel(name=f"Item {i}", category="Tops", user_id=user_id)
+        for i in range(count)
+    ]
+    db_session.add_all(db_items)
+    db_session.commit()
+    return [db_item.id for db_item in db_items]
+
+
+class TestOutfitServiceCRUDOperations:
+    """Tests for OutfitService CRUD operations."""
+
+    def test_create_outfit_preserves_item_order_and_metadata(
+        self, db_session, test_user_a
+    ):
+        """Test that items are stored in the given order with their layout metadata."""
+        item_ids = _create_items(db_session, test_user_a.id, 3)
+        outfit_data = OutfitCreate(
+            name="Weekend",
+            description="Casual weekend look",
+            items=[
+                OutfitItemCreate(
+                    clothing_item_id=item_ids[2], x=1.0, y=2.0, rotation=90.0, layer=2
+                ),
+                OutfitItemCreate(clothing_item_id=item_ids[0]),
+                OutfitItemCreate(clothing_item_id=item_ids[1], layer=1),
+            ],
+        )
+
+        service = OutfitService(db_session)
+        result = service.create_outfit(outfit_data, user_id=test_user_a.id)
+
+        assert isinstance(result, Outfit)
+        assert result.id is not None
+        assert result.user_id == test_user_a.id
+        assert result.name == "Weekend"
+        assert [item.clothing_item_id for item in result.items] == [
+            item_ids[2],
+            item_ids[0],
+            item_ids[1],
+        ]
+        assert [item.position for item in result.items] == [0, 1, 2]
+        assert result.items[0].rotation == 90.0
+        assert result.items[0].layer == 2
+        assert result.items[0].clothing_item.name == "Item 2"
+
+    def test_create_outfit_with_other_user_item(
+        self, db_session, test_user_a, test_clothing_item_partial_b
+    ):
+        """Test that outfits cannot reference items owned by another user."""
+        service = OutfitService(db_session)
+        outfit_data = OutfitCreate(
+            name="Borrowed",
+            items=[OutfitItemCreate(clothing_item_id=test_clothing_item_partial_b.id)],
+        )
+
+        with pytest.raises(ValueError):
+            service.create_outfit(outfit_data, user_id=test_user_a.id)
+
+    def test_get_outfit_existing_outfit(self, db_session, test_user_a, test_outfit_a):
+        """Test retrieving an existing outfit."""
+        service = OutfitService(db_session)
+        result = service.get_outfit(test_outfit_a.id, test_user_a.id)
+
+        assert result is not None
+        assert result.name == "Test Outfit"
+        assert len(result.items) == 1
+        assert result.items[0].x == 10.0
+        assert result.items[0].clothing_item.name == "Test T-Shirt"
+
+    def test_get_outfit_other_user(self, db_session, test_user_b, test_outfit_a):
+        """Test that a user cannot retrieve another user's outfit."""
+        service = OutfitService(db_session)
+        assert service.get_outfit(test_outfit_a.id, test_user_b.id) is None
+
+    def test_update_outfit_replaces_items(self, db_session, test_user_a, test_outfit_a):
+        """Test that updating an outfit replaces its ordered items."""
+        item_ids = _create_items(db_session, test_user_a.id, 2)
+        service = OutfitService(db_session)
+
+        result = service.update_outfit(
+            test_outfit_a.id,
+            OutfitCreate(
+                name="Updated Outfit",
+                items=[
+                    OutfitItemCreate(clothing_item_id=item_ids[1]),
+                    OutfitItemCreate(clothing_item_id=item_ids[0]),
+                ],
+            ),
+            test_user_a.id,
+        )
+
+        assert result is not None
+        assert result.name == "Updated Outfit"
+        assert [item.clothing_item_id for item in result.items] == [
+            item_ids[1],
+            item_ids[0],
+        ]
+        assert [item.position for item in result.items] == [0, 1]
+
+    def test_update_outfit_nonexistent(self, db_session, test_user_a):
+        """Test updating an outfit that does not exist."""
+        service = OutfitService(db_session)
+        result = service.update_outfit(99999, OutfitCreate(name="Nope"), test_user_a.id)
+        assert result is None
+
+    def test_delete_outfit(self, db_session, test_user_a, test_outfit_a):
+        """Test deleting an outfit."""
+        service = OutfitService(db_session)
+
+        assert service.delete_outfit(test_outfit_a.id, test_user_a.id) is True
+        assert service.get_outfit(test_outfit_a.id, test_user_a.id) is None
+
+    def test_delete_outfit_other_user(self, db_session, test_user_b, test_outfit_a):
+        """Test that a user cannot delete another user's outfit."""
+        service = OutfitService(db_session)
+        assert service.delete_outfit(test_outfit_a.id, test_user_b.id) is False
+
+    def test_deleted_item_leaves_outfit(
+        self, db_session, test_user_a, test_outfit_a, test_clothing_item_partial_a
+    ):
+        """Test that an outfit still loads after one of its items is deleted."""
+        assert ItemService(db_session).delete_item(
+            test_clothing_item_partial_a.id, test_user_a.id
+        )
+
+        outfits = OutfitService(db_session).get_all_outfits(test_user_a.id)
+
+        assert [outfit.id for outfit in outfits] == [test_outfit_a.id]
+        assert outfits[0].items == []
+        assert db_session.query(OutfitItemModel).count() == 0
+
+    def test_wear_outfit_updates_item_wear_history(
+        self, db_session, test_user_a, test_outfit_a
+    ):
+        """Test that wearing an outfit updates the wear history of its items only."""
+        other_id = _create_items(db_session, test_user_a.id, 1)[0]
+        worn_at = datetime(2025, 3, 1, 8, 30)
+        service = OutfitService(db_session)
+
+        service.wear_outfit(test_outfit_a.id, test_user_a.id, worn_at=worn_at)
+        result = service.wear_outfit(test_outfit_a.id, test_user_a.id)
+
+        worn = result.items[0].clothing_item
+        assert worn.wear_count == 2
+        assert worn.last_worn_at > worn_at
+        other = db_session.get(ClothingItemModel, (other_id, test_user_a.id))
+        assert other.wear_count == 0
+        assert other.last_worn_at is None
+
+    def test_wear_outfit_other_user(self, db_session, test_user_b, test_outfit_a):
+        """Test that users cannot wear other users' outfits."""
+        service = OutfitService(db_session)
+        assert service.wear_outfit(test_outfit_a.id, test_user_b.id) is None
+        assert test_outfit_a.items[0].clothing_item.wear_count == 0
+
+
+class TestOutfitServiceBatchLoading:
+    """Tests that listing outfits does not issue one query per outfit."""
+
+    @pytest.mark.parametrize("outfit_count", [1, 5, 25])
+    def test_get_all_outfits_constant_query_count(
+        self, db_session, test_user_a, count_queries, outfit_count
+    ):
+        """Test that the number of queries does not depend on the number of outfits."""
+        user_id = test_user_a.id
+        item_ids = _create_items(db_session, user_id, 4)
+        service = OutfitService(db_session)
+        for i in range(outfit_count):
+            service.create_outfit(
+                OutfitCreate(
+                    name=f"Outfit {i}",
+                    items=[OutfitItemCreate(clothing_item_id=x) for x in item_ids],
+                ),
+                user_id=user_id,
+            )
+        db_session.expire_all()
+
+        with count_queries() as queries:
+            results = service.get_all_outfits(user_id)
+
+        assert len(results) == outfit_count
+        assert all(len(outfit.items) == 4 for outfit in results)
+        # One query each for outfits, outfit items and clothing items
+        assert queries.count == 3
@@ -0,0 +1,96 @@
+"""
+Tests for password hashing, its bounded pool and cost calibration.
+"""
+
+import hashlib
+import threading
+
+import pytest
+
+from backend.services.password_service import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    calibrate_rounds,
+    create_password_context,
+    verify_legacy_password,
+)
+
+
+@pytest.fixture
+def hasher():
+    """Create a single-threaded hasher without a waiting queue."""
+    hasher = PasswordHasher(create_password_context("scrypt", rounds=1), 1, 0)
+    yield hasher
+    hasher.shutdown()
+
+
+class TestPasswordHasher:
+    """Tests for PasswordHasher."""
+
+    def test_hash_and_verify(self, hasher):
+        """Test that hashes are salted and verify only the right password."""
+        first = hasher.hash("secret")
+        second = hasher.hash("secret")
+
+        assert first != second
+        assert hasher.verify_and_update("secret", first) == (True, None)
+        assert hasher.verify_and_update("wrong", first) == (False, None)
+
+    def test_unknown_hash_does_not_verify(self, hasher):
+        """Test that hashes passlib does not recognize never match."""
+        legacy = hashlib.sha256(b"secretsalt").hexdigest()
+
+        assert hasher.verify_and_update("secret", legacy) == (False, None)
+
+    def test_full_queue_is_refused(self, hasher):
+        """Test that hashes beyond the pool and queue size are refused."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def block(password):
+            started.set()
+            release.wait(5)
+            return "hash"
+
+        hasher.context = type("Blocking", (), {"hash": staticmethod(block)})()
+        thread = threading.Thread(target=hasher.hash, args=("secret",))
+        thread.start()
+        try:
+            assert started.wait(5)
+            with pytest.raises(PasswordHasherBusyError):
+                hasher.hash("secret")
+        finally:
+            release.set()
+            thread.join()
+
+        # The slot is free again once the running hash finished
+        assert hasher.hash("secret") == "hash"
+
+
+class TestLegacyPasswords:
+    """Tests for salted SHA-256 hashes stored before passlib."""
+
+    def test_verify_legacy_password(self):
+        """Test that legacy hashes verify with their stored salt."""
+        hashed = hashlib.sha256(b"secret" + b"salt").hexdigest()
+
+        assert verify_legacy_password("secret", "salt", hashed)
+        assert not verify_legacy_password("secret", "other", hashed)
+        assert not verify_legacy_password("wrong", "salt", hashed)
+
+
+class TestCalibration:
+    """Tests for picking the cost factor."""
+
+    def test_calibrate_rounds(self):
+        """Test that calibration stays at or under the target latency."""
+        rounds, elapsed = calibrate_rounds("scrypt", target_seconds=0.02, samples=1)
+
+        assert rounds >= 1
+        assert elapsed <= 0.02 or rounds == 1
+
+    def test_zero_target_uses_minimum(self):
+        """Test that an unreachable target falls back to the cheapest cost."""
+        rounds, _ = calibrate_rounds("scrypt", target_seconds=0, samples=1)
+
+        assert rounds == 1
@@ -0,0 +1,99 @@
+"""
+Tests for the sampling profiler.
+"""
+
+import pstats
+import threading
+
+import pytest
+
+from backend.services import profiler_service
+from backend.services.profiler_service import (
+    ProfilerBusyError,
+    SamplingProfiler,
+    profile_process,
+)
+
+
+def _spin(stop):
+    """Keep a thread busy until told to stop."""
+    while not stop.is_set():
+        sum(range(100))
+
+
+def _wait(stop):
+    """Keep a thread waiting until told to stop."""
+    stop.wait()
+
+
+@pytest.fixture
+def busy_threads():
+    """Run one spinning and one waiting thread while a test profiles them."""
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=_spin, args=(stop,)),
+        threading.Thread(target=_wait, args=(stop,)),
+    ]
+    for thread in threads:
+        thread.start()
+    yield
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+
+class TestSamplingProfiler:
+    """Tests for SamplingProfiler."""
+
+    def test_collapsed_stacks(self, busy_threads):
+        """Test that samples of other threads become root-first collapsed stacks."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.run(0.05)
+
+        assert profiler.samples > 5
+        lines = profiler.collapsed().splitlines()
+        spin_lines = [line for line in lines if "_spin (" in line]
+        assert spin_lines
+        frames, count = spin_lines[0].rsplit(" ", 1)
+        assert int(count) >= 1
+        # Thread bootstrap code is the root, so the spinning function follows it
+        assert frames.index("_bootstrap") < frames.index("_spin")
+
+    def test_only_through(self, busy_threads):
+        """Test that only stacks through the given functions are kept."""
+        profiler = SamplingProfiler(
+            interval=0.001, only_through=frozenset({_spin.__code__})
+        )
+        profiler.run(0.05)
+
+        collapsed = profiler.collapsed()
+        assert "_spin (" in collapsed
+        assert "_wait (" not in collapsed
+
+    def test_pstats(self, busy_threads, tmp_path):
+        """Test that the pstats output loads with the standard library."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.run(0.05)
+        path = tmp_path / "profile.pstats"
+        path.write_bytes(profiler.pstats())
+
+        stats = pstats.Stats(str(path))
+
+        functions = {name for _, _, name in stats.stats}
+        assert {"_spin", "_wait"} <= functions
+        assert stats.total_tt > 0
+
+
+class TestProfileProcess:
+    """Tests for running one profile at a time."""
+
+    def test_concurrent_profiles_are_refused(self, monkeypatch):
+        """Test that a second profile fails while one is running."""
+        assert profiler_service._profile_lock.acquire(blocking=False)
+        try:
+            with pytest.raises(ProfilerBusyError):
+                profile_process(0.01, 0.001)
+        finally:
+            profiler_service._profile_lock.release()
+
+        assert profile_process(0.01, 0.001).samples >= 1
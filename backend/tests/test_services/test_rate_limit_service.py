@@ -0,0 +1,48 @@
+"""
+Tests for the token bucket rate limiter.
+"""
+
+import pytest
+
+from backend.services.rate_limit_service import TokenBucketLimiter
+
+
+class TestTokenBucketLimiter:
+    """Tests for TokenBucketLimiter."""
+
+    def test_burst_then_refill(self):
+        """Test that a bucket allows its burst, then refills at the rate."""
+        limiter = TokenBucketLimiter(rate=2.0, burst=3, max_keys=10)
+
+        assert [limiter.acquire("a", now=0) for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire("a", now=0) == pytest.approx(0.5)
+
+        # Half a second refills one token
+        assert limiter.acquire("a", now=0.5) == 0
+        assert limiter.acquire("a", now=0.5) > 0
+
+    def test_refill_is_capped_at_burst(self):
+        """Test that idle time does not save up more than the burst."""
+        limiter = TokenBucketLimiter(rate=1.0, burst=2, max_keys=10)
+        limiter.acquire("a", now=0)
+
+        assert [limiter.acquire("a", now=100) for _ in range(3)][-1] > 0
+
+    def test_keys_are_independent(self):
+        """Test that one key running dry does not limit another."""
+        limiter = TokenBucketLimiter(rate=1.0, burst=1, max_keys=10)
+
+        assert limiter.acquire("a", now=0) == 0
+        assert limiter.acquire("a", now=0) > 0
+        assert limiter.acquire("b", now=0) == 0
+
+    def test_least_recently_used_buckets_are_dropped(self):
+        """Test that the number of buckets is bounded."""
+        limiter = TokenBucketLimiter(rate=1.0, burst=1, max_keys=2)
+        for key in ("a", "b", "c"):
+            limiter.acquire(key, now=0)
+
+        assert len(limiter) == 2
+        # "a" was dropped, so it starts with a full bucket again
+        assert limiter.acquire("a", now=0) == 0
+        assert limiter.acquire("c", now=0) > 0
@@ -0,0 +1,254 @@
+"""
+Tests for outfit recommendation features, ranking and RecommendationService.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.benchmarks.recommendation_benchmark import make_closet_rows
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.services.color_service import encode_palette
+from backend.services.recommendation_service import (
+    ALL_SEASONS,
+    BOTTOM,
+    OUTERWEAR,
+    SEASON_BITS,
+    SHOES,
+    TOP,
+    RecommendationService,
+    build_features,
+    category_slot,
+    rank_outfits,
+)
+
+NOW = datetime(2025, 6, 1, 12, 0)
+
+
+def _palette(a, b):
+    """Encode a single-color palette with the given a/b chroma."""
+    return encode_palette(np.array([[50.0, a, b, 1.0]]))
+
+
+RED = _palette(60, 45)
+BLUE = _palette(-60, -45)
+GREEN = _palette(-60, 45)
+
+
+def _add_item(db_session, user_id, name, category, color_palette=None, **fields):
+    """Insert a clothing item directly and return it."""
+    db_item = ClothingItemModel(
+        name=name,
+        category=category,
+        color_palette=color_palette,
+        user_id=user_id,
+        **fields,
+    )
+    db_session.add(db_item)
+    db_session.commit()
+    db_session.refresh(db_item)
+    return db_item
+
+
+class TestRecommendationFeatures:
+    """Tests for building item feature vectors."""
+
+    @pytest.mark.parametrize(
+        "category, slot",
+        [
+            ("Tops", TOP),
+            ("t-shirt", TOP),
+            ("Pants", BOTTOM),
+            ("jeans", BOTTOM),
+            ("Shoes", SHOES),
+            ("Sneakers", SHOES),
+            ("Coats", OUTERWEAR),
+            ("outerwear", OUTERWEAR),
+            ("Dresses", -1),
+            (None, -1),
+        ],
+    )
+    def test_category_slot(self, category, slot):
+        """Test that categories map to outfit slots."""
+        assert category_slot(category) == slot
+
+    def test_build_features(self):
+        """Test that seasons, colors and wear history become feature vectors."""
+        rows = [
+            (1, "Tops", RED, ["summer", "fall"], 0, None),
+            (2, "Pants", None, None, 4, NOW - timedelta(days=1)),
+            (3, "Shoes", _palette(2, 1), ["allSeason"], 2, NOW - timedelta(days=60)),
+        ]
+
+        features = build_features(rows, NOW)
+
+        assert features.ids.tolist() == [1, 2, 3]
+        assert features.slots.tolist() == [TOP, BOTTOM, SHOES]
+        assert features.seasons.tolist() == [
+            SEASON_BITS["summer"] | SEASON_BITS["fall"],
+            ALL_SEASONS,
+            ALL_SEASONS,
+        ]
+        # Saturated colors count fully, unknown and near-gray colors are neutral
+        assert features.saturation[0] == 1.0
+        assert features.saturation[1] == 0.0
+        assert features.saturation[2] < 0.2
+        # Unworn items are freshest; recently and often worn items the least
+        assert features.freshness[0] == 1.0
+        assert features.freshness[1] < features.freshness[2] < 1.0
+
+
+class TestRankOutfits:
+    """Tests for scoring and pruning candidate outfits."""
+
+    def test_prefers_harmonious_colors(self):
+        """Test that matching or opposite hues beat clashing hues."""
+        rows = [
+            (1, "Tops", RED, None, 0, None),
+            (2, "Pants", GREEN, None, 0, None),
+            (3, "Pants", BLUE, None, 0, None),
+            (4, "Shoes", None, None, 0, None),
+        ]
+        features = build_features(rows, NOW)
+
+        ranked = rank_outfits(features, limit=2)
+
+        assert [features.ids[indices].tolist() for indices, _ in ranked] == [
+            [1, 3, 4],
+            [1, 2, 4],
+        ]
+        assert ranked[0][1] == pytest.approx(1.0)
+        assert ranked[0][1] > ranked[1][1]
+
+    def test_requires_shared_season(self):
+        """Test that outfits without a season shared by every item are pruned."""
+        rows = [
+            (1, "Tops", None, ["summer"], 0, None),
+            (2, "Pants", None, ["summer", "winter"], 0, None),
+            (3, "Shoes", None, ["winter"], 0, None),
+            (4, "Shoes", None, None, 0, None),
+        ]
+        features = build_features(rows, NOW)
+
+        ranked = rank_outfits(features, limit=10)
+        assert [features.ids[indices].tolist() for indices, _ in ranked] == [[1, 2, 4]]
+
+        assert rank_outfits(features, season=SEASON_BITS["winter"]) == []
+
+    def test_missing_slot(self):
+        """Test that no outfits are returned when a slot cannot be filled."""
+        rows = [(1, "Tops", None, None, 0, None), (2, "Pants", None, None, 0, None)]
+        features = build_features(rows, NOW)
+
+        assert rank_outfits(features) == []
+
+    def test_outerwear(self):
+        """Test that outerwear is added as a fourth item when requested."""
+        rows = [
+            (1, "Tops", None, None, 0, None),
+            (2, "Pants", None, None, 0, None),
+            (3, "Shoes", None, None, 0, None),
+        ]
+        features = build_features(rows, NOW)
+        assert rank_outfits(features, outerwear=True) == []
+
+        rows.append((4, "Coats", None, None, 0, None))
+        features = build_features(rows, NOW)
+        ranked = rank_outfits(features, outerwear=True)
+        assert features.ids[ranked[0][0]].tolist() == [1, 2, 3, 4]
+
+    def test_large_closet_is_fast(self):
+        """Test that a 2,000 item closet is ranked well under a second."""
+        rows = make_closet_rows(2000, seed=1, now=NOW)
+
+        start = time.perf_counter()
+        features = build_features(rows, NOW)
+        ranked = rank_outfits(features, limit=10, outerwear=True)
+        elapsed = time.perf_counter() - start
+
+        assert len(ranked) == 10
+        scores = [score for _, score in ranked]
+        assert scores == sorted(scores, reverse=True)
+        assert elapsed < 1.0
+
+
+class TestRecommendationService:
+    """Tests for RecommendationService."""
+
+    def test_recommend_outfits(self, db_session, test_user_a, test_user_b):
+        """Test that recommendations are full items in slot order."""
+        top = _add_item(db_session, test_user_a.id, "Red Tee", "Tops", RED)
+        _add_item(db_session, test_user_a.id, "Green Pants", "Pants", GREEN)
+        pants = _add_item(db_session, test_user_a.id, "Blue Jeans", "Jeans", BLUE)
+        shoes = _add_item(db_session, test_user_a.id, "Sneakers", "Shoes")
+        _add_item(db_session, test_user_b.id, "Other Shoes", "Shoes")
+
+        service = RecommendationService(db_session)
+        recommendations = service.recommend_outfits(test_user_a.id, limit=5)
+
+        assert len(recommendations) == 2
+        best = recommendations[0]
+        assert [item.id for item in best.items] == [top.id, pants.id, shoes.id]
+        assert best.items[0].name == "Red Tee"
+        assert best.score > recommendations[1].score
+
+    def test_item_statements_filter_by_user(
+        self, db_session, test_user_a, count_queries
+    ):
+        """Test that every item statement names the user, so PostgreSQL only
+        scans the user's partition of a partitioned table."""
+        _add_item(db_session, test_user_a.id, "Tee", "Tops")
+        _add_item(db_session, test_user_a.id, "Pants", "Pants")
+        _add_item(db_session, test_user_a.id, "Shoes", "Shoes")
+
+        with count_queries() as queries:
+            assert RecommendationService(db_session).recommend_outfits(test_user_a.id)
+
+        item_statements = [
+            statement
+            for statement in queries.statements
+            if "clothing_items" in statement and "WHERE" in statement
+        ]
+        assert len(item_statements) >= 2
+        for statement in item_statements:
+            assert "clothing_items.user_id = ?" in statement.split("WHERE", 1)[1]
+
+    def test_recently_worn_items_rank_lower(self, db_session, test_user_a):
+        """Test that wear history steers recommendations to fresher items."""
+        _add_item(db_session, test_user_a.id, "Tee", "Tops")
+        _add_item(db_session, test_user_a.id, "Pants", "Pants")
+        worn = _add_item(
+            db_session,
+            test_user_a.id,
+            "Worn Shoes",
+            "Shoes",
+            wear_count=10,
+            last_worn_at=datetime.now(),
+        )
+        fresh = _add_item(db_session, test_user_a.id, "Fresh Shoes", "Shoes")
+
+        service = RecommendationService(db_session)
+        recommendations = service.recommend_outfits(test_user_a.id)
+
+        assert [r.items[2].id for r in recommendations] == [fresh.id, worn.id]
+
+    def test_recommend_outfits_season(self, db_session, test_user_a):
+        """Test that only items worn in the requested season are recommended."""
+        _add_item(db_session, test_user_a.id, "Tee", "Tops", seasons=["summer"])
+        sweater = _add_item(
+            db_session, test_user_a.id, "Sweater", "Tops", seasons=["winter"]
+        )
+        _add_item(db_session, test_user_a.id, "Pants", "Pants")
+        _add_item(db_session, test_user_a.id, "Boots", "Boots")
+
+        service = RecommendationService(db_session)
+        recommendations = service.recommend_outfits(test_user_a.id, season="winter")
+
+        assert [r.items[0].id for r in recommendations] == [sweater.id]
+
+    def test_recommend_outfits_empty_closet(self, db_session, test_user_a):
+        """Test that an empty closet has no recommendations."""
+        service = RecommendationService(db_session)
+        assert service.recommend_outfits(test_user_a.id) == []
@@ -0,0 +1,147 @@
+"""
+Tests for the item and user repositories: the services behave the same on
+the database and in memory, and the in-memory indexes stay consistent.
+"""
+
+import pytest
+
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.user import User as UserModel
+from backend.repositories.item_repository import (
+    InMemoryItemRepository,
+    SQLAlchemyItemRepository,
+)
+from backend.repositories.user_repository import (
+    InMemoryUserRepository,
+    SQLAlchemyUserRepository,
+)
+from backend.schemas.clothing_item import ClothingItemCreate
+from backend.schemas.user import UserCreate, UserLogin
+from backend.services.auth_service import AuthService
+from backend.services.item_service import ItemService
+
+
+@pytest.fixture(params=["database", "memory"])
+def items(request, db_session, test_user_a):
+    """Item repository of each backend."""
+    if request.param == "memory":
+        return InMemoryItemRepository()
+    return SQLAlchemyItemRepository(db_session)
+
+
+@pytest.fixture(params=["database", "memory"])
+def users(request, db_session):
+    """User repository of each backend."""
+    if request.param == "memory":
+        return InMemoryUserRepository()
+    return SQLAlchemyUserRepository(db_session)
+
+
+def _item(user_id, name="Shirt"):
+    return ClothingItemCreate(name=name, category="Tops", user_id=user_id)
+
+
+class TestItemServiceOnRepositories:
+    """Tests for ItemService on each item repository."""
+
+    def test_crud(self, db_session, test_user_a, items):
+        """Test creating, reading, updating and deleting items."""
+        user_id = test_user_a.id
+        service = ItemService(db_session, items=items)
+
+        created = [
+            service.create_item(_item(user_id, f"Item {i}"), user_id) for i in range(3)
+        ]
+        assert created[0].wear_count == 0
+        assert created[0].created_at is not None
+        assert [item.name for item in service.get_all_items(user_id)] == [
+            "Item 0",
+            "Item 1",
+            "Item 2",
+        ]
+        assert service.get_item(created[1].id, user_id).name == "Item 1"
+        assert service.get_item(created[1].id, user_id + 1) is None
+
+        updated = service.update_item(created[1].id, _item(user_id, "Renamed"), user_id)
+        assert updated.name == "Renamed"
+        assert service.get_item(created[1].id, user_id).name == "Renamed"
+
+        assert service.delete_item(created[0].id, user_id) is True
+        assert service.delete_item(created[0].id, user_id) is False
+        assert [item.id for item in service.get_all_items(user_id)] == [
+            created[1].id,
+            created[2].id,
+        ]
+
+
+class TestAuthServiceOnRepositories:
+    """Tests for AuthService on each user repository."""
+
+    def test_register_and_login(self, db_session, users):
+        """Test registering, logging in and looking up a user."""
+        service = AuthService(db_session, users=users)
+        user = service.register_user(
+            UserCreate(email="a@example.com", password="secret", full_name="A")
+        )
+
+        with pytest.raises(ValueError, match="already exists"):
+            service.register_user(
+                UserCreate(email="a@example.com", password="other", full_name="B")
+            )
+
+        login = UserLogin(email="a@example.com", password="secret")
+        assert service.authenticate_user(login).id == user.id
+        wrong = UserLogin(email="a@example.com", password="wrong")
+        assert service.authenticate_user(wrong) is None
+        assert service.get_user_by_id(user.id).email == "a@example.com"
+
+
+class TestInMemoryItemRepository:
+    """Tests for the indexes of InMemoryItemRepository."""
+
+    def test_user_lists_stay_sorted(self):
+        """Test that items are listed per user in ID order."""
+        repository = InMemoryItemRepository()
+        for item_id, user_id in [(5, 1), (2, 1), (3, 2), (9, 1)]:
+            repository.add(ClothingItemModel(id=item_id, name="Item", user_id=user_id))
+
+        assert [item.id for item in repository.list_for_user(1)] == [2, 5, 9]
+        assert [item.id for item in repository.list_for_user(2)] == [3]
+        assert repository.list_for_user(3) == []
+
+        with pytest.raises(ValueError, match="already exists"):
+            repository.add(ClothingItemModel(id=5, name="Item", user_id=2))
+
+    def test_owner_change_moves_item(self):
+        """Test that an item saved with another owner is listed under them."""
+        repository = InMemoryItemRepository()
+        item = repository.add(ClothingItemModel(name="Item", user_id=1))
+
+        item.user_id = 2
+        repository.save(item)
+
+        assert repository.list_for_user(1) == []
+        assert repository.list_for_user(2) == [item]
+        assert repository.get(item.id, 1) is None
+        assert repository.get(item.id, 2) is item
+
+    def test_image_hashes(self):
+        """Test that only items with an image hash are returned."""
+        repository = InMemoryItemRepository()
+        hashed = repository.add(
+            ClothingItemModel(name="Item", user_id=1, image_hash="00ff")
+        )
+        repository.add(ClothingItemModel(name="Item", user_id=1))
+
+        assert repository.image_hashes(1) == [(hashed.id, "00ff")]
+
+
+def test_in_memory_user_ids_are_kept():
+    """Test that users stored with an ID keep it, and IDs stay unique."""
+    repository = InMemoryUserRepository()
+    user = UserModel(id=7, email="a@example.com", full_name="A")
+    assert repository.add(user).id == 7
+    assert repository.get_by_email("a@example.com") is user
+
+    with pytest.raises(ValueError, match="already exists"):
+        repository.add(UserModel(id=7, email="b@example.com", full_name="B"))
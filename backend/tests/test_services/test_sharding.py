@@ -0,0 +1,184 @@
+"""
+Tests for the shard map, sharded registration and login, and moving users
+between shards.
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.config.sharding import ShardMap, UserMovingError
+from backend.models.clothing_item_model import ClothingItemModel
+from backend.models.collection_model import CollectionItemModel, CollectionModel
+from backend.models.outfit_model import OutfitItemModel, OutfitModel
+from backend.models.user import User
+from backend.move_user import move_user
+from backend.schemas.user import UserCreate, UserLogin
+from backend.services.auth_service import AuthService
+from backend.services.item_service import ItemService
+
+
+def _email_on(shards, shard):
+    """Find an email that places a new user on the shard."""
+    index = 0
+    while shards.placement(f"user{index}@example.com") != shard:
+        index += 1
+    return f"user{index}@example.com"
+
+
+def _register(shards, shard):
+    """Register a user on the shard and return their ID."""
+    user = AuthService(Session(), shards=shards).register_user(
+        UserCreate(email=_email_on(shards, shard), password="secret", full_name="U")
+    )
+    return user.id
+
+
+def _count(engine, model, **filters):
+    """Count the rows of a model on one database."""
+    with Session(engine) as session:
+        return session.scalar(
+            select(func.count()).select_from(model).filter_by(**filters)
+        )
+
+
+class TestShardMap:
+    """Tests for ShardMap."""
+
+    def test_add_user(self, shards):
+        """Test that users get distinct IDs and their email's shard."""
+        first = shards.add_user("a@example.com")
+        second = shards.add_user("b@example.com")
+
+        assert first[0] != second[0]
+        assert first[1] == shards.placement("a@example.com")
+        assert shards.find_user("a@example.com").user_id == first[0]
+        assert shards.get_user(second[0]).shard == second[1]
+
+    def test_add_user_email_taken(self, shards):
+        """Test that an email can only be registered once."""
+        shards.add_user("a@example.com")
+        with pytest.raises(ValueError, match="already exists"):
+            shards.add_user("a@example.com")
+
+    def test_route(self, shards):
+        """Test that sessions are bound to the shard of the user."""
+        user_id, shard = shards.add_user("a@example.com")
+        assert shards.route(Session(), user_id).bind is shards.shards[shard]
+
+        shards.set_shard(user_id, 1 - shard)
+        assert shards.route(Session(), user_id).bind is shards.shards[1 - shard]
+
+    def test_route_while_moving(self, shards):
+        """Test that requests of a moving user are turned away."""
+        user_id, shard = shards.add_user("a@example.com")
+        shards.set_shard(user_id, shard, moving=True)
+        with pytest.raises(UserMovingError):
+            shards.route(Session(), user_id)
+
+    def test_route_disabled(self):
+        """Test that sessions are left alone without shards."""
+        session = Session()
+        assert ShardMap(shards=[]).route(session, 1).bind is None
+
+
+class TestShardedAuth:
+    """Tests for registration and login with sharding on."""
+
+    def test_register_on_placed_shard(self, shards):
+        """Test that the user row is created on the user's shard only."""
+        for shard in (0, 1):
+            user_id = _register(shards, shard)
+            assert _count(shards.shards[shard], User, id=user_id) == 1
+            assert _count(shards.shards[1 - shard], User, id=user_id) == 0
+
+    def test_register_email_taken(self, shards):
+        """Test that an email registered on any shard is rejected."""
+        _register(shards, 0)
+        with pytest.raises(ValueError, match="already exists"):
+            _register(shards, 0)
+
+    def test_login_finds_user_on_shard(self, shards):
+        """Test that login looks the email up in the shard map."""
+        user_id = _register(shards, 1)
+        email = _email_on(shards, 1)
+
+        service = AuthService(Session(), shards=shards)
+        user = service.authenticate_user(UserLogin(email=email, password="secret"))
+        assert user.id == user_id
+
+        service = AuthService(Session(), shards=shards)
+        assert service.authenticate_user(UserLogin(email=email, password="x")) is None
+
+        service = AuthService(Session(), shards=shards)
+        missing = UserLogin(email="nobody@example.com", password="secret")
+        assert service.authenticate_user(missing) is None
+
+
+class TestMoveUser:
+    """Tests for moving a user to another shard."""
+
+    def _fill_closet(self, engine, user_id):
+        """Give the user items, an outfit and a collection."""
+        with Session(engine) as session:
+            items = [
+                ClothingItemModel(name=f"Item {i}", category="Tops", user_id=user_id)
+                for i in range(3)
+            ]
+            outfit = OutfitModel(name="Outfit", user_id=user_id)
+            collection = CollectionModel(name="Tops", rules=[], user_id=user_id)
+            session.add_all([*items, outfit, collection])
+            session.flush()
+            session.add(
+                OutfitItemModel(outfit_id=outfit.id, clothing_item_id=items[0].id)
+            )
+            session.add(
+                CollectionItemModel(
+                    collection_id=collection.id, clothing_item_id=items[1].id
+                )
+            )
+            session.commit()
+
+    def test_move_user(self, shards):
+        """Test that every row moves and the user is served from the new shard."""
+        user_id = _register(shards, 0)
+        self._fill_closet(shards.shards[0], user_id)
+
+        copied = move_user(user_id, 1, shards, settle=0)
+
+        assert copied["clothing_items"] == 3
+        assert copied["outfit_items"] == 1
+        assert copied["collection_items"] == 1
+        assert shards.get_user(user_id).shard == 1
+        assert shards.get_user(user_id).moving is False
+        assert _count(shards.shards[0], ClothingItemModel, user_id=user_id) == 0
+        assert _count(shards.shards[0], OutfitItemModel) == 0
+        assert _count(shards.shards[0], User, id=user_id) == 0
+
+        session = shards.route(Session(), user_id)
+        assert len(ItemService(session).get_all_items(user_id)) == 3
+
+    def test_move_user_ids_taken(self, shards):
+        """Test that a move fails cleanly when the new shard uses the IDs."""
+        user_id = _register(shards, 0)
+        other_id = _register(shards, 1)
+        self._fill_closet(shards.shards[0], user_id)
+        self._fill_closet(shards.shards[1], other_id)
+
+        with pytest.raises(ValueError, match="already used"):
+            move_user(user_id, 1, shards, settle=0)
+
+        assert shards.get_user(user_id).shard == 0
+        assert shards.get_user(user_id).moving is False
+        assert _count(shards.shards[0], ClothingItemModel, user_id=user_id) == 3
+        assert _count(shards.shards[1], ClothingItemModel, user_id=user_id) == 0
+
+    def test_move_user_invalid(self, shards):
+        """Test that moves to the current or a missing shard are rejected."""
+        user_id = _register(shards, 0)
+        with pytest.raises(ValueError, match="already on shard"):
+            move_user(user_id, 0, shards, settle=0)
+        with pytest.raises(ValueError, match="does not exist"):
+            move_user(user_id, 2, shards, settle=0)
+        with pytest.raises(ValueError, match="not in the shard map"):
+            move_user(user_id + 100, 1, shards, settle=0)
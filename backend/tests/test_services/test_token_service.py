@@ -0,0 +1,138 @@
+"""
+Tests for access token issuance, verification and the verified-token cache.
+"""
+
+from datetime import timedelta
+
+import pytest
+from jose import jwt
+from pydantic import ValidationError
+
+from backend.config.auth_settings import AuthSettings, auth_settings
+from backend.services import token_service
+from backend.services.token_service import (
+    VerifiedTokenCache,
+    create_access_token,
+    verified_tokens,
+    verify_access_token,
+)
+
+
+class TestAccessTokens:
+    """Tests for issuing and verifying access tokens."""
+
+    def test_round_trip(self):
+        """Test that an issued token verifies to its user."""
+        token = create_access_token(7, "user@example.com")
+
+        token_data = verify_access_token(token)
+
+        assert token_data.user_id == 7
+        assert token_data.email == "user@example.com"
+
+    def test_expired_token(self):
+        """Test that expired tokens are rejected."""
+        token = create_access_token(7, "user@example.com", timedelta(seconds=-1))
+
+        with pytest.raises(ValueError):
+            verify_access_token(token)
+
+    def test_forged_token(self):
+        """Test that tokens signed with another key are rejected."""
+        token = jwt.encode(
+            {"sub": "7", "exp": 9999999999}, "not-the-secret", algorithm="HS256"
+        )
+
+        with pytest.raises(ValueError):
+            verify_access_token(token)
+
+    @pytest.mark.parametrize(
+        "token", ["", "not-a-token", jwt.encode({"email": "x"}, "k", "HS256")]
+    )
+    def test_malformed_token(self, token, monkeypatch):
+        """Test that malformed tokens and tokens without a subject are rejected."""
+        monkeypatch.setattr(auth_settings, "jwt_secret_key", "k")
+
+        with pytest.raises(ValueError):
+            verify_access_token(token)
+
+    def test_verified_token_skips_signature_check(self, monkeypatch):
+        """Test that a token is only decoded once while it is cached."""
+        verified_tokens.clear()
+        token = create_access_token(7, "user@example.com")
+        decode_calls = []
+        decode = token_service.jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            decode_calls.append(args[0])
+            return decode(*args, **kwargs)
+
+        monkeypatch.setattr(token_service.jwt, "decode", counting_decode)
+
+        for _ in range(3):
+            assert verify_access_token(token).user_id == 7
+
+        assert decode_calls == [token]
+
+
+class TestVerifiedTokenCache:
+    """Tests for the LRU cache of verified tokens."""
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache keeps the most recently used tokens."""
+        cache = VerifiedTokenCache(max_size=2)
+        data = token_service.TokenData(user_id=1)
+        cache.put("a", data, expires_at=100)
+        cache.put("b", data, expires_at=100)
+        assert cache.get("a", now=0) is data
+
+        cache.put("c", data, expires_at=100)
+
+        assert cache.get("b", now=0) is None
+        assert cache.get("a", now=0) is data
+        assert cache.get("c", now=0) is data
+
+    def test_expired_entries_are_dropped(self):
+        """Test that cached tokens are not used past their expiry."""
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("a", token_service.TokenData(user_id=1), expires_at=100)
+
+        assert cache.get("a", now=100) is None
+        assert len(cache) == 0
+
+    def test_disabled_cache(self):
+        """Test that a cache of size zero stores nothing."""
+        cache = VerifiedTokenCache(max_size=0)
+        cache.put("a", token_service.TokenData(user_id=1), expires_at=100)
+
+        assert len(cache) == 0
+
+
+class TestSigningSecret:
+    """Tests for loading the token signing secret."""
+
+    @pytest.fixture(autouse=True)
+    def no_secret(self, monkeypatch):
+        monkeypatch.delenv("JWT_SECRET_KEY", raising=False)
+        monkeypatch.delenv("SECRET_KEY", raising=False)
+
+    def test_secret_is_required(self):
+        """Test that settings cannot load without a signing secret."""
+        with pytest.raises(ValidationError):
+            AuthSettings(_env_file=None)
+
+    @pytest.mark.parametrize(
+        "secret", ["", "   ", "change-me-in-production", "your-secret-key-here"]
+    )
+    def test_placeholder_secret_is_rejected(self, secret, monkeypatch):
+        """Test that an empty or sample secret is refused."""
+        monkeypatch.setenv("JWT_SECRET_KEY", secret)
+
+        with pytest.raises(ValidationError):
+            AuthSettings(_env_file=None)
+
+    def test_secret_key_variable_is_read(self, monkeypatch):
+        """Test that the SECRET_KEY variable from .env is used as well."""
+        monkeypatch.setenv("SECRET_KEY", "from-secret-key")
+
+        assert AuthSettings(_env_file=None).jwt_secret_key == "from-secret-key"
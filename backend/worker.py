@@ -0,0 +1,277 @@
+"""
+Background job worker for the Closet Management Application.
+Any number of workers can run on any number of nodes against the same
+PostgreSQL database:
+
+    python -m backend.worker --pool process --concurrency 4
+
+With sharding on, jobs are queued on the shard of their user, so every shard
+needs workers of its own:
+
+    python -m backend.worker --shard 2
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Dict, Optional
+
+from backend.config.database import SessionLocal, dispose_engine
+from backend.config.job_settings import job_settings
+from backend.config.sharding import ShardSessions, shard_map
+from backend.schemas.job import Job
+from backend.services.job_service import JobService, run_job_handler
+
+logger = logging.getLogger(__name__)
+
+# Modules that register job handlers when imported
+HANDLER_MODULES = [
+    "backend.services.color_service",
+    "backend.services.upload_service",
+]
+
+
+def load_job_handlers() -> None:
+    """Import every module that registers job handlers."""
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+def _init_pool_process() -> None:
+    """
+    Prepare a pool process. Connections inherited from the parent are dropped
+    without closing them, and the handlers are registered in case the process
+    was spawned rather than forked.
+    """
+    dispose_engine(close=False)
+    shard_map.dispose(close=False)
+    load_job_handlers()
+
+
+class Worker:
+    """Claims due jobs from the queue and runs them in a thread or process pool."""
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        pool: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        worker_id: Optional[str] = None,
+        shard: Optional[int] = None,
+    ):
+        """
+        Initialize the Worker.
+
+        Args:
+            session_factory: Factory for database sessions
+            pool: "thread" or "process", defaults to settings
+            concurrency: Number of jobs run at the same time, defaults to settings
+            poll_interval: Seconds to wait when idle, defaults to settings
+            worker_id: Unique name of the worker, defaults to host, PID and a suffix
+            shard: Shard whose jobs to run, instead of the session factory's
+        """
+        self.shard = shard
+        self.session_factory = (
+            ShardSessions(shard) if shard is not None else session_factory
+        )
+        self.pool = pool or job_settings.worker_pool
+        self.concurrency = concurrency or job_settings.worker_concurrency
+        self.poll_interval = (
+            poll_interval if poll_interval is not None else job_settings.poll_interval
+        )
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.running: Dict[Future, Job] = {}
+        self._renewed_at = time.monotonic()
+        self._stop_event = threading.Event()
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> Executor:
+        """Create the pool that runs job handlers."""
+        if self.pool == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.concurrency, initializer=_init_pool_process
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="job"
+        )
+
+    def _submit(self, job: Job) -> Future:
+        """Start a claimed job on the pool."""
+        if self.pool == "process" and self.shard is None:
+            # Child processes use the application's own session factory;
+            # the factory of a shard is small enough to send along instead
+            return self._executor.submit(run_job_handler, job.kind, job.payload)
+        return self._executor.submit(
+            run_job_handler, job.kind, job.payload, self.session_factory
+        )
+
+    def collect(self, timeout: Optional[float] = 0) -> int:
+        """
+        Record the outcome of finished jobs.
+
+        Args:
+            timeout: Seconds to wait for a running job to finish, None to wait
+                until one does
+
+        Returns:
+            Number of jobs recorded
+        """
+        if not self.running:
+            return 0
+
+        done, _ = wait(self.running, timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            return 0
+
+        with self.session_factory() as db_session:
+            service = JobService(db_session)
+            for future in done:
+                job = self.running.pop(future)
+                error = future.exception()
+                if error is None:
+                    recorded = service.complete_job(
+                        job.id, self.worker_id, future.result()
+                    )
+                else:
+                    logger.warning(
+                        "Job %s (%s) failed on attempt %s: %r",
+                        job.id,
+                        job.kind,
+                        job.attempts,
+                        error,
+                    )
+                    recorded = service.fail_job(job.id, self.worker_id, error)
+
+                if not recorded:
+                    logger.warning("Lease on job %s expired before it finished", job.id)
+
+        return len(done)
+
+    def renew_leases(self, force: bool = False) -> int:
+        """
+        Extend the leases of the running jobs, every third of the lease time,
+        so that jobs running longer than a lease are not claimed again.
+
+        Args:
+            force: Renew even if the last renewal was recent
+
+        Returns:
+            Number of leases renewed
+        """
+        interval = job_settings.lease_seconds / 3
+        if not self.running or (
+            not force and time.monotonic() - self._renewed_at < interval
+        ):
+            return 0
+
+        self._renewed_at = time.monotonic()
+        job_ids = [job.id for job in self.running.values()]
+        with self.session_factory() as db_session:
+            renewed = JobService(db_session).renew_leases(self.worker_id, job_ids)
+        if renewed < len(job_ids):
+            logger.warning(
+                "Worker %s lost the lease on %s of its running jobs",
+                self.worker_id,
+                len(job_ids) - renewed,
+            )
+        return renewed
+
+    def run_once(self) -> int:
+        """
+        Record finished jobs and renew the leases of running ones, then claim
+        and start jobs for the free slots.
+
+        Returns:
+            Number of jobs started
+        """
+        self.collect()
+        self.renew_leases()
+        free_slots = self.concurrency - len(self.running)
+        if free_slots <= 0 or self._stop_event.is_set():
+            return 0
+
+        with self.session_factory() as db_session:
+            jobs = JobService(db_session).claim_jobs(self.worker_id, free_slots)
+
+        for job in jobs:
+            self.running[self._submit(job)] = job
+        return len(jobs)
+
+    def run(self) -> None:
+        """Process jobs until stop() is called, then finish the running jobs."""
+        logger.info(
+            "Worker %s started with a %s pool of %s",
+            self.worker_id,
+            self.pool,
+            self.concurrency,
+        )
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    if self.run_once():
+                        continue
+                    # Full or waiting on jobs: wake up as soon as one finishes
+                    if self.running:
+                        self.collect(self.poll_interval)
+                        continue
+                except Exception:
+                    logger.exception(
+                        "Worker %s could not reach the job queue", self.worker_id
+                    )
+                self._stop_event.wait(self.poll_interval)
+
+            while self.running:
+                self.collect(self.poll_interval)
+                try:
+                    self.renew_leases()
+                except Exception:
+                    logger.exception(
+                        "Worker %s could not renew its leases", self.worker_id
+                    )
+        finally:
+            self._executor.shutdown(wait=True)
+            logger.info("Worker %s stopped", self.worker_id)
+
+    def stop(self) -> None:
+        """Stop claiming jobs; run() returns once the running jobs finish."""
+        self._stop_event.set()
+
+
+def main():
+    """Run a worker until it receives SIGINT or SIGTERM."""
+    parser = argparse.ArgumentParser(description="Run a background job worker.")
+    parser.add_argument("--pool", choices=["thread", "process"], default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--shard", type=int, default=None, help="shard to serve")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    load_job_handlers()
+
+    worker = Worker(pool=args.pool, concurrency=args.concurrency, shard=args.shard)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: worker.stop())
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+
+# Settings are read when backend modules are imported, so the signing secret
+# has to exist before the test modules under backend/tests are collected.
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key")